@@ -0,0 +1 @@
+default_app_config = "experimenter.base.apps.BaseConfig"
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class BaseConfig(AppConfig):
+    name = "experimenter.base"
+
+    def ready(self):
+        import experimenter.base.signals  # noqa
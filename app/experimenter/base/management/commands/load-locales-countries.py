@@ -3,6 +3,7 @@ from django_countries import countries
 from product_details import product_details
 
 from experimenter.base.models import Country, Locale
+from experimenter.base.snapshots import country_snapshot, locale_snapshot
 
 
 class Command(BaseCommand):
@@ -30,6 +31,9 @@ class Command(BaseCommand):
         if new:
             Locale.objects.bulk_create(new)
 
+        # bulk_create and update skip the signals that would do this
+        locale_snapshot.invalidate()
+
     @staticmethod
     def ensure_all_countries():
         new = []
@@ -44,3 +48,5 @@ class Command(BaseCommand):
                 Country.objects.filter(code=code).update(name=name)
         if new:
             Country.objects.bulk_create(new)
+
+        country_snapshot.invalidate()
@@ -0,0 +1,16 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from experimenter.experiments.models import Experiment
+
+
+logger = logging.getLogger()
+
+
+class Command(BaseCommand):
+    help = "Recompute experiment start and end dates from their change logs"
+
+    def handle(self, *args, **options):
+        updated = Experiment.objects.update_actual_dates()
+        logger.info("Updated dates for {} experiments".format(updated))
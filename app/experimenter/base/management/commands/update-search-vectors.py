@@ -0,0 +1,18 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from experimenter.experiments.models import Experiment
+
+
+logger = logging.getLogger()
+
+
+class Command(BaseCommand):
+    help = "Recompute the full text search vector for every experiment"
+
+    def handle(self, *args, **options):
+        updated = Experiment.objects.update_search_vectors()
+        logger.info(
+            "Updated search vectors for {} experiments".format(updated)
+        )
@@ -0,0 +1,27 @@
+# Generated by Django 2.1.11 on 2026-10-16 21:02
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("base", "0001_initial")]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="country",
+            options={
+                "ordering": ("name", "code"),
+                "verbose_name": "Country",
+                "verbose_name_plural": "Countries",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="locale",
+            options={
+                "ordering": ("name", "code"),
+                "verbose_name": "Locale",
+                "verbose_name_plural": "Locales",
+            },
+        ),
+    ]
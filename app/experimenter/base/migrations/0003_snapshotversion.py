@@ -0,0 +1,40 @@
+# Generated by Django 2.1.11 on 2026-10-17 10:15
+
+from django.db import migrations, models
+
+
+def create_snapshot_versions(apps, schema_editor):
+    SnapshotVersion = apps.get_model("base", "SnapshotVersion")
+    for name in ("base.locale", "base.country"):
+        SnapshotVersion.objects.get_or_create(name=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("base", "0002_locale_country_ordering")]
+
+    operations = [
+        migrations.CreateModel(
+            name="SnapshotVersion",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=255, unique=True)),
+                ("version", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Snapshot Version",
+                "verbose_name_plural": "Snapshot Versions",
+            },
+        ),
+        migrations.RunPython(
+            create_snapshot_versions, migrations.RunPython.noop
+        ),
+    ]
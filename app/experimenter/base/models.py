@@ -6,7 +6,7 @@ class Locale(models.Model):
     name = models.CharField(max_length=255)
 
     class Meta:
-        ordering = ("name",)
+        ordering = ("name", "code")
         verbose_name = "Locale"
         verbose_name_plural = "Locales"
 
@@ -22,7 +22,7 @@ class Country(models.Model):
     name = models.CharField(max_length=255)
 
     class Meta:
-        ordering = ("name",)
+        ordering = ("name", "code")
         verbose_name = "Country"
         verbose_name_plural = "Countries"
 
@@ -31,3 +31,20 @@ class Country(models.Model):
 
     def __str__(self):
         return f"{self.name} ({self.code})"
+
+
+class SnapshotVersion(models.Model):
+    """
+    The version of a table cached by base.snapshots.ModelSnapshot, kept
+    in the database so every process sees a change once it commits.
+    """
+
+    name = models.CharField(max_length=255, unique=True)
+    version = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Snapshot Version"
+        verbose_name_plural = "Snapshot Versions"
+
+    def __str__(self):  # pragma: no cover
+        return f"{self.name} {self.version}"
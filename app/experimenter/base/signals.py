@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from experimenter.base.models import Country, Locale
+from experimenter.base.snapshots import country_snapshot, locale_snapshot
+
+
+@receiver(post_save, sender=Locale)
+@receiver(post_delete, sender=Locale)
+def invalidate_locale_snapshot(sender, instance, **kwargs):
+    locale_snapshot.invalidate()
+
+
+@receiver(post_save, sender=Country)
+@receiver(post_delete, sender=Country)
+def invalidate_country_snapshot(sender, instance, **kwargs):
+    country_snapshot.invalidate()
@@ -0,0 +1,103 @@
+import time
+from collections import namedtuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from experimenter.base.models import Country, Locale, SnapshotVersion
+
+
+SnapshotState = namedtuple(
+    "SnapshotState", ("version", "objects", "version_checked_at")
+)
+
+
+class ModelSnapshot(object):
+    """
+    An in-process copy of a small table that rarely changes, like the
+    locales and countries written by load-locales-countries, so forms
+    and serializers can use it without loading the table.
+
+    The table's SnapshotVersion row is read at most once every
+    SNAPSHOT_VERSION_TTL seconds, and the copy is reloaded when another
+    process has changed the table.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.name = model._meta.label_lower
+        self.state = None
+
+    def get_version(self):
+        versions = list(
+            SnapshotVersion.objects.filter(name=self.name).values_list(
+                "version", flat=True
+            )
+        )
+        return versions[0] if versions else 0
+
+    def get_state(self):
+        state = self.state
+        now = time.monotonic()
+        if (
+            state is not None
+            and now - state.version_checked_at < settings.SNAPSHOT_VERSION_TTL
+        ):
+            return state
+
+        version = self.get_version()
+        if state is not None and state.version == version:
+            self.state = state._replace(version_checked_at=now)
+            return self.state
+
+        state = SnapshotState(
+            version=version,
+            objects=tuple(self.model.objects.all()),
+            version_checked_at=now,
+        )
+
+        # Only kept once committed, rows read in a transaction that is
+        # rolled back must not be served later.
+        transaction.on_commit(lambda: setattr(self, "state", state))
+
+        return state
+
+    def invalidate(self):
+        # Written in the caller's transaction, so other processes only
+        # reload once the change is committed
+        updated = SnapshotVersion.objects.filter(name=self.name).update(
+            version=F("version") + 1
+        )
+        if not updated:
+            SnapshotVersion.objects.get_or_create(
+                name=self.name, defaults={"version": 1}
+            )
+
+        # This process reloads without waiting for the next version check
+        transaction.on_commit(self.clear)
+
+    def clear(self):
+        self.state = None
+
+    def all(self):
+        return self.get_state().objects
+
+    def filter_codes(self, codes):
+        codes = set(codes)
+        objects = [obj for obj in self.all() if obj.code in codes]
+        if len(objects) < len(codes):
+            # Possibly added since the snapshot was taken
+            return list(self.model.objects.filter(code__in=codes))
+        return objects
+
+    def filter_pks(self, pks):
+        pks = set(pks)
+        objects = [obj for obj in self.all() if obj.pk in pks]
+        if len(objects) < len(pks):
+            return list(self.model.objects.filter(pk__in=pks))
+        return objects
+
+
+locale_snapshot = ModelSnapshot(Locale)
+country_snapshot = ModelSnapshot(Country)
@@ -52,3 +52,31 @@ class TestInitialData(TestCase):
             ).count(),
             20,
         )
+
+    def test_update_experiment_dates(self):
+        call_command(
+            "load-dummy-experiments",
+            num_of_experiments=2,
+            status=ExperimentConstants.STATUS_LIVE,
+        )
+        Experiment.objects.update(actual_start_date=None)
+
+        call_command("update-experiment-dates")
+
+        for experiment in Experiment.objects.all():
+            self.assertEqual(
+                experiment.actual_start_date,
+                experiment.changes.get(
+                    new_status=ExperimentConstants.STATUS_LIVE
+                ).changed_on.date(),
+            )
+
+    def test_update_search_vectors(self):
+        call_command("load-dummy-experiments", num_of_experiments=2)
+        Experiment.objects.update(search_vector=None)
+
+        call_command("update-search-vectors")
+
+        self.assertFalse(
+            Experiment.objects.filter(search_vector__isnull=True).exists()
+        )
@@ -0,0 +1,110 @@
+import mock
+from django.core.management import call_command
+from django.db.models import F
+from django.test import TestCase, override_settings
+
+from experimenter.base.models import Country, Locale, SnapshotVersion
+from experimenter.base.snapshots import country_snapshot, locale_snapshot
+from experimenter.base.tests.factories import CountryFactory, LocaleFactory
+
+
+class TestModelSnapshot(TestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        # Run on commit callbacks immediately, the test transaction is
+        # never committed
+        mock_on_commit_patcher = mock.patch(
+            "experimenter.base.snapshots.transaction.on_commit",
+            side_effect=lambda func: func(),
+        )
+        mock_on_commit_patcher.start()
+        self.addCleanup(mock_on_commit_patcher.stop)
+
+        locale_snapshot.clear()
+        country_snapshot.clear()
+        self.addCleanup(locale_snapshot.clear)
+        self.addCleanup(country_snapshot.clear)
+
+    def test_snapshot_is_served_without_queries_until_the_ttl(self):
+        locale = LocaleFactory.create()
+
+        self.assertEqual(locale_snapshot.all(), (locale,))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(locale_snapshot.all(), (locale,))
+            self.assertEqual(locale_snapshot.filter_codes(["en-US"]), [locale])
+            self.assertEqual(locale_snapshot.filter_pks([locale.pk]), [locale])
+
+    @override_settings(SNAPSHOT_VERSION_TTL=0)
+    def test_snapshot_is_served_after_a_version_lookup_once_expired(self):
+        locale = LocaleFactory.create()
+
+        self.assertEqual(locale_snapshot.all(), (locale,))
+
+        with self.assertNumQueries(1) as queries:
+            self.assertEqual(locale_snapshot.all(), (locale,))
+
+        self.assertIn("base_snapshotversion", queries[0]["sql"])
+
+    def test_saving_a_row_reloads_the_snapshot(self):
+        LocaleFactory.create()
+        locale_snapshot.all()
+
+        Locale.objects.create(code="de", name="German")
+
+        self.assertEqual(
+            [locale.code for locale in locale_snapshot.all()], ["en-US", "de"]
+        )
+
+    def test_deleting_a_row_reloads_the_snapshot(self):
+        country = CountryFactory.create()
+        self.assertEqual(country_snapshot.all(), (country,))
+
+        country.delete()
+
+        self.assertEqual(country_snapshot.all(), ())
+
+    @override_settings(SNAPSHOT_VERSION_TTL=0)
+    def test_snapshot_from_another_version_is_reloaded(self):
+        LocaleFactory.create()
+        locale_snapshot.all()
+
+        # Changed by another process, which only bumps the version
+        Locale.objects.update(name="English")
+        SnapshotVersion.objects.filter(name="base.locale").update(
+            version=F("version") + 1
+        )
+
+        self.assertEqual(locale_snapshot.all()[0].name, "English")
+
+    def test_invalidate_creates_a_missing_version(self):
+        SnapshotVersion.objects.filter(name="base.country").delete()
+        self.assertEqual(country_snapshot.get_version(), 0)
+
+        country_snapshot.invalidate()
+        country_snapshot.invalidate()
+
+        self.assertEqual(country_snapshot.get_version(), 2)
+
+    def test_missing_rows_are_queried(self):
+        LocaleFactory.create()
+        locale_snapshot.all()
+
+        # Written without signals or a version change
+        Locale.objects.bulk_create([Locale(code="de", name="German")])
+
+        self.assertEqual(
+            [locale.code for locale in locale_snapshot.filter_codes(["de"])],
+            ["de"],
+        )
+
+    def test_load_locales_countries_reloads_the_snapshots(self):
+        self.assertEqual(locale_snapshot.all(), ())
+        self.assertEqual(country_snapshot.all(), ())
+
+        call_command("load-locales-countries")
+
+        self.assertEqual(len(locale_snapshot.all()), Locale.objects.count())
+        self.assertEqual(len(country_snapshot.all()), Country.objects.count())
@@ -57,6 +57,8 @@ class ExperimentAdmin(admin.ModelAdmin):
                     "proposed_start_date",
                     "proposed_enrollment",
                     "proposed_duration",
+                    "actual_start_date",
+                    "actual_end_date",
                     "bugzilla_id",
                     "normandy_slug",
                     "normandy_id",
@@ -131,6 +133,7 @@ class ExperimentAdmin(admin.ModelAdmin):
     )
 
     prepopulated_fields = {"slug": ("name",)}
+    readonly_fields = ("actual_start_date", "actual_end_date")
 
     def get_actions(self, request):
         return []
@@ -6,10 +6,22 @@ from experimenter.experiments.api_views import (
     ExperimentRecipeView,
     ExperimentSendIntentToShipEmailView,
     ExperimentCloneView,
+    ExperimentBulkCloneView,
+    ExperimentOwnerListView,
 )
 
 
 urlpatterns = [
+    url(
+        r"^owners/$",
+        ExperimentOwnerListView.as_view(),
+        name="experiments-api-owners",
+    ),
+    url(
+        r"^bulk-clone/$",
+        ExperimentBulkCloneView.as_view(),
+        name="experiments-api-bulk-clone",
+    ),
     url(
         r"^(?P<slug>[\w-]+)/intent-to-ship-email$",
         ExperimentSendIntentToShipEmailView.as_view(),
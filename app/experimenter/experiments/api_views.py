@@ -1,20 +1,205 @@
-from rest_framework.generics import ListAPIView, UpdateAPIView, RetrieveAPIView
+import datetime
+import hashlib
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef
+from django.http import (
+    HttpResponse,
+    HttpResponseNotModified,
+    StreamingHttpResponse,
+)
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.http import parse_etags
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import (
+    GenericAPIView,
+    ListAPIView,
+    UpdateAPIView,
+    RetrieveAPIView,
+    get_object_or_404,
+)
+from rest_framework.pagination import CursorPagination
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework import status
 
-from experimenter.experiments.models import Experiment
-from experimenter.experiments import email
+from experimenter.experiments.models import Experiment, ExperimentChangeLog
+from experimenter.experiments import tasks
 from experimenter.experiments.serializers import (
     ExperimentSerializer,
     ExperimentRecipeSerializer,
     ExperimentCloneSerializer,
+    ExperimentBulkCloneSerializer,
+    OwnerSerializer,
 )
 
 
+class ExperimentCursorPagination(CursorPagination):
+    ordering = "id"
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # Pagination is opt in so existing consumers keep receiving a
+        # plain list of every experiment
+        if (
+            self.cursor_query_param not in request.query_params
+            and self.page_size_query_param not in request.query_params
+        ):
+            return None
+
+        return super().paginate_queryset(queryset, request, view=view)
+
+
 class ExperimentListView(ListAPIView):
     filter_fields = ("status",)
-    queryset = Experiment.objects.all()
     serializer_class = ExperimentSerializer
+    pagination_class = ExperimentCursorPagination
+    prefetch_fields = ("variants", "locales", "countries", "changes")
+
+    def get_requested_fields(self):
+        fields = self.request.query_params.get("fields")
+        if fields:
+            return [field.strip() for field in fields.split(",")]
+
+    def get_queryset(self):
+        fields = self.get_requested_fields()
+        return Experiment.objects.prefetch_related(
+            *[
+                field
+                for field in self.prefetch_fields
+                if fields is None or field in fields
+            ]
+        )
+
+    def get_changed_since(self):
+        changed_since = self.request.query_params.get("changed_since")
+        if changed_since is None:
+            return None
+
+        try:
+            parsed = parse_datetime(changed_since)
+        except ValueError:
+            # Well formatted but not a real date, like February 30th
+            parsed = None
+
+        if parsed is None:
+            raise ValidationError(
+                {"changed_since": "Enter a valid ISO 8601 timestamp."}
+            )
+
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed, timezone.utc)
+
+        return parsed
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        changed_since = self.get_changed_since()
+        if changed_since is not None:
+            # A change is stamped before its transaction commits, so one
+            # committed after the previous poll can be older than its
+            # watermark. Polls overlap to return it, delivery is at least
+            # once and clients dedupe experiments by slug.
+            overlap_start = changed_since - datetime.timedelta(
+                seconds=settings.EXPERIMENTS_CHANGED_SINCE_OVERLAP
+            )
+
+            # Matches latest_change >= overlap_start, but lets the
+            # changed_on index find the changed experiments without
+            # aggregating the whole change log
+            queryset = queryset.filter(
+                id__in=ExperimentChangeLog.objects.filter(
+                    changed_on__gte=overlap_start
+                ).values("experiment_id")
+            )
+
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs["fields"] = self.get_requested_fields()
+        return super().get_serializer(*args, **kwargs)
+
+    # ?stream=json streams a JSON array, ?stream=ndjson one experiment
+    # per line
+    stream_content_types = {
+        "json": "application/json",
+        "ndjson": "application/x-ndjson",
+    }
+    stream_batch_size = 100
+
+    def list(self, request, *args, **kwargs):
+        stream_format = request.query_params.get("stream")
+        if stream_format in self.stream_content_types:
+            return StreamingHttpResponse(
+                self.stream_experiments(stream_format),
+                content_type=self.stream_content_types[stream_format],
+            )
+
+        changed_since = self.get_changed_since()
+        if changed_since is not None:
+            return self.list_changed_since(changed_since)
+
+        return super().list(request, *args, **kwargs)
+
+    def list_changed_since(self, changed_since):
+        experiments = list(
+            self.filter_queryset(self.get_queryset()).annotate(
+                latest_change=Experiment.latest_change_expression()
+            )
+        )
+
+        # Clients pass the watermark back as changed_since on their next
+        # poll, it never moves back for experiments in the overlap
+        watermark = max(
+            [changed_since]
+            + [experiment.latest_change for experiment in experiments]
+        )
+
+        return Response(
+            {
+                "watermark": watermark,
+                "results": self.get_serializer(experiments, many=True).data,
+            }
+        )
+
+    def iter_experiments(self, queryset):
+        # Walk the ids with a server side cursor and load the experiments
+        # and their prefetched relations one batch at a time
+        experiment_ids = (
+            queryset.order_by("id")
+            .values_list("id", flat=True)
+            .iterator(chunk_size=self.stream_batch_size)
+        )
+
+        batch = list(islice(experiment_ids, self.stream_batch_size))
+        while batch:
+            yield from queryset.filter(id__in=batch).order_by("id")
+            batch = list(islice(experiment_ids, self.stream_batch_size))
+
+    def stream_experiments(self, stream_format):
+        renderer = JSONRenderer()
+        experiments = self.iter_experiments(
+            self.filter_queryset(self.get_queryset())
+        )
+
+        if stream_format == "ndjson":
+            for experiment in experiments:
+                yield renderer.render(self.get_serializer(experiment).data)
+                yield b"\n"
+        else:
+            yield b"["
+            for i, experiment in enumerate(experiments):
+                if i:
+                    yield b","
+                yield renderer.render(self.get_serializer(experiment).data)
+            yield b"]"
 
 
 class ExperimentDetailView(RetrieveAPIView):
@@ -25,9 +210,47 @@ class ExperimentDetailView(RetrieveAPIView):
 
 class ExperimentRecipeView(RetrieveAPIView):
     lookup_field = "slug"
-    queryset = Experiment.objects.all()
+    queryset = Experiment.objects.prefetch_related(
+        "variants", "locales", "countries"
+    )
     serializer_class = ExperimentRecipeSerializer
 
+    def retrieve(self, request, *args, **kwargs):
+        # A single indexed lookup, the recipe_version in the key changes
+        # whenever the recipe does
+        pk, recipe_version = get_object_or_404(
+            Experiment.objects.values_list("pk", "recipe_version"),
+            **{self.lookup_field: kwargs[self.lookup_field]},
+        )
+        cache_key = Experiment.recipe_cache_key(pk, recipe_version)
+        cached_recipe = cache.get(cache_key)
+
+        if cached_recipe is None:
+            serializer = self.get_serializer(self.get_object())
+            content = JSONRenderer().render(serializer.data)
+            etag = '"{digest}"'.format(
+                digest=hashlib.sha1(content).hexdigest()
+            )
+            cached_recipe = (content, etag)
+            cache.set(cache_key, cached_recipe, settings.RECIPE_CACHE_TIMEOUT)
+
+        content, etag = cached_recipe
+
+        if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+        if if_none_match:
+            etags = [
+                tag[2:] if tag.startswith("W/") else tag
+                for tag in parse_etags(if_none_match)
+            ]
+            if etag in etags or "*" in etags:
+                response = HttpResponseNotModified()
+                response["ETag"] = etag
+                return response
+
+        response = HttpResponse(content, content_type="application/json")
+        response["ETag"] = etag
+        return response
+
 
 class ExperimentSendIntentToShipEmailView(UpdateAPIView):
     lookup_field = "slug"
@@ -42,15 +265,59 @@ class ExperimentSendIntentToShipEmailView(UpdateAPIView):
                 status=status.HTTP_409_CONFLICT,
             )
 
-        email.send_intent_to_ship_email(experiment.id)
-
-        experiment.review_intent_to_ship = True
-        experiment.save()
+        # Rendered and sent by a worker so the request doesn't wait on
+        # the mail server, the worker marks the review when it sends it
+        tasks.send_intent_to_ship_email_task.delay(experiment.id)
 
-        return Response()
+        return Response(
+            {"status": "email-queued"}, status=status.HTTP_202_ACCEPTED
+        )
 
 
 class ExperimentCloneView(UpdateAPIView):
     lookup_field = "slug"
     queryset = Experiment.objects.all()
     serializer_class = ExperimentCloneSerializer
+
+
+class ExperimentBulkCloneView(GenericAPIView):
+    serializer_class = ExperimentBulkCloneSerializer
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        clones = serializer.save()
+
+        return Response(
+            ExperimentCloneSerializer(clones, many=True).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class ExperimentOwnerListView(ListAPIView):
+    """
+    Users whose email starts with the search term, for the owner
+    autocomplete. Only users who own an experiment are searched unless
+    owned=false is passed.
+    """
+
+    serializer_class = OwnerSerializer
+
+    def get_queryset(self):
+        queryset = get_user_model().objects.all()
+
+        if self.request.query_params.get("owned") != "false":
+            queryset = queryset.annotate(
+                owns_experiments=Exists(
+                    Experiment.objects.filter(owner=OuterRef("pk"))
+                )
+            ).filter(owns_experiments=True)
+
+        search = self.request.query_params.get("search")
+        if search:
+            # Served by the UPPER(email) pattern index
+            queryset = queryset.filter(email__istartswith=search)
+
+        return queryset.order_by("email")[
+            : settings.EXPERIMENTS_OWNER_AUTOCOMPLETE_LIMIT
+        ]
@@ -9,3 +9,5 @@ class ExperimentsConfig(AppConfig):
 
     def ready(self):
         markus.configure(settings.MARKUS_BACKEND)
+
+        import experimenter.experiments.signals  # noqa
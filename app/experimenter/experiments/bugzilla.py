@@ -4,9 +4,13 @@ from urllib.parse import urlparse, parse_qs
 
 from django.conf import settings
 
+from experimenter.experiments.clients import PooledHTTPClient
+
 INVALID_USER_ERROR_CODE = 51
 INVALID_PARAMETER_ERROR_CODE = 53
 
+client = PooledHTTPClient("bugzilla")
+
 
 class BugzillaError(Exception):
     pass
@@ -16,18 +20,20 @@ def format_bug_body(experiment):
     bug_body = ""
     countries = "all"
     locales = "all"
-    if experiment.countries.count():
+    experiment_countries = experiment.get_countries()
+    if experiment_countries:
         countries = "".join(
             [
                 "{name} ({code}) ".format(name=country.name, code=country.code)
-                for country in list(experiment.countries.all())
+                for country in experiment_countries
             ]
         )
-    if experiment.locales.count():
+    experiment_locales = experiment.get_locales()
+    if experiment_locales:
         locales = "".join(
             [
                 "{name} ({code}) ".format(name=locale.name, code=locale.code)
-                for locale in list(experiment.locales.all())
+                for locale in experiment_locales
             ]
         )
 
@@ -78,7 +84,7 @@ def update_experiment_bug(experiment):
     body = format_update_body(experiment)
     make_bugzilla_call(
         settings.BUGZILLA_UPDATE_URL.format(id=experiment.bugzilla_id),
-        requests.put,
+        client.put,
         data=body,
     )
 
@@ -86,7 +92,7 @@ def update_experiment_bug(experiment):
 def user_exists(user):
     try:
         response = make_bugzilla_call(
-            settings.BUGZILLA_USER_URL.format(email=user), requests.get
+            settings.BUGZILLA_USER_URL.format(email=user), client.get
         )
         users = response["users"]
         return len(users) == 1
@@ -106,7 +112,7 @@ def format_resolution_body(experiment):
 def bug_exists(bug_id):
     try:
         response = make_bugzilla_call(
-            settings.BUGZILLA_BUG_URL.format(bug_id=bug_id), requests.get
+            settings.BUGZILLA_BUG_URL.format(bug_id=bug_id), client.get
         )
         bugs = response["bugs"]
         return len(bugs) == 1
@@ -120,7 +126,7 @@ def update_bug_resolution(experiment):
         status_body = format_resolution_body(experiment)
         make_bugzilla_call(
             settings.BUGZILLA_UPDATE_URL.format(id=experiment.bugzilla_id),
-            requests.put,
+            client.put,
             status_body,
         )
 
@@ -172,7 +178,7 @@ def create_experiment_bug(experiment):
 
     bug_data = format_creation_bug_body(experiment, extra_fields)
     response_data = make_bugzilla_call(
-        settings.BUGZILLA_CREATE_URL, requests.post, data=bug_data
+        settings.BUGZILLA_CREATE_URL, client.post, data=bug_data
     )
 
     if "id" not in response_data:
@@ -197,7 +203,7 @@ def add_experiment_comment(experiment, comment):
     comment_data = {"comment": comment}
     response_data = make_bugzilla_call(
         settings.BUGZILLA_COMMENT_URL.format(id=experiment.bugzilla_id),
-        requests.post,
+        client.post,
         comment_data,
     )
 
@@ -0,0 +1,78 @@
+import time
+
+import markus
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+metrics = markus.get_metrics("experiments.clients")
+
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+
+class PooledHTTPClient(object):
+    """A keep-alive HTTP client shared by every call to an external API.
+
+    The underlying session keeps a connection pool per host, so repeated
+    calls to the same host reuse an open connection instead of paying a
+    fresh TCP and TLS handshake.  Idempotent requests are retried with
+    backoff on connection errors and 5xx responses.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        # Built up front, the session is shared by the threads that
+        # fetch recipes concurrently
+        self.session = self._build_session()
+
+    def _build_session(self):
+        retry = Retry(
+            total=settings.HTTP_MAX_RETRIES,
+            backoff_factor=settings.HTTP_RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUS_CODES,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=settings.HTTP_POOL_SIZE,
+            pool_maxsize=settings.HTTP_POOL_SIZE,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault(
+            "timeout",
+            (settings.HTTP_CONNECT_TIMEOUT, settings.HTTP_READ_TIMEOUT),
+        )
+
+        started = time.monotonic()
+
+        response = self.session.request(method, url, **kwargs)
+
+        metrics.histogram(
+            "{name}.latency".format(name=self.name),
+            (time.monotonic() - started) * 1000.0,
+        )
+
+        retries = getattr(response.raw, "retries", None)
+        if retries is not None and retries.history:
+            metrics.incr(
+                "{name}.retries".format(name=self.name),
+                value=len(retries.history),
+            )
+
+        return response
+
+    def get(self, url, params=None, **kwargs):
+        return self.request("GET", url, params=params, **kwargs)
+
+    def put(self, url, data=None, **kwargs):
+        return self.request("PUT", url, data=data, **kwargs)
+
+    def post(self, url, data=None, **kwargs):
+        return self.request("POST", url, data=data, **kwargs)
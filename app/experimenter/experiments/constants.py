@@ -5,6 +5,8 @@ import re
 class ExperimentConstants(object):
     # Model Constants
     MAX_DURATION = 1000
+    # Days before an end date that the ending and pause emails are sent
+    ENDING_SOON_DAYS = 5
 
     # Type stuff
     TYPE_PREF = "pref"
@@ -1,4 +1,5 @@
 from django.conf import settings
+from django.core.mail import get_connection
 from django.core.mail.message import EmailMessage
 from django.template.loader import render_to_string
 
@@ -7,6 +8,10 @@ from experimenter.experiments.constants import ExperimentConstants
 
 
 def send_intent_to_ship_email(experiment_id):
+    send_emails([build_intent_to_ship_email(experiment_id)])
+
+
+def build_intent_to_ship_email(experiment_id):
     experiment = Experiment.objects.get(id=experiment_id)
 
     bug_url = settings.BUGZILLA_DETAIL_URL.format(id=experiment.bugzilla_id)
@@ -14,15 +19,15 @@ def send_intent_to_ship_email(experiment_id):
     # Because that's how it's done in Experiment.population (property)
     percent_of_population = f"{float(experiment.population_percent):g}%"
 
-    format_and_send_html_email(
+    return format_html_email(
         experiment,
         "experiments/emails/intent_to_ship.html",
         {
             "experiment": experiment,
             "bug_url": bug_url,
             "percent_of_population": percent_of_population,
-            "locales": [str(l) for l in experiment.locales.all()],
-            "countries": [str(c) for c in experiment.countries.all()],
+            "locales": [str(l) for l in experiment.get_locales()],
+            "countries": [str(c) for c in experiment.get_countries()],
         },
         Experiment.INTENT_TO_SHIP_EMAIL_SUBJECT,
         Experiment.INTENT_TO_SHIP_EMAIL_LABEL,
@@ -31,7 +36,11 @@ def send_intent_to_ship_email(experiment_id):
 
 
 def send_experiment_launch_email(experiment):
-    format_and_send_html_email(
+    send_emails([build_experiment_launch_email(experiment)])
+
+
+def build_experiment_launch_email(experiment):
+    return format_html_email(
         experiment,
         "experiments/emails/launch_experiment_email.html",
         {
@@ -44,8 +53,11 @@ def send_experiment_launch_email(experiment):
 
 
 def send_experiment_ending_email(experiment):
+    send_emails([build_experiment_ending_email(experiment)])
 
-    format_and_send_html_email(
+
+def build_experiment_ending_email(experiment):
+    return format_html_email(
         experiment,
         "experiments/emails/experiment_ending_email.html",
         {
@@ -58,8 +70,11 @@ def send_experiment_ending_email(experiment):
 
 
 def send_enrollment_pause_email(experiment):
+    send_emails([build_enrollment_pause_email(experiment)])
+
 
-    format_and_send_html_email(
+def build_enrollment_pause_email(experiment):
+    return format_html_email(
         experiment,
         "experiments/emails/enrollment_pause_email.html",
         {
@@ -71,7 +86,7 @@ def send_enrollment_pause_email(experiment):
     )
 
 
-def format_and_send_html_email(
+def format_html_email(
     experiment,
     file_string,
     template_vars,
@@ -79,6 +94,10 @@ def format_and_send_html_email(
     email_type,
     cc_recipients=None,
 ):
+    """
+    Render an email without sending it, as an (EmailMessage,
+    ExperimentEmail) pair for send_emails.
+    """
     content = render_to_string(file_string, template_vars)
 
     version = experiment.format_firefox_versions
@@ -97,6 +116,19 @@ def format_and_send_html_email(
     )
     email.content_subtype = "html"
 
-    email.send(fail_silently=False)
+    return email, ExperimentEmail(experiment=experiment, type=email_type)
+
+
+def send_emails(emails):
+    """
+    Send emails built by format_html_email over a single connection,
+    recording each one as sent as soon as it is, so a failure part way
+    through doesn't send the earlier ones again on the next run.
+    """
+    if not emails:
+        return
 
-    ExperimentEmail.objects.create(experiment=experiment, type=email_type)
+    with get_connection(fail_silently=False) as connection:
+        for message, experiment_email in emails:
+            connection.send_messages([message])
+            experiment_email.save()
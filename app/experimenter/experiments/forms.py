@@ -8,12 +8,14 @@ from django.db import transaction
 from django.forms import BaseInlineFormSet
 from django.forms import inlineformset_factory
 from django.forms.models import ModelChoiceIterator
+from django.urls import reverse
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.html import strip_tags
 from django.utils.safestring import mark_safe
 from django.utils.text import slugify
 
-from experimenter.base.models import Country, Locale
+from experimenter.base.snapshots import country_snapshot, locale_snapshot
 from experimenter.experiments.constants import ExperimentConstants
 from experimenter.experiments import tasks
 from experimenter.experiments.bugzilla import get_bugzilla_id
@@ -88,17 +90,47 @@ class BugzillaURLField(forms.URLField):
 
 
 class ChangeLogMixin(object):
+    # Related objects edited outside of the form fields, eg by a formset
+    changelog_related_fields = ()
 
     def __init__(self, request, *args, **kwargs):
         self.request = request
         super().__init__(*args, **kwargs)
         if self.instance.id:
-            self.old_serialized_vals = ChangeLogSerializer(self.instance).data
+            self.old_serialized_vals = self.serialize_changelog_fields()
 
     def get_changelog_message(self):
         return ""
 
+    def get_changelog_fields(self):
+        """
+        The ChangeLogSerializer fields this form can change, so only those
+        are snapshotted before and after saving.
+        """
+        fields = set(self.fields) | set(self.changelog_related_fields)
+        return fields & set(ChangeLogSerializer.Meta.fields)
+
+    def serialize_changelog_fields(self):
+        return ChangeLogSerializer(
+            self.instance, fields=self.get_changelog_fields()
+        ).data
+
+    def get_latest_change(self, experiment):
+        # Reuse the change log when the view already prefetched it
+        prefetched = getattr(experiment, "_prefetched_objects_cache", {})
+        if "changes" in prefetched:
+            return max(
+                prefetched["changes"],
+                key=lambda change: change.changed_on,
+                default=None,
+            )
+
+        return experiment.changes.latest()
+
     def save(self, *args, **kwargs):
+        latest_change = None
+        if self.instance.id:
+            latest_change = self.get_latest_change(self.instance)
 
         experiment = super().save(*args, **kwargs)
 
@@ -106,16 +138,14 @@ class ChangeLogMixin(object):
         new_values = {}
         old_status = None
 
-        self.new_serialized_vals = ChangeLogSerializer(self.instance).data
-        latest_change = experiment.changes.latest()
+        self.new_serialized_vals = self.serialize_changelog_fields()
 
         # account for changes in variant values
         if latest_change:
             old_status = latest_change.new_status
-            if (
-                self.old_serialized_vals["variants"]
-                != self.new_serialized_vals["variants"]
-            ):
+            if self.old_serialized_vals.get(
+                "variants"
+            ) != self.new_serialized_vals.get("variants"):
                 old_values["variants"] = self.old_serialized_vals["variants"]
                 new_values["variants"] = self.new_serialized_vals["variants"]
 
@@ -152,6 +182,66 @@ class ChangeLogMixin(object):
         return experiment
 
 
+class OwnerAutocompleteWidget(forms.Select):
+    """
+    A select that only renders the selected owner, the other owners are
+    searched for by owner-autocomplete.js as the user types.
+    """
+
+    def __init__(self, owned_only=True, attrs=None):
+        super().__init__(attrs=attrs)
+        self.owned_only = owned_only
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+
+        url = reverse("experiments-api-owners")
+        if not self.owned_only:
+            url = "{url}?owned=false".format(url=url)
+        context["widget"]["attrs"]["data-autocomplete-url"] = url
+
+        return context
+
+    def optgroups(self, name, value, attrs=None):
+        field = getattr(self.choices, "field", None)
+        if field is None:
+            return super().optgroups(name, value, attrs)
+
+        choices = []
+        if field.empty_label is not None:
+            choices.append(("", field.empty_label))
+
+        selected_ids = [selected_id for selected_id in value if selected_id]
+        if selected_ids:
+            try:
+                choices.extend(
+                    (user.pk, field.label_from_instance(user))
+                    for user in self.choices.queryset.filter(
+                        pk__in=selected_ids
+                    )
+                )
+            except (TypeError, ValueError):
+                pass
+
+        return [
+            (
+                None,
+                [
+                    self.create_option(
+                        name,
+                        option_value,
+                        option_label,
+                        str(option_value) in value,
+                        index,
+                        attrs=attrs,
+                    )
+                ],
+                index,
+            )
+            for index, (option_value, option_label) in enumerate(choices)
+        ]
+
+
 class ExperimentOverviewForm(
     NameSlugFormMixin, ChangeLogMixin, forms.ModelForm
 ):
@@ -170,6 +260,10 @@ class ExperimentOverviewForm(
         # option which would otherwise be included because the model field
         # is nullable.
         empty_label=None,
+        # Any user can be made the owner, not only existing owners
+        widget=OwnerAutocompleteWidget(
+            owned_only=False, attrs={"class": "form-control"}
+        ),
     )
     engineering_owner = forms.CharField(
         required=False,
@@ -448,7 +542,58 @@ class CustomModelMultipleChoiceField(forms.ModelMultipleChoiceField):
     iterator = CustomModelChoiceIterator
 
 
+class SnapshotModelChoiceIterator(CustomModelChoiceIterator):
+
+    @cached_property
+    def objects(self):
+        # Once per form, rather than in both __len__ and __iter__
+        return self.field.snapshot.all()
+
+    def __iter__(self):
+        yield (CustomModelMultipleChoiceField.ALL_KEY, self.field.all_label)
+        for obj in self.objects:
+            yield self.choice(obj)
+
+    def __len__(self):
+        return len(self.objects) + 1
+
+
+class SnapshotModelMultipleChoiceField(CustomModelMultipleChoiceField):
+    """A CustomModelMultipleChoiceField whose choices are rendered and
+    validated from a ModelSnapshot of the table instead of querying it
+    each time, chosen by code."""
+
+    def __init__(self, snapshot, *args, **kwargs):
+        self.snapshot = snapshot
+        kwargs["queryset"] = snapshot.model.objects.all()
+        kwargs["to_field_name"] = "code"
+        super().__init__(*args, **kwargs)
+
+    def _check_values(self, value):
+        try:
+            codes = frozenset(value)
+        except TypeError:
+            raise forms.ValidationError(
+                self.error_messages["list"], code="list"
+            )
+
+        objects = self.snapshot.filter_codes(codes)
+        found_codes = {obj.code for obj in objects}
+        for code in codes:
+            if code not in found_codes:
+                raise forms.ValidationError(
+                    self.error_messages["invalid_choice"],
+                    code="invalid_choice",
+                    params={"value": code},
+                )
+
+        return objects
+
+    iterator = SnapshotModelChoiceIterator
+
+
 class ExperimentVariantsBaseForm(ChangeLogMixin, forms.ModelForm):
+    changelog_related_fields = ("variants",)
 
     population_percent = forms.DecimalField(
         label="Population Percentage",
@@ -477,21 +622,19 @@ class ExperimentVariantsBaseForm(ChangeLogMixin, forms.ModelForm):
         help_text=Experiment.CLIENT_MATCHING_HELP_TEXT,
         widget=forms.Textarea(attrs={"class": "form-control", "rows": 10}),
     )
-    locales = CustomModelMultipleChoiceField(
+    locales = SnapshotModelMultipleChoiceField(
+        locale_snapshot,
         label="Locales",
         required=False,
         all_label="All locales",
         help_text="Applicable only if you don't select All",
-        queryset=Locale.objects.all(),
-        to_field_name="code",
     )
-    countries = CustomModelMultipleChoiceField(
+    countries = SnapshotModelMultipleChoiceField(
+        country_snapshot,
         label="Countries",
         required=False,
         all_label="All countries",
         help_text="Applicable only if you don't select All",
-        queryset=Country.objects.all(),
-        to_field_name="code",
     )
     # See https://developer.snapappointments.com/bootstrap-select/examples/
     # for more options that relate to the initial rendering of the HTML
@@ -573,7 +716,9 @@ class ExperimentVariantsBaseForm(ChangeLogMixin, forms.ModelForm):
 
     @transaction.atomic
     def save(self, *args, **kwargs):
-        self.variants_formset.save()
+        # Refreshed once by the experiment save rather than per variant
+        with self.instance.deferred_variant_refresh():
+            self.variants_formset.save()
         return super().save(*args, **kwargs)
 
 
@@ -0,0 +1,49 @@
+# Generated by Django 2.1.11 on 2026-10-16 20:30
+
+import django.contrib.postgres.fields.jsonb
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0068_experiment_related_to")]
+
+    operations = [
+        migrations.CreateModel(
+            name="NormandyRecipeCache",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("normandy_id", models.PositiveIntegerField(unique=True)),
+                (
+                    "etag",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                (
+                    "last_modified",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                (
+                    "approved_revision",
+                    django.contrib.postgres.fields.jsonb.JSONField(
+                        blank=True,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        null=True,
+                    ),
+                ),
+                ("updated_on", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Normandy Recipe Cache",
+                "verbose_name_plural": "Normandy Recipe Cache",
+            },
+        )
+    ]
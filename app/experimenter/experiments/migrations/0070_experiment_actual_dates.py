@@ -0,0 +1,46 @@
+# Generated by Django 2.1.11 on 2026-10-16 20:37
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import TruncDate
+
+
+def backfill_actual_dates(apps, schema_editor):
+    Experiment = apps.get_model("experiments", "Experiment")
+    ExperimentChangeLog = apps.get_model("experiments", "ExperimentChangeLog")
+
+    def transition_date(old_status, new_status):
+        return Subquery(
+            ExperimentChangeLog.objects.filter(
+                experiment=OuterRef("pk"),
+                old_status=old_status,
+                new_status=new_status,
+            )
+            .order_by("changed_on")
+            .annotate(changed_date=TruncDate("changed_on"))
+            .values("changed_date")[:1]
+        )
+
+    Experiment.objects.update(
+        actual_start_date=transition_date("Accepted", "Live"),
+        actual_end_date=transition_date("Live", "Complete"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0069_normandyrecipecache")]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="actual_end_date",
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="experiment",
+            name="actual_start_date",
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(backfill_actual_dates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 2.1.11 on 2026-10-16 20:45
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_search_vectors(apps, schema_editor):
+    Experiment = apps.get_model("experiments", "Experiment")
+    User = apps.get_model("auth", "User")
+
+    owner_email = Subquery(
+        User.objects.filter(pk=OuterRef("owner_id")).values("email")[:1]
+    )
+
+    Experiment.objects.update(
+        search_vector=(
+            SearchVector("name", "slug", weight="A")
+            + SearchVector(
+                "short_description",
+                "public_name",
+                "public_description",
+                owner_email,
+                "addon_experiment_id",
+                "pref_key",
+                "bugzilla_id",
+                "normandy_slug",
+                weight="B",
+            )
+            + SearchVector(
+                "related_work",
+                "objectives",
+                "analysis",
+                "analysis_owner",
+                "engineering_owner",
+                "data_science_bugzilla_url",
+                "feature_bugzilla_url",
+                weight="C",
+            )
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0070_experiment_actual_dates")]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="experiments_search__e9a3c8_gin"
+            ),
+        ),
+        migrations.RunPython(
+            backfill_search_vectors, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 2.1.11 on 2026-10-16 20:51
+
+from django.db import migrations, models
+from django.db.models import F, Func, IntegerField, Value
+from django.db.models.functions import Cast
+
+
+def version_integer_expression(field):
+    return Cast(
+        Func(F(field), Value(r"[\d]+"), function="substring"), IntegerField()
+    )
+
+
+def backfill_version_integers(apps, schema_editor):
+    Experiment = apps.get_model("experiments", "Experiment")
+    Experiment.objects.update(
+        firefox_min_version_integer=version_integer_expression(
+            "firefox_min_version"
+        ),
+        firefox_max_version_integer=version_integer_expression(
+            "firefox_max_version"
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0071_experiment_search_vector")]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="firefox_max_version_integer",
+            field=models.PositiveIntegerField(
+                blank=True, db_index=True, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="experiment",
+            name="firefox_min_version_integer",
+            field=models.PositiveIntegerField(
+                blank=True, db_index=True, null=True
+            ),
+        ),
+        migrations.RunPython(
+            backfill_version_integers, migrations.RunPython.noop
+        ),
+    ]
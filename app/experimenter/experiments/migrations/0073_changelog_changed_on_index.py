@@ -0,0 +1,27 @@
+# Generated by Django 2.1.11 on 2026-10-16 21:08
+
+from django.db import migrations, models
+import experimenter.experiments.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0072_experiment_version_integers")]
+
+    operations = [
+        migrations.AlterField(
+            model_name="experimentchangelog",
+            name="changed_on",
+            field=models.DateTimeField(
+                db_index=True,
+                default=experimenter.experiments.models.ExperimentChangeLog.current_datetime,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experimentchangelog",
+            index=models.Index(
+                fields=["experiment", "changed_on"],
+                name="experiments_experim_f44ffa_idx",
+            ),
+        ),
+    ]
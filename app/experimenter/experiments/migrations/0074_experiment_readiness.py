@@ -0,0 +1,50 @@
+# Generated by Django 2.1.11 on 2026-10-16 22:10
+
+import django.contrib.postgres.fields.jsonb
+import django.core.serializers.json
+from django.db import migrations
+from django.db.models import Exists, OuterRef
+
+
+def backfill_readiness(apps, schema_editor):
+    # The readiness rules live on the model rather than in the database,
+    # so they're applied to the current model built from each row
+    from experimenter.experiments.models import Experiment as ExperimentModel
+
+    Experiment = apps.get_model("experiments", "Experiment")
+    ExperimentVariant = apps.get_model("experiments", "ExperimentVariant")
+
+    attnames = [field.attname for field in Experiment._meta.concrete_fields]
+    rows = (
+        Experiment.objects.annotate(
+            has_variants=Exists(
+                ExperimentVariant.objects.filter(experiment=OuterRef("pk"))
+            )
+        )
+        .values(*attnames, "has_variants")
+        .iterator()
+    )
+    for row in rows:
+        has_variants = row.pop("has_variants")
+        experiment = ExperimentModel(**row)
+        Experiment.objects.filter(pk=experiment.pk).update(
+            readiness=experiment.compute_readiness(has_variants=has_variants)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0073_changelog_changed_on_index")]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="readiness",
+            field=django.contrib.postgres.fields.jsonb.JSONField(
+                blank=True,
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+                null=True,
+            ),
+        ),
+        migrations.RunPython(backfill_readiness, migrations.RunPython.noop),
+    ]
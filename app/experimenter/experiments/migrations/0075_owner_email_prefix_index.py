@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("experiments", "0074_experiment_readiness"),
+    ]
+
+    # Serves the email__istartswith search in the owner autocomplete,
+    # which Postgres compares as UPPER(email::text) LIKE 'PREFIX%'
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX auth_user_email_upper_like "
+                "ON auth_user (UPPER(email::text) text_pattern_ops);"
+            ),
+            reverse_sql="DROP INDEX auth_user_email_upper_like;",
+        )
+    ]
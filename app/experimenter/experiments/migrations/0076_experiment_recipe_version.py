@@ -0,0 +1,16 @@
+# Generated by Django 2.1.11 on 2026-10-17 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0075_owner_email_prefix_index")]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="recipe_version",
+            field=models.PositiveIntegerField(default=1),
+        )
+    ]
@@ -2,21 +2,35 @@ import json
 import datetime
 import time
 from collections import defaultdict
+from contextlib import contextmanager
 from urllib.parse import urljoin
-import copy
 
 from django.conf import settings
 from django.utils.text import slugify
 from django.contrib.auth import get_user_model
 from django.core.validators import MaxValueValidator
 from django.contrib.postgres.fields import ArrayField
-from django.db import models
-from django.db.models import Case, Max, Value, When
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import (
+    Case,
+    ExpressionWrapper,
+    F,
+    Max,
+    OuterRef,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, TruncDate
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.functional import cached_property
 
 from experimenter.base.models import Country, Locale
+from experimenter.base.snapshots import country_snapshot, locale_snapshot
 from experimenter.experiments.constants import ExperimentConstants
 
 from django.contrib.postgres.fields import JSONField
@@ -25,13 +39,6 @@ from django.core.serializers.json import DjangoJSONEncoder
 
 class ExperimentManager(models.Manager):
 
-    def get_queryset(self):
-        return (
-            super()
-            .get_queryset()
-            .annotate(latest_change=Max("changes__changed_on"))
-        )
-
     def get_prefetched(self):
         return self.get_queryset().prefetch_related(
             "changes",
@@ -43,6 +50,203 @@ class ExperimentManager(models.Manager):
             "countries",
         )
 
+    def get_detail_prefetched(self):
+        """
+        Everything the experiment detail page renders, so the page costs
+        the same number of queries however many variants, comments,
+        changes or subscribers the experiment has.
+        """
+        return self.get_prefetched().prefetch_related(
+            "variants", "subscribers", "related_to"
+        )
+
+    def bulk_clone(self, clones, user):
+        """
+        Clone each (experiment, name) pair as a new draft owned by user,
+        with its variants, locales and countries, in a fixed number of
+        queries however many experiments are cloned.
+        """
+        clones = list(clones)
+        sources = (
+            self.get_queryset()
+            .prefetch_related("variants", "locales", "countries")
+            .in_bulk([experiment.id for experiment, _ in clones])
+        )
+
+        copied_fields = [
+            field.attname
+            for field in Experiment._meta.concrete_fields
+            if not field.primary_key
+            and field.name not in Experiment.DERIVED_FIELDS
+        ]
+
+        cloned_experiments = []
+        for experiment, name in clones:
+            source = sources[experiment.id]
+            cloned = Experiment(
+                **{field: getattr(source, field) for field in copied_fields}
+            )
+
+            cloned.name = name
+            cloned.slug = slugify(name)
+            cloned.status = ExperimentConstants.STATUS_DRAFT
+            cloned.owner = user
+            cloned.parent = source
+            cloned.archived = False
+
+            for field in Experiment.CLONE_SET_TO_NONE_FIELDS:
+                setattr(cloned, field, None)
+
+            cloned.readiness = cloned.compute_readiness(
+                has_variants=bool(source.variants.all())
+            )
+            cloned_experiments.append(cloned)
+
+        with transaction.atomic():
+            cloned_experiments = self.get_queryset().bulk_create(
+                cloned_experiments
+            )
+            self.update_search_vectors(
+                pk__in=[cloned.pk for cloned in cloned_experiments]
+            )
+
+            variants = []
+            locales = []
+            countries = []
+            for cloned in cloned_experiments:
+                source = cloned.parent
+                variants.extend(
+                    ExperimentVariant(
+                        experiment=cloned,
+                        name=variant.name,
+                        slug=variant.slug,
+                        is_control=variant.is_control,
+                        description=variant.description,
+                        ratio=variant.ratio,
+                        value=variant.value,
+                    )
+                    for variant in source.variants.all()
+                )
+                locales.extend(
+                    Experiment.locales.through(
+                        experiment_id=cloned.pk, locale_id=locale.pk
+                    )
+                    for locale in source.locales.all()
+                )
+                countries.extend(
+                    Experiment.countries.through(
+                        experiment_id=cloned.pk, country_id=country.pk
+                    )
+                    for country in source.countries.all()
+                )
+
+            if variants:
+                ExperimentVariant.objects.bulk_create(variants)
+            if locales:
+                Experiment.locales.through.objects.bulk_create(locales)
+            if countries:
+                Experiment.countries.through.objects.bulk_create(countries)
+
+            ExperimentChangeLog.objects.bulk_create(
+                [
+                    ExperimentChangeLog(
+                        experiment=cloned,
+                        changed_by=user,
+                        old_status=None,
+                        new_status=ExperimentConstants.STATUS_DRAFT,
+                    )
+                    for cloned in cloned_experiments
+                ]
+            )
+
+        return cloned_experiments
+
+    def update_actual_dates(self, **filters):
+        """
+        Recompute the denormalized actual_start_date and actual_end_date
+        columns from the change log for the matching experiments.
+        """
+
+        def transition_date(old_status, new_status):
+            return Subquery(
+                ExperimentChangeLog.objects.filter(
+                    experiment=OuterRef("pk"),
+                    old_status=old_status,
+                    new_status=new_status,
+                )
+                .order_by("changed_on")
+                .annotate(changed_date=TruncDate("changed_on"))
+                .values("changed_date")[:1]
+            )
+
+        updated = (
+            self.get_queryset()
+            .filter(**filters)
+            .update(
+                actual_start_date=transition_date(
+                    Experiment.STATUS_ACCEPTED, Experiment.STATUS_LIVE
+                ),
+                actual_end_date=transition_date(
+                    Experiment.STATUS_LIVE, Experiment.STATUS_COMPLETE
+                ),
+            )
+        )
+        self.invalidate_list_rows(**filters)
+        return updated
+
+    def invalidate_list_rows(self, **filters):
+        """
+        Drop the cached list rows of the matching experiments, for
+        changes that don't go through Experiment.save.
+        """
+        pks = (
+            self.get_queryset().filter(**filters).values_list("pk", flat=True)
+        )
+        cache.delete_many([Experiment.list_row_cache_key(pk) for pk in pks])
+
+    def invalidate_recipes(self, **filters):
+        """
+        Bump the recipe_version of the matching experiments, which is
+        part of their recipe cache key, so no process serves the old
+        recipe once the change commits.
+        """
+        return (
+            self.get_queryset()
+            .filter(**filters)
+            .update(recipe_version=F("recipe_version") + 1)
+        )
+
+    def update_search_vectors(self, **filters):
+        """
+        Recompute the stored search_vector column for the matching
+        experiments.
+        """
+        owner_email = Subquery(
+            get_user_model()
+            .objects.filter(pk=OuterRef("owner_id"))
+            .values("email")[:1]
+        )
+
+        search_vector = None
+        for weight, fields in Experiment.SEARCH_FIELDS:
+            weighted_vector = SearchVector(
+                *[
+                    owner_email if field == "owner" else field
+                    for field in fields
+                ],
+                weight=weight,
+            )
+            if search_vector is None:
+                search_vector = weighted_vector
+            else:
+                search_vector += weighted_vector
+
+        return (
+            self.get_queryset()
+            .filter(**filters)
+            .update(search_vector=search_vector)
+        )
+
 
 class Experiment(ExperimentConstants, models.Model):
     type = models.CharField(
@@ -93,6 +297,10 @@ class Experiment(ExperimentConstants, models.Model):
         validators=[MaxValueValidator(ExperimentConstants.MAX_DURATION)],
     )
 
+    # Denormalized from the change log, see ExperimentChangeLog.save
+    actual_start_date = models.DateField(blank=True, null=True, db_index=True)
+    actual_end_date = models.DateField(blank=True, null=True, db_index=True)
+
     addon_experiment_id = models.CharField(
         max_length=255, unique=True, blank=True, null=True
     )
@@ -127,6 +335,13 @@ class Experiment(ExperimentConstants, models.Model):
         blank=True,
         null=True,
     )
+    # Major versions parsed from the version fields above, see save
+    firefox_min_version_integer = models.PositiveIntegerField(
+        blank=True, null=True, db_index=True
+    )
+    firefox_max_version_integer = models.PositiveIntegerField(
+        blank=True, null=True, db_index=True
+    )
     firefox_channel = models.CharField(
         max_length=255, choices=ExperimentConstants.CHANNEL_CHOICES
     )
@@ -257,15 +472,229 @@ class Experiment(ExperimentConstants, models.Model):
     results_initial = models.TextField(blank=True, null=True)
     results_lessons_learned = models.TextField(blank=True, null=True)
 
+    # Maintained by ExperimentManager.update_search_vectors
+    search_vector = SearchVectorField(blank=True, null=True)
+
+    # Section completeness and required reviews, see compute_readiness
+    readiness = JSONField(encoder=DjangoJSONEncoder, blank=True, null=True)
+
+    # Maintained by ExperimentManager.invalidate_recipes
+    recipe_version = models.PositiveIntegerField(default=1)
+
     objects = ExperimentManager()
 
     class Meta:
         verbose_name = "Experiment"
         verbose_name_plural = "Experiments"
+        indexes = [GinIndex(fields=["search_vector"])]
+
+    # Fields included in search_vector, by weight, the owner is
+    # searched by email
+    SEARCH_FIELDS = (
+        ("A", ("name", "slug")),
+        (
+            "B",
+            (
+                "short_description",
+                "public_name",
+                "public_description",
+                "owner",
+                "addon_experiment_id",
+                "pref_key",
+                "bugzilla_id",
+                "normandy_slug",
+            ),
+        ),
+        (
+            "C",
+            (
+                "related_work",
+                "objectives",
+                "analysis",
+                "analysis_owner",
+                "engineering_owner",
+                "data_science_bugzilla_url",
+                "feature_bugzilla_url",
+            ),
+        ),
+    )
+
+    # Derived from other rows, see ExperimentChangeLog.save and the
+    # ExperimentManager update_search_vectors and invalidate_recipes
+    DERIVED_FIELDS = (
+        "actual_start_date",
+        "actual_end_date",
+        "search_vector",
+        "recipe_version",
+    )
+
+    # Cleared on a clone, which starts over as a new draft
+    CLONE_SET_TO_NONE_FIELDS = (
+        "addon_experiment_id",
+        "addon_release_url",
+        "normandy_slug",
+        "normandy_id",
+        "other_normandy_ids",
+        "bugzilla_id",
+        "review_science",
+        "review_engineering",
+        "review_qa_requested",
+        "review_intent_to_ship",
+        "review_bugzilla",
+        "review_qa",
+        "review_relman",
+        "review_advisory",
+        "review_legal",
+        "review_ux",
+        "review_security",
+        "review_vp",
+        "review_data_steward",
+        "review_comms",
+        "review_impacted_teams",
+        "proposed_start_date",
+        "actual_start_date",
+        "actual_end_date",
+    )
+
+    # Version strings and the integer fields parsed from them
+    VERSION_INTEGER_FIELDS = (
+        ("firefox_min_version", "firefox_min_version_integer"),
+        ("firefox_max_version", "firefox_max_version_integer"),
+    )
+
+    @staticmethod
+    def version_integer(version):
+        if version:
+            match = ExperimentConstants.VERSION_REGEX.match(str(version))
+            if match:
+                return int(match.group(0))
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+
+        for version_field, integer_field in self.VERSION_INTEGER_FIELDS:
+            setattr(
+                self,
+                integer_field,
+                self.version_integer(getattr(self, version_field)),
+            )
+            if update_fields is not None and version_field in update_fields:
+                update_fields = list(update_fields) + [integer_field]
+                kwargs["update_fields"] = update_fields
+        # Whether there are variants is kept up to date by the variant
+        # signals, so it is only queried when nothing is stored
+        has_variants = None
+        if self._state.adding:
+            has_variants = False
+        elif self.readiness is not None:
+            has_variants = self.readiness["completed_variants"]
+        readiness = self.compute_readiness(has_variants=has_variants)
+        if (
+            update_fields is not None
+            and readiness != self.readiness
+            and "readiness" not in update_fields
+        ):
+            update_fields = list(update_fields) + ["readiness"]
+            kwargs["update_fields"] = update_fields
+        self.readiness = readiness
+
+        adding = self._state.adding
+        changed_searched_fields = self.get_changed_searched_fields()
+        if update_fields is not None:
+            changed_searched_fields &= {
+                self._meta.get_field(field).attname for field in update_fields
+            }
+        update_search_vector = adding or bool(changed_searched_fields)
+
+        # The derived fields are maintained separately, so a save from a
+        # stale instance must not overwrite them.
+        if (
+            not adding
+            and not kwargs.get("force_insert")
+            and update_fields is None
+        ):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.DERIVED_FIELDS
+            ]
+
+        super().save(*args, **kwargs)
+        self._saved_searched_values = self.get_searched_values()
+
+        if update_search_vector:
+            Experiment.objects.update_search_vectors(pk=self.pk)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._saved_searched_values = instance.get_searched_values()
+        return instance
+
+    @classmethod
+    def get_searched_attnames(cls):
+        # The owner is searched by email, so owner_id is tracked
+        return {
+            cls._meta.get_field(field).attname
+            for _, fields in cls.SEARCH_FIELDS
+            for field in fields
+        }
+
+    def get_searched_values(self):
+        # Only the loaded fields, reading a deferred one would query
+        return {
+            attname: self.__dict__[attname]
+            for attname in self.get_searched_attnames()
+            if attname in self.__dict__
+        }
+
+    def get_changed_searched_fields(self):
+        """
+        The searched fields changed since the instance was loaded or last
+        saved, every loaded one for an instance that was never saved.
+        """
+        saved_values = getattr(self, "_saved_searched_values", {})
+        return {
+            attname
+            for attname, value in self.get_searched_values().items()
+            if attname not in saved_values or saved_values[attname] != value
+        }
 
     def get_absolute_url(self):
         return reverse("experiments-detail", kwargs={"slug": self.slug})
 
+    @staticmethod
+    def recipe_cache_key(pk, recipe_version):
+        return "experiments.recipe.{pk}.{recipe_version}".format(
+            pk=pk, recipe_version=recipe_version
+        )
+
+    def invalidate_recipe_cache(self):
+        Experiment.objects.invalidate_recipes(pk=self.pk)
+
+    @staticmethod
+    def list_row_cache_key(pk):
+        return "experiments.list_row.{pk}".format(pk=pk)
+
+    def invalidate_list_row_cache(self):
+        cache.delete(self.list_row_cache_key(self.pk))
+
+    def get_list_row(self):
+        """
+        The values the experiment list page shows for this experiment,
+        computed once and cached by ExperimentListView.
+        """
+        return {
+            "full_name": self.full_name,
+            "status_display": self.get_status_display(),
+            "is_enrollment_complete": self.is_enrollment_complete,
+            "owner": str(self.owner),
+            "population": self.population,
+            "dates": self.dates,
+            "enrollment_end_date": self.enrollment_end_date,
+        }
+
     def __str__(self):
         return self.full_name
 
@@ -417,20 +846,9 @@ class Experiment(ExperimentConstants, models.Model):
             or self.feature_bugzilla_url
         )
 
-    def _transition_date(self, old_status, new_status):
-        for change in self.changes.all():
-            if (
-                change.old_status == old_status
-                and change.new_status == new_status
-            ):
-                return change.changed_on.date()
-
     @property
     def start_date(self):
-        return (
-            self._transition_date(self.STATUS_ACCEPTED, self.STATUS_LIVE)
-            or self.proposed_start_date
-        )
+        return self.actual_start_date or self.proposed_start_date
 
     def _compute_end_date(self, duration):
         if self.start_date and duration and 0 <= duration <= self.MAX_DURATION:
@@ -438,20 +856,20 @@ class Experiment(ExperimentConstants, models.Model):
 
     @property
     def end_date(self):
-        return self._transition_date(
-            self.STATUS_LIVE, self.STATUS_COMPLETE
-        ) or self._compute_end_date(self.proposed_duration)
+        return self.actual_end_date or self._compute_end_date(
+            self.proposed_duration
+        )
 
     @property
     def enrollment_ending_soon(self):
         return (
             self.enrollment_end_date - datetime.date.today()
-        ) <= datetime.timedelta(days=5)
+        ) <= datetime.timedelta(days=self.ENDING_SOON_DAYS)
 
     @property
     def ending_soon(self):
         return (self.end_date - datetime.date.today()) <= datetime.timedelta(
-            days=5
+            days=self.ENDING_SOON_DAYS
         )
 
     @property
@@ -507,7 +925,34 @@ class Experiment(ExperimentConstants, models.Model):
 
     @cached_property
     def control(self):
-        return self.variants.get(is_control=True)
+        # Searched in python so prefetched variants are reused
+        for variant in self.variants.all():
+            if variant.is_control:
+                return variant
+
+        raise ExperimentVariant.DoesNotExist(
+            "Experiment {slug} has no control".format(slug=self.slug)
+        )
+
+    def _get_snapshot_related(self, field_name, snapshot):
+        if field_name in getattr(self, "_prefetched_objects_cache", {}):
+            return list(getattr(self, field_name).all())
+
+        # Only the link table is queried, the rows come from the snapshot
+        related_field = self._meta.get_field(field_name)
+        links = related_field.remote_field.through.objects.filter(
+            **{related_field.m2m_field_name(): self.pk}
+        )
+        linked_field_name = related_field.m2m_reverse_field_name()
+        return snapshot.filter_pks(
+            links.values_list(linked_field_name, flat=True)
+        )
+
+    def get_locales(self):
+        return self._get_snapshot_related("locales", locale_snapshot)
+
+    def get_countries(self):
+        return self._get_snapshot_related("countries", country_snapshot)
 
     @property
     def grouped_changes(self):
@@ -559,35 +1004,34 @@ class Experiment(ExperimentConstants, models.Model):
     def completed_overview(self):
         return self.pk is not None
 
-    @property
-    def completed_timeline(self):
+    def _compute_completed_timeline(self):
         return self.proposed_start_date and self.proposed_duration
 
-    @property
-    def completed_population(self):
+    def _compute_completed_population(self):
         return (
             self.population_percent > 0
             and self.firefox_min_version != ""
             and self.firefox_channel != ""
         )
 
-    @property
-    def completed_addon(self):
+    def _compute_completed_addon(self):
         return self.addon_experiment_id and self.addon_release_url
 
-    @property
-    def completed_variants(self):
-        return self.variants.exists()
+    def _compute_completed_variants(self):
+        if self.pk is None:
+            return False
 
-    @property
-    def completed_objectives(self):
+        # Not self.variants, which may hold a prefetch from before the
+        # variants were saved
+        return ExperimentVariant.objects.filter(experiment_id=self.pk).exists()
+
+    def _compute_completed_objectives(self):
         return (
             self.objectives != self.OBJECTIVES_DEFAULT
             and self.analysis != self.ANALYSIS_DEFAULT
         )
 
-    @property
-    def completed_results(self):
+    def _compute_completed_results(self):
         return (
             self.results_url
             or self.results_initial
@@ -613,12 +1057,10 @@ class Experiment(ExperimentConstants, models.Model):
             self.risk_technical,
         )
 
-    @property
-    def completed_risks(self):
+    def _compute_completed_risks(self):
         return None not in self._risk_questions
 
-    @property
-    def completed_testing(self):
+    def _compute_completed_testing(self):
         return self.qa_status
 
     @property
@@ -655,35 +1097,154 @@ class Experiment(ExperimentConstants, models.Model):
             "review_relman",
         ]
 
-    def get_all_required_reviews(self):
+    def _compute_required_reviews(self):
         required_reviews = self._default_required_reviews()
         for review, risk in self._conditional_required_reviews_mapping.items():
             if risk:
                 required_reviews.append(review)
         return required_reviews
 
-    @property
-    def completed_required_reviews(self):
-        required_reviews = self.get_all_required_reviews()
+    def compute_readiness(self, has_variants=None):
+        """
+        Which sections are complete and which reviews are required, as
+        stored in the readiness column. has_variants can be passed when
+        already known, eg for an experiment that isn't saved yet.
+        """
+        if has_variants is None:
+            has_variants = self._compute_completed_variants()
+
+        readiness = {
+            "completed_timeline": self._compute_completed_timeline(),
+            "completed_population": self._compute_completed_population(),
+            "completed_addon": self._compute_completed_addon(),
+            "completed_variants": has_variants,
+            "completed_objectives": self._compute_completed_objectives(),
+            "completed_results": self._compute_completed_results(),
+            "completed_risks": self._compute_completed_risks(),
+            "completed_testing": self._compute_completed_testing(),
+        }
+        readiness = {key: bool(value) for key, value in readiness.items()}
 
-        # review advisory is an exception that is not required
-        required_reviews.remove("review_advisory")
-        return all([getattr(self, r) for r in required_reviews])
+        readiness["required_reviews"] = self._compute_required_reviews()
 
-    @property
-    def completed_all_sections(self):
-        completed = (
-            self.completed_timeline
-            and self.completed_population
-            and self.completed_variants
-            and self.completed_objectives
-            and self.completed_risks
+        # review advisory is an exception that is not required
+        readiness["completed_required_reviews"] = all(
+            [
+                getattr(self, review)
+                for review in readiness["required_reviews"]
+                if review != "review_advisory"
+            ]
         )
 
+        completed_all_sections = (
+            readiness["completed_timeline"]
+            and readiness["completed_population"]
+            and readiness["completed_variants"]
+            and readiness["completed_objectives"]
+            and readiness["completed_risks"]
+        )
         if self.is_addon_experiment:
-            completed = completed and self.completed_addon
+            completed_all_sections = (
+                completed_all_sections and readiness["completed_addon"]
+            )
+        readiness["completed_all_sections"] = completed_all_sections
+
+        return readiness
+
+    def refresh_variants(self, has_variants=None):
+        """
+        Store the readiness and invalidate the recipe in one update, for
+        variants saved or deleted outside of Experiment.save.
+        """
+        self.readiness = self.compute_readiness(has_variants=has_variants)
+        Experiment.objects.filter(pk=self.pk).update(
+            readiness=self.readiness, recipe_version=F("recipe_version") + 1
+        )
 
-        return completed
+    def set_review_intent_to_ship(self, value):
+        """
+        Set review_intent_to_ship with a conditional update, so that of
+        concurrent callers only one changes it. Returns whether it did.
+        """
+        self.review_intent_to_ship = value
+        readiness = self.compute_readiness(
+            has_variants=self.readiness_summary["completed_variants"]
+        )
+        changed = Experiment.objects.filter(
+            pk=self.pk, review_intent_to_ship=not value
+        ).update(review_intent_to_ship=value, readiness=readiness)
+        if changed:
+            self.readiness = readiness
+            self.invalidate_list_row_cache()
+        return bool(changed)
+
+    @contextmanager
+    def deferred_variant_refresh(self):
+        """
+        Skip the per variant refresh while saving several variants, the
+        readiness and recipe are then refreshed once by the next save.
+        """
+        self._variant_refresh_deferred = True
+        try:
+            yield
+        finally:
+            del self._variant_refresh_deferred
+        self.readiness = None
+
+    @property
+    def variant_refresh_deferred(self):
+        return getattr(self, "_variant_refresh_deferred", False)
+
+    @property
+    def readiness_summary(self):
+        # Rows saved before the readiness column existed are computed
+        # once per instance
+        if self.readiness is None:
+            self.readiness = self.compute_readiness()
+        return self.readiness
+
+    @property
+    def completed_timeline(self):
+        return self.readiness_summary["completed_timeline"]
+
+    @property
+    def completed_population(self):
+        return self.readiness_summary["completed_population"]
+
+    @property
+    def completed_addon(self):
+        return self.readiness_summary["completed_addon"]
+
+    @property
+    def completed_variants(self):
+        return self.readiness_summary["completed_variants"]
+
+    @property
+    def completed_objectives(self):
+        return self.readiness_summary["completed_objectives"]
+
+    @property
+    def completed_results(self):
+        return self.readiness_summary["completed_results"]
+
+    @property
+    def completed_risks(self):
+        return self.readiness_summary["completed_risks"]
+
+    @property
+    def completed_testing(self):
+        return self.readiness_summary["completed_testing"]
+
+    def get_all_required_reviews(self):
+        return list(self.readiness_summary["required_reviews"])
+
+    @property
+    def completed_required_reviews(self):
+        return self.readiness_summary["completed_required_reviews"]
+
+    @property
+    def completed_all_sections(self):
+        return self.readiness_summary["completed_all_sections"]
 
     @property
     def is_ready_to_launch(self):
@@ -696,23 +1257,6 @@ class Experiment(ExperimentConstants, models.Model):
         else:
             return self.firefox_min_version
 
-    @property
-    def firefox_max_version_integer(self):
-        if self.firefox_max_version:
-            return int(
-                ExperimentConstants.VERSION_REGEX.match(
-                    self.firefox_max_version
-                ).group(0)
-            )
-
-    @property
-    def firefox_min_version_integer(self):
-        return int(
-            ExperimentConstants.VERSION_REGEX.match(
-                self.firefox_min_version
-            ).group(0)
-        )
-
     @property
     def versions_integer_list(self):
         max = (
@@ -729,6 +1273,15 @@ class Experiment(ExperimentConstants, models.Model):
             channel=self.firefox_channel,
         )
 
+    @staticmethod
+    def latest_change_expression():
+        """
+        The time of the most recent change log entry, as an annotation.
+        This aggregates over the change log so it is only added by
+        querysets that filter or sort on it.
+        """
+        return Max("changes__changed_on")
+
     @staticmethod
     def firefox_channel_sort():
         """A Case that can be added to an Experiment QuerySet to sort."""
@@ -749,6 +1302,41 @@ class Experiment(ExperimentConstants, models.Model):
             output_field=models.IntegerField(),
         )
 
+    @staticmethod
+    def start_date_expression():
+        """An expression matching start_date for use in a QuerySet."""
+        return Coalesce("actual_start_date", "proposed_start_date")
+
+    @staticmethod
+    def _compute_end_date_expression(duration_field):
+        return Case(
+            When(
+                **{
+                    f"{duration_field}__gt": 0,
+                    f"{duration_field}__lte": ExperimentConstants.MAX_DURATION,
+                },
+                then=ExpressionWrapper(
+                    Experiment.start_date_expression() + F(duration_field),
+                    output_field=models.DateField(),
+                ),
+            ),
+            default=Value(None),
+            output_field=models.DateField(),
+        )
+
+    @staticmethod
+    def enrollment_end_date_expression():
+        """An expression matching enrollment_end_date for use in a QuerySet."""
+        return Experiment._compute_end_date_expression("proposed_enrollment")
+
+    @staticmethod
+    def end_date_expression():
+        """An expression matching end_date for use in a QuerySet."""
+        return Coalesce(
+            "actual_end_date",
+            Experiment._compute_end_date_expression("proposed_duration"),
+        )
+
     @property
     def is_archivable(self):
         not_archivable = (self.STATUS_LIVE, self.STATUS_ACCEPTED)
@@ -759,63 +1347,7 @@ class Experiment(ExperimentConstants, models.Model):
         return self.is_paused and self.status == self.STATUS_LIVE
 
     def clone(self, name, user):
-
-        cloned = copy.copy(self)
-        variants = ExperimentVariant.objects.filter(experiment=self)
-
-        set_to_none_fields = [
-            "addon_experiment_id",
-            "addon_release_url",
-            "normandy_slug",
-            "normandy_id",
-            "other_normandy_ids",
-            "bugzilla_id",
-            "review_science",
-            "review_engineering",
-            "review_qa_requested",
-            "review_intent_to_ship",
-            "review_bugzilla",
-            "review_qa",
-            "review_relman",
-            "review_advisory",
-            "review_legal",
-            "review_ux",
-            "review_security",
-            "review_vp",
-            "review_data_steward",
-            "review_comms",
-            "review_impacted_teams",
-            "proposed_start_date",
-        ]
-
-        cloned.id = None
-        cloned.name = name
-        cloned.slug = slugify(cloned.name)
-        cloned.status = ExperimentConstants.STATUS_DRAFT
-        cloned.owner = user
-        cloned.parent = self
-        cloned.archived = False
-
-        for field in set_to_none_fields:
-            setattr(cloned, field, None)
-
-        cloned.save()
-
-        # for the variants on the old experiment, duplicate each
-        # with id=none, set the experiment foreignkey to the new clone
-        for variant in variants:
-            variant.id = None
-            variant.experiment = cloned
-            variant.save()
-
-        ExperimentChangeLog.objects.create(
-            experiment=cloned,
-            changed_by=get_user_model().objects.get(id=user.id),
-            old_status=None,
-            new_status=ExperimentConstants.STATUS_DRAFT,
-        )
-
-        return cloned
+        return Experiment.objects.bulk_clone([(self, name)], user)[0]
 
 
 class ExperimentVariant(models.Model):
@@ -905,7 +1437,7 @@ class ExperimentChangeLog(models.Model):
         related_name="changes",
         on_delete=models.CASCADE,
     )
-    changed_on = models.DateTimeField(default=current_datetime)
+    changed_on = models.DateTimeField(default=current_datetime, db_index=True)
     changed_by = models.ForeignKey(get_user_model(), on_delete=models.CASCADE)
     old_status = models.CharField(
         max_length=255,
@@ -950,6 +1482,42 @@ class ExperimentChangeLog(models.Model):
         verbose_name = "Experiment Change Log"
         verbose_name_plural = "Experiment Change Logs"
         ordering = ("changed_on",)
+        # Serves the per experiment Max in Experiment.latest_change_expression
+        indexes = [models.Index(fields=["experiment", "changed_on"])]
+
+    DATE_TRANSITIONS = (
+        (Experiment.STATUS_ACCEPTED, Experiment.STATUS_LIVE),
+        (Experiment.STATUS_LIVE, Experiment.STATUS_COMPLETE),
+    )
+
+    @property
+    def is_date_transition(self):
+        return (self.old_status, self.new_status) in self.DATE_TRANSITIONS
+
+    def _update_experiment_dates(self):
+        Experiment.objects.update_actual_dates(id=self.experiment_id)
+
+        if ExperimentChangeLog.experiment.is_cached(self):
+            self.experiment.refresh_from_db(
+                fields=["actual_start_date", "actual_end_date"]
+            )
+
+    def save(self, *args, **kwargs):
+        # Edits to an existing change (eg through the admin) may move or
+        # remove a transition, so always recompute in that case.
+        is_update = self.pk is not None
+        super().save(*args, **kwargs)
+
+        if is_update or self.is_date_transition:
+            self._update_experiment_dates()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+
+        if self.is_date_transition:
+            self._update_experiment_dates()
+
+        return result
 
     def __str__(self):
         if self.message:
@@ -966,13 +1534,27 @@ class ExperimentChangeLog(models.Model):
 
 class ExperimentCommentManager(models.Manager):
 
-    @cached_property
+    @property
     def sections(self):
+        # A new related manager is built on every experiment.comments
+        # lookup, so the grouping of prefetched comments is kept on the
+        # experiment for as long as that prefetch is.
+        instance = getattr(self, "instance", None)
+        prefetched = getattr(instance, "_prefetched_objects_cache", {}).get(
+            "comments"
+        )
+        cached = getattr(instance, "_comment_sections", None)
+        if prefetched is not None and cached and cached[0] is prefetched:
+            return cached[1]
+
         sections = defaultdict(list)
 
         for comment in self.all():
             sections[comment.section].append(comment)
 
+        if prefetched is not None:
+            instance._comment_sections = (prefetched, sections)
+
         return sections
 
 
@@ -989,6 +1571,25 @@ class ExperimentEmail(ExperimentConstants, models.Model):
     sent_on = models.DateTimeField(auto_now_add=True)
 
 
+class NormandyRecipeCache(models.Model):
+    normandy_id = models.PositiveIntegerField(unique=True)
+    etag = models.CharField(max_length=255, blank=True, null=True)
+    last_modified = models.CharField(max_length=255, blank=True, null=True)
+    approved_revision = JSONField(
+        encoder=DjangoJSONEncoder, blank=True, null=True
+    )
+    updated_on = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Normandy Recipe Cache"
+        verbose_name_plural = "Normandy Recipe Cache"
+
+    def __str__(self):  # pragma: no cover
+        return "Recipe {id} ({etag})".format(
+            id=self.normandy_id, etag=self.etag
+        )
+
+
 class ExperimentComment(ExperimentConstants, models.Model):
     experiment = models.ForeignKey(
         Experiment, related_name="comments", on_delete=models.CASCADE
@@ -1,7 +1,19 @@
 import requests
 import logging
+from collections import namedtuple
+from urllib.parse import urlencode
+
 from django.conf import settings
 
+from experimenter.experiments.clients import PooledHTTPClient
+
+
+client = PooledHTTPClient("normandy")
+
+RecipeResponse = namedtuple(
+    "RecipeResponse", ("recipe_data", "etag", "last_modified", "modified")
+)
+
 
 class NormandyError(Exception):
     pass
@@ -19,11 +31,13 @@ class NormandyDecodeError(NormandyError):
     message = "Error parsing JSON Normandy Response"
 
 
-def make_normandy_call(url):
+def _normandy_call(url, headers=None):
     try:
-        response = requests.get(url)
+        response = client.get(url, headers=headers)
         response.raise_for_status()
-        return response.json()
+        if response.status_code == 304:
+            return response, None
+        return response, response.json()
     except requests.exceptions.HTTPError as e:
         logging.exception(
             "Normandy API returned Nonsuccessful Response Code: {}".format(e)
@@ -37,7 +51,65 @@ def make_normandy_call(url):
         raise NormandyDecodeError(*e.args)
 
 
-def get_recipe(recipe_id):
+def make_normandy_call(url):
+    _, response_data = _normandy_call(url)
+    return response_data
+
+
+def fetch_recipe(recipe_id, etag=None, last_modified=None):
+    """Fetch a recipe, conditional on a previously seen ETag/Last-Modified.
+
+    When Normandy answers 304 Not Modified the returned RecipeResponse has
+    modified=False and no recipe_data; the caller's cached copy is current.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
     recipe_url = settings.NORMANDY_API_RECIPE_URL.format(id=recipe_id)
-    recipe_data = make_normandy_call(recipe_url)
-    return recipe_data["approved_revision"]
+    response, recipe_data = _normandy_call(recipe_url, headers=headers)
+
+    if response.status_code == 304:
+        return RecipeResponse(None, etag, last_modified, False)
+
+    return RecipeResponse(
+        recipe_data["approved_revision"],
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+        True,
+    )
+
+
+def get_recipe(recipe_id):
+    return fetch_recipe(recipe_id).recipe_data
+
+
+def get_recipes(recipe_ids):
+    """Page through the Normandy recipe list collecting the given recipes.
+
+    Returns a dict of recipe id to approved_revision for every requested
+    id that was found.  Paging stops as soon as all ids have been seen, so
+    the cost is a number of list pages rather than one request per recipe.
+    """
+    remaining_ids = set(recipe_ids)
+    recipes = {}
+
+    recipes_url = "{url}?{query}".format(
+        url=settings.NORMANDY_API_RECIPE_LIST_URL,
+        query=urlencode(
+            {"page_size": settings.NORMANDY_API_RECIPE_LIST_PAGE_SIZE}
+        ),
+    )
+    while recipes_url and remaining_ids:
+        response_data = make_normandy_call(recipes_url)
+
+        for recipe in response_data["results"]:
+            if recipe["id"] in remaining_ids:
+                recipes[recipe["id"]] = recipe["approved_revision"]
+                remaining_ids.remove(recipe["id"])
+
+        recipes_url = response_data.get("next")
+
+    return recipes
@@ -0,0 +1,199 @@
+import base64
+import binascii
+import datetime
+import json
+
+from django.core.exceptions import FieldError, ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+
+def estimate_count(queryset):
+    """The planner's estimate of the number of rows in the queryset."""
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+        plan = cursor.fetchone()[0]
+    return plan[0]["Plan"]["Plan Rows"]
+
+
+class CountQuerysetPaginator(Paginator):
+    """
+    Counts a separate queryset, so the count doesn't have to run the
+    annotations that the page itself needs.
+    """
+
+    def __init__(self, object_list, per_page, count_queryset, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_queryset = count_queryset.order_by()
+
+    @cached_property
+    def count(self):
+        return self.count_queryset.count()
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class KeysetPage(object):
+
+    def __init__(self, object_list, paginator, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator(object):
+    """
+    Pages through a queryset ordered by a single field by filtering on
+    the last row seen rather than with an offset, so every page costs
+    the same as the first. The primary key breaks ties in the ordering.
+
+    Once the planner estimates more than approximate_count_threshold
+    rows the estimate is shown instead of an exact count.
+    """
+
+    is_keyset = True
+
+    def __init__(
+        self,
+        queryset,
+        per_page,
+        count_queryset,
+        approximate_count_threshold=None,
+    ):
+        (ordering,) = queryset.query.order_by
+        self.descending = ordering.startswith("-")
+        self.field = ordering.lstrip("-")
+
+        self.queryset = queryset
+        self.per_page = per_page
+        self.count_queryset = count_queryset.order_by()
+        self.approximate_count_threshold = approximate_count_threshold
+
+    @cached_property
+    def counted(self):
+        """The count and whether it is the planner's estimate."""
+        if self.approximate_count_threshold:
+            estimated_count = estimate_count(self.count_queryset)
+            if estimated_count > self.approximate_count_threshold:
+                return estimated_count, True
+
+        return self.count_queryset.count(), False
+
+    @property
+    def count(self):
+        count, _ = self.counted
+        return count
+
+    @property
+    def count_is_approximate(self):
+        _, is_approximate = self.counted
+        return is_approximate
+
+    def _get_field(self):
+        annotation = self.queryset.query.annotations.get(self.field)
+        if annotation is not None:
+            try:
+                return annotation.output_field
+            except FieldError:
+                return None
+        return self.queryset.model._meta.get_field(self.field)
+
+    def encode_cursor(self, obj):
+        value = getattr(obj, self.field)
+        if isinstance(value, datetime.datetime):
+            value = value.isoformat()
+        cursor = json.dumps([value, obj.pk])
+        return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            field = self._get_field()
+            if value is not None and field is not None:
+                value = field.to_python(value)
+            return value, int(pk)
+        except (binascii.Error, TypeError, ValueError, ValidationError):
+            raise InvalidCursor(cursor)
+
+    def _ordered(self, descending):
+        direction = "-" if descending else ""
+        return self.queryset.order_by(
+            "{direction}{field}".format(direction=direction, field=self.field),
+            "{direction}pk".format(direction=direction),
+        )
+
+    def _following(self, descending, value, pk):
+        # Postgres sorts nulls last in ascending order and first in
+        # descending order
+        field = self.field
+        if descending:
+            if value is None:
+                return Q(**{f"{field}__isnull": True, "pk__lt": pk}) | Q(
+                    **{f"{field}__isnull": False}
+                )
+            return Q(**{f"{field}__lt": value}) | Q(
+                **{field: value, "pk__lt": pk}
+            )
+
+        if value is None:
+            return Q(**{f"{field}__isnull": True, "pk__gt": pk})
+        return (
+            Q(**{f"{field}__gt": value})
+            | Q(**{field: value, "pk__gt": pk})
+            | Q(**{f"{field}__isnull": True})
+        )
+
+    def page(self, after=None, before=None):
+        if before:
+            # Walk backwards from the cursor and put the rows back in order
+            descending = not self.descending
+            queryset = self._ordered(descending).filter(
+                self._following(descending, *self.decode_cursor(before))
+            )
+        else:
+            descending = self.descending
+            queryset = self._ordered(descending)
+            if after:
+                queryset = queryset.filter(
+                    self._following(descending, *self.decode_cursor(after))
+                )
+
+        rows = list(queryset[: self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+
+        if before:
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, bool(after)
+
+        next_cursor = None
+        previous_cursor = None
+        if rows and has_next:
+            next_cursor = self.encode_cursor(rows[-1])
+        if rows and has_previous:
+            previous_cursor = self.encode_cursor(rows[0])
+
+        return KeysetPage(rows, self, next_cursor, previous_cursor)
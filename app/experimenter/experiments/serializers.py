@@ -1,6 +1,7 @@
 import time
 import json
 from rest_framework import serializers
+from django.contrib.auth import get_user_model
 from django.utils.text import slugify
 from django.urls import reverse
 from django.db.models import Q
@@ -35,6 +36,19 @@ class PrefTypeField(serializers.Field):
             return obj
 
 
+class DynamicFieldsMixin(object):
+    """
+    Takes a fields argument that limits the serializer to those fields.
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+
 class ExperimentVariantSerializer(serializers.ModelSerializer):
 
     class Meta:
@@ -63,6 +77,13 @@ class CountrySerializer(serializers.ModelSerializer):
         fields = ("code", "name")
 
 
+class OwnerSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = get_user_model()
+        fields = ("id", "email")
+
+
 class ExperimentChangeLogSerializer(serializers.ModelSerializer):
 
     class Meta:
@@ -77,10 +98,12 @@ class ExperimentChangeLogSerializer(serializers.ModelSerializer):
         )
 
 
-class ChangeLogSerializer(serializers.ModelSerializer):
+class ChangeLogSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     variants = ExperimentVariantSerializer(many=True, required=False)
-    locales = LocaleSerializer(many=True, required=False)
-    countries = CountrySerializer(many=True, required=False)
+    locales = LocaleSerializer(many=True, required=False, source="get_locales")
+    countries = CountrySerializer(
+        many=True, required=False, source="get_countries"
+    )
     pref_type = PrefTypeField()
 
     class Meta:
@@ -163,13 +186,13 @@ class ChangeLogSerializer(serializers.ModelSerializer):
         )
 
 
-class ExperimentSerializer(serializers.ModelSerializer):
+class ExperimentSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     start_date = JSTimestampField()
     end_date = JSTimestampField()
     proposed_start_date = JSTimestampField()
     variants = ExperimentVariantSerializer(many=True)
-    locales = LocaleSerializer(many=True)
-    countries = CountrySerializer(many=True)
+    locales = LocaleSerializer(many=True, source="get_locales")
+    countries = CountrySerializer(many=True, source="get_countries")
     pref_type = PrefTypeField()
     changes = ExperimentChangeLogSerializer(many=True)
 
@@ -271,7 +294,7 @@ class FilterObjectLocaleSerializer(serializers.ModelSerializer):
         return "locale"
 
     def get_locales(self, obj):
-        return list(obj.locales.all().values_list("code", flat=True))
+        return [locale.code for locale in obj.get_locales()]
 
 
 class FilterObjectCountrySerializer(serializers.ModelSerializer):
@@ -286,7 +309,7 @@ class FilterObjectCountrySerializer(serializers.ModelSerializer):
         return "country"
 
     def get_countries(self, obj):
-        return list(obj.countries.all().values_list("code", flat=True))
+        return [country.code for country in obj.get_countries()]
 
 
 class ExperimentRecipeVariantSerializer(serializers.ModelSerializer):
@@ -362,10 +385,10 @@ class ExperimentRecipeSerializer(serializers.ModelSerializer):
             FilterObjectVersionsSerializer(obj).data,
         ]
 
-        if obj.locales.count():
+        if obj.get_locales():
             filter_objects.append(FilterObjectLocaleSerializer(obj).data)
 
-        if obj.countries.count():
+        if obj.get_countries():
             filter_objects.append(FilterObjectCountrySerializer(obj).data)
 
         return filter_objects
@@ -407,3 +430,52 @@ class ExperimentCloneSerializer(serializers.ModelSerializer):
         name = validated_data.get("name")
 
         return instance.clone(name, user)
+
+
+class ExperimentBulkCloneItemSerializer(serializers.Serializer):
+    slug = serializers.SlugField()
+    name = serializers.CharField(max_length=255)
+
+
+class ExperimentBulkCloneSerializer(serializers.Serializer):
+    experiments = ExperimentBulkCloneItemSerializer(
+        many=True, allow_empty=False
+    )
+
+    def validate_experiments(self, value):
+        experiments = Experiment.objects.in_bulk(
+            [item["slug"] for item in value], field_name="slug"
+        )
+        missing_slugs = [
+            item["slug"] for item in value if item["slug"] not in experiments
+        ]
+        if missing_slugs:
+            raise serializers.ValidationError(
+                "These experiments don't exist: {slugs}.".format(
+                    slugs=", ".join(missing_slugs)
+                )
+            )
+
+        names = [item["name"] for item in value]
+        slugs = [slugify(name) for name in names]
+
+        if not all(slugs):
+            raise serializers.ValidationError("That's an invalid name.")
+
+        existing_slug_or_name = Experiment.objects.filter(
+            Q(slug__in=slugs) | Q(name__in=names)
+        )
+
+        if len(set(slugs)) != len(slugs) or existing_slug_or_name.exists():
+            raise serializers.ValidationError(
+                "This experiment name already exists."
+            )
+
+        return [(experiments[item["slug"]], item["name"]) for item in value]
+
+    def create(self, validated_data):
+        user = self.context["request"].user
+
+        return Experiment.objects.bulk_clone(
+            validated_data["experiments"], user
+        )
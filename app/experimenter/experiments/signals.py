@@ -0,0 +1,75 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from experimenter.experiments.models import Experiment, ExperimentVariant
+
+
+@receiver(post_save, sender=Experiment)
+def invalidate_experiment_recipe(sender, instance, created, **kwargs):
+    if not created:
+        instance.invalidate_recipe_cache()
+
+
+@receiver(post_delete, sender=Experiment)
+def delete_experiment_recipe(sender, instance, **kwargs):
+    # The row is gone so the recipe view 404s, this only frees the entry
+    cache.delete(
+        Experiment.recipe_cache_key(instance.pk, instance.recipe_version)
+    )
+
+
+@receiver(post_save, sender=Experiment)
+def invalidate_experiment_list_row(sender, instance, **kwargs):
+    instance.invalidate_list_row_cache()
+
+
+@receiver(post_save, sender=get_user_model())
+def invalidate_owned_experiment_list_rows(
+    sender, instance, created, update_fields, **kwargs
+):
+    # List rows show the owner, while logins only update last_login
+    if created:
+        return
+    owner_fields = {sender.USERNAME_FIELD, "email"}
+    if update_fields is None or owner_fields & set(update_fields):
+        Experiment.objects.invalidate_list_rows(owner=instance)
+
+
+@receiver(post_save, sender=ExperimentVariant)
+def refresh_saved_variant_experiment(sender, instance, **kwargs):
+    if not instance.experiment.variant_refresh_deferred:
+        instance.experiment.refresh_variants(has_variants=True)
+
+
+@receiver(post_delete, sender=ExperimentVariant)
+def refresh_deleted_variant_experiment(sender, instance, **kwargs):
+    if not instance.experiment.variant_refresh_deferred:
+        instance.experiment.refresh_variants()
+
+
+@receiver(m2m_changed, sender=Experiment.locales.through)
+@receiver(m2m_changed, sender=Experiment.countries.through)
+def invalidate_targeting_recipe(sender, instance, action, reverse, **kwargs):
+    if not reverse:
+        if action.startswith("post_"):
+            instance.invalidate_recipe_cache()
+        return
+
+    # Changed from the locale or country side, pk_set holds the affected
+    # experiments except on a clear, where they are collected beforehand
+    if action == "pre_clear":
+        # The auto created through model names its field after the model
+        links = sender.objects.filter(**{instance._meta.model_name: instance})
+        instance._cleared_experiment_ids = list(
+            links.values_list("experiment_id", flat=True)
+        )
+    elif action == "post_clear":
+        Experiment.objects.invalidate_recipes(
+            pk__in=instance.__dict__.pop("_cleared_experiment_ids", ())
+        )
+    elif action.startswith("post_"):
+        Experiment.objects.invalidate_recipes(
+            pk__in=kwargs.get("pk_set") or ()
+        )
@@ -1,14 +1,20 @@
+import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import markus
 from django.contrib.auth import get_user_model
 from django.db import IntegrityError, transaction
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from django.conf import settings
 from celery.utils.log import get_task_logger
 
 from experimenter.celery import app
 from experimenter.experiments import bugzilla, normandy, email
-from experimenter.experiments.constants import ExperimentConstants
-from experimenter.experiments.models import Experiment, ExperimentEmail
+from experimenter.experiments.models import (
+    Experiment,
+    ExperimentEmail,
+    NormandyRecipeCache,
+)
 from experimenter.notifications.models import Notification
 
 
@@ -117,6 +123,120 @@ def update_experiment_bug_task(user_id, experiment_id):
         raise e
 
 
+def fetch_recipes(normandy_ids):
+    """Fetch the Normandy recipes for the given ids.
+
+    Returns a dict of normandy id to a completed future of a
+    normandy.RecipeResponse so that errors raised by an individual fetch
+    surface when its result is read.
+    """
+    normandy_ids = set(normandy_ids)
+    if not normandy_ids:
+        return {}
+
+    cached_recipes = {
+        cached.normandy_id: cached
+        for cached in NormandyRecipeCache.objects.filter(
+            normandy_id__in=normandy_ids
+        )
+    }
+
+    if settings.NORMANDY_BULK_FETCH:
+        return fetch_recipes_bulk(normandy_ids, cached_recipes)
+    return fetch_recipes_concurrently(normandy_ids, cached_recipes)
+
+
+def fetch_recipes_concurrently(normandy_ids, cached_recipes):
+    """Fetch one recipe per request using a bounded thread pool.
+
+    Each request is conditional on the ETag/Last-Modified stored in the
+    recipe cache.
+    """
+    max_workers = min(settings.NORMANDY_FETCH_CONCURRENCY, len(normandy_ids))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        recipes = {}
+        for normandy_id in normandy_ids:
+            cached = cached_recipes.get(
+                normandy_id, NormandyRecipeCache(normandy_id=normandy_id)
+            )
+            recipes[normandy_id] = executor.submit(
+                normandy.fetch_recipe,
+                normandy_id,
+                etag=cached.etag,
+                last_modified=cached.last_modified,
+            )
+        return recipes
+
+
+def fetch_recipes_bulk(normandy_ids, cached_recipes):
+    """Fetch all recipes by paging through the Normandy recipe list.
+
+    A recipe is reported as unmodified when its approved revision matches
+    the copy stored in the recipe cache.
+    """
+    recipes = {normandy_id: Future() for normandy_id in normandy_ids}
+
+    try:
+        recipes_data = normandy.get_recipes(normandy_ids)
+    except (KeyError, normandy.NormandyError) as e:
+        for future in recipes.values():
+            future.set_exception(e)
+        return recipes
+
+    for normandy_id, future in recipes.items():
+        if normandy_id not in recipes_data:
+            future.set_exception(
+                normandy.NonsuccessfulNormandyCall(
+                    "Recipe {} not found".format(normandy_id)
+                )
+            )
+            continue
+
+        recipe_data = recipes_data[normandy_id]
+        cached = cached_recipes.get(normandy_id)
+        if cached is not None and cached.approved_revision == recipe_data:
+            future.set_result(
+                normandy.RecipeResponse(
+                    None, cached.etag, cached.last_modified, False
+                )
+            )
+        else:
+            future.set_result(
+                normandy.RecipeResponse(recipe_data, None, None, True)
+            )
+
+    return recipes
+
+
+def cache_recipe(normandy_id, recipe_response):
+    NormandyRecipeCache.objects.update_or_create(
+        normandy_id=normandy_id,
+        defaults={
+            "etag": recipe_response.etag,
+            "last_modified": recipe_response.last_modified,
+            "approved_revision": recipe_response.recipe_data,
+        },
+    )
+
+
+def record_recipe_cache_metrics(recipes):
+    responses = [
+        future.result()
+        for future in recipes.values()
+        if future.exception() is None
+    ]
+    if not responses:
+        return
+
+    hits = len([response for response in responses if not response.modified])
+    misses = len(responses) - hits
+    metrics.incr("update_experiment_info.recipe_cache.hit", value=hits)
+    metrics.incr("update_experiment_info.recipe_cache.miss", value=misses)
+    metrics.gauge(
+        "update_experiment_info.recipe_cache.hit_ratio", hits / len(responses)
+    )
+
+
 @app.task
 @metrics.timer_decorator("update_experiment_info.timing")
 def update_experiment_info():
@@ -126,25 +246,47 @@ def update_experiment_info():
         Q(status=Experiment.STATUS_ACCEPTED) | Q(status=Experiment.STATUS_LIVE)
     )
 
-    for experiment in launch_experiments:
-        try:
-            logger.info("Updating Experiment: {}".format(experiment))
-            if experiment.normandy_id:
-                update_status(experiment)
-                if experiment.status == Experiment.STATUS_LIVE:
-                    send_period_ending_emails(experiment)
-            else:
+    with metrics.timer("update_experiment_info.fetch.timing"):
+        recipes = fetch_recipes(
+            experiment.normandy_id
+            for experiment in launch_experiments
+            if experiment.normandy_id
+        )
+
+    failed_experiment_ids = []
+    with metrics.timer("update_experiment_info.apply.timing"):
+        for experiment in launch_experiments:
+            try:
+                logger.info("Updating Experiment: {}".format(experiment))
+                if experiment.normandy_id:
+                    recipe_response = recipes[experiment.normandy_id].result()
+                    if recipe_response.modified:
+                        update_status(experiment, recipe_response.recipe_data)
+                        cache_recipe(experiment.normandy_id, recipe_response)
+                    else:
+                        logger.info(
+                            "Normandy Recipe unchanged: {}".format(
+                                experiment.normandy_id
+                            )
+                        )
+                else:
+                    logger.info(
+                        "No Normandy ID found skipping: {}".format(experiment)
+                    )
+
+            except (IntegrityError, KeyError, normandy.NormandyError):
                 logger.info(
-                    "No Normandy ID found skipping: {}".format(experiment)
+                    "Failed to get Normandy Recipe. Recipe ID: {}".format(
+                        experiment.normandy_id
+                    )
                 )
+                metrics.incr("update_experiment_info.failed")
+                failed_experiment_ids.append(experiment.id)
 
-        except (IntegrityError, KeyError, normandy.NormandyError):
-            logger.info(
-                "Failed to get Normandy Recipe. Recipe ID: {}".format(
-                    experiment.normandy_id
-                )
-            )
-            metrics.incr("update_experiment_info.failed")
+    with metrics.timer("update_experiment_info.emails.timing"):
+        email.send_emails(build_period_ending_emails(failed_experiment_ids))
+
+    record_recipe_cache_metrics(recipes)
     metrics.incr("update_experiment_info.completed")
 
 
@@ -155,9 +297,7 @@ def add_start_date_comment(experiment):
     bugzilla.add_experiment_comment(experiment, comment)
 
 
-def update_status(experiment):
-    recipe_data = normandy.get_recipe(experiment.normandy_id)
-
+def update_status(experiment, recipe_data):
     if needs_to_be_updated(recipe_data, experiment.status):
         logger.info("Updating experiment Status")
         # set email default if no email/creator is found in normandy
@@ -218,31 +358,57 @@ def set_is_paused_value(experiment, paused_val):
     experiment.changes.create(message=message, changed_by=default_user)
 
 
-def send_period_ending_emails(experiment):
-    # send experiment ending soon emails if end date is 5 days out
-    if experiment.ending_soon:
-        if not ExperimentEmail.objects.filter(
-            experiment=experiment, type=ExperimentConstants.EXPERIMENT_ENDS
-        ).exists():
-            email.send_experiment_ending_email(experiment)
-            logger.info(
-                "Sent ending email for Experiment: {}".format(experiment)
-            )
+def build_period_ending_emails(failed_experiment_ids=()):
+    """
+    Build the ending and enrollment pause emails for every live experiment
+    in Normandy ending within ENDING_SOON_DAYS that hasn't been sent one
+    yet, except those whose recipe failed to update.
+    """
+    ending_soon_date = datetime.date.today() + datetime.timedelta(
+        days=Experiment.ENDING_SOON_DAYS
+    )
 
-    # send enrollment ending emails if enrollment end
-    # date is 5 days out
-    if experiment.enrollment_end_date:
-        if experiment.enrollment_ending_soon:
-            if not ExperimentEmail.objects.filter(
-                experiment=experiment,
-                type=ExperimentConstants.EXPERIMENT_PAUSES,
-            ).exists():
-                email.send_enrollment_pause_email(experiment)
-                logger.info(
-                    "Sent enrollment pause email for Experiment: {}".format(
-                        experiment
+    emails = []
+    for email_type, end_date_expression, build_email in (
+        (
+            Experiment.EXPERIMENT_ENDS,
+            Experiment.end_date_expression,
+            email.build_experiment_ending_email,
+        ),
+        (
+            Experiment.EXPERIMENT_PAUSES,
+            Experiment.enrollment_end_date_expression,
+            email.build_enrollment_pause_email,
+        ),
+    ):
+        # enrollment end dates are optional, experiments without one
+        # are excluded by the comparison
+        experiments = (
+            Experiment.objects.filter(
+                status=Experiment.STATUS_LIVE, normandy_id__isnull=False
+            )
+            .exclude(pk__in=failed_experiment_ids)
+            .annotate(
+                period_end_date=end_date_expression(),
+                email_sent=Exists(
+                    ExperimentEmail.objects.filter(
+                        experiment=OuterRef("pk"), type=email_type
                     )
+                ),
+            )
+            .filter(period_end_date__lte=ending_soon_date, email_sent=False)
+            .select_related("owner")
+        )
+
+        for experiment in experiments:
+            emails.append(build_email(experiment))
+            logger.info(
+                "Queued {type} email for Experiment: {experiment}".format(
+                    type=email_type, experiment=experiment
                 )
+            )
+
+    return emails
 
 
 def needs_to_be_updated(recipe_data, status):
@@ -297,3 +463,26 @@ def update_bug_resolution_task(user_id, experiment_id):
             ),
         )
         raise e
+
+
+@app.task
+@metrics.timer_decorator("send_intent_to_ship_email.timing")
+def send_intent_to_ship_email_task(experiment_id):
+    metrics.incr("send_intent_to_ship_email.started")
+
+    # Claimed before sending so a second queued task skips it, without
+    # holding a row lock while the mail server responds. The claim is
+    # released if the send fails so it can be retried from the review page.
+    experiment = Experiment.objects.get(id=experiment_id)
+    if not experiment.set_review_intent_to_ship(True):
+        logger.info("Intent to ship email already sent")
+        return
+
+    try:
+        email.send_intent_to_ship_email(experiment.id)
+    except Exception as e:
+        metrics.incr("send_intent_to_ship_email.failed")
+        experiment.set_review_intent_to_ship(False)
+        raise e
+
+    metrics.incr("send_intent_to_ship_email.completed")
@@ -41,3 +41,24 @@ def pagination_url(context, page, **kwargs):
         return f"?{data.urlencode()}"
     else:
         return "."
+
+
+@register.simple_tag(takes_context=True)
+def cursor_url(context, direction, cursor):
+    """Template tag to point any existing querystrings at a keyset page.
+
+    Usage:
+
+        <a href="{% cursor_url "after" page_obj.next_cursor %}">Next</a>
+
+    Any page number or cursor already in the querystring is replaced, so
+    if the current URL was `...?foo=bar&before=abc` the output would be
+
+        <a href="?foo=bar&amp;after=xyz">Next</a>
+
+    """
+    data = context["request"].GET.copy()
+    for key in ("page", "after", "before"):
+        data.pop(key, None)
+    data[direction] = cursor
+    return f"?{data.urlencode()}"
@@ -0,0 +1,131 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from django.test import override_settings
+
+
+RECIPE_DETAIL_PATH = re.compile(r"^/api/v3/recipe/(?P<id>\d+)/$")
+RECIPE_LIST_PATH = "/api/v3/recipe/"
+
+
+class FakeNormandyServer(object):
+    """A local stand-in for the Normandy recipe API.
+
+    Serves the recipe detail and paginated recipe list endpoints over real
+    HTTP on localhost and counts the requests it receives, so the per-id
+    and bulk fetch paths can be compared end to end.
+    """
+
+    def __init__(self, recipes):
+        self.recipes = recipes
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), self._build_handler()
+        )
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}
+        )
+        self._thread.daemon = True
+
+    @property
+    def host(self):
+        return "http://127.0.0.1:{port}".format(
+            port=self._server.server_address[1]
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def settings(self):
+        return override_settings(
+            NORMANDY_API_RECIPE_URL=self.host + "/api/v3/recipe/{id}/",
+            NORMANDY_API_RECIPE_LIST_URL=self.host + RECIPE_LIST_PATH,
+        )
+
+    def recipe_detail(self, recipe_id):
+        recipe = self.recipes.get(recipe_id)
+        if recipe is not None:
+            return {"id": recipe_id, "approved_revision": recipe}
+
+    def recipe_list(self, page, page_size):
+        recipe_ids = sorted(self.recipes)
+        start = (page - 1) * page_size
+        end = start + page_size
+        results = [
+            {"id": recipe_id, "approved_revision": self.recipes[recipe_id]}
+            for recipe_id in recipe_ids[start:end]
+        ]
+
+        next_url = None
+        if end < len(recipe_ids):
+            next_url = "{host}{path}?page={page}&page_size={size}".format(
+                host=self.host,
+                path=RECIPE_LIST_PATH,
+                page=page + 1,
+                size=page_size,
+            )
+
+        return {"count": len(recipe_ids), "next": next_url, "results": results}
+
+    def _build_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                with server._lock:
+                    server.request_count += 1
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+
+                detail_match = RECIPE_DETAIL_PATH.match(url.path)
+                if detail_match:
+                    body = server.recipe_detail(int(detail_match.group("id")))
+                elif url.path == RECIPE_LIST_PATH:
+                    body = server.recipe_list(
+                        int(query.get("page", ["1"])[0]),
+                        int(query.get("page_size", ["25"])[0]),
+                    )
+                else:
+                    body = None
+
+                if body is None:
+                    self.send_response(404)
+                    body = {"detail": "Not found."}
+                else:
+                    self.send_response(200)
+
+                content = json.dumps(body).encode("utf-8")
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+class FakeNormandyServerMixin(object):
+
+    def setUp(self):
+        super().setUp()
+
+        self.fake_normandy_recipes = {}
+        self.fake_normandy = FakeNormandyServer(self.fake_normandy_recipes)
+        self.fake_normandy.start()
+        self.addCleanup(self.fake_normandy.stop)
+
+        fake_normandy_settings = self.fake_normandy.settings()
+        fake_normandy_settings.enable()
+        self.addCleanup(fake_normandy_settings.disable)
@@ -10,7 +10,7 @@ class MockNormandyMixin(object):
         super().setUp()
 
         mock_normandy_requests_get_patcher = mock.patch(
-            "experimenter.experiments.normandy.requests.get"
+            "experimenter.experiments.normandy.client.get"
         )
         self.mock_normandy_requests_get = (
             mock_normandy_requests_get_patcher.start()
@@ -34,6 +34,7 @@ class MockNormandyMixin(object):
         mock_response.raise_for_status = mock.Mock()
         mock_response.raise_for_status.side_effect = None
         mock_response.status_code = 200
+        mock_response.headers = {}
         return mock_response
 
     def buildMockFailedResponse(self):
@@ -44,6 +45,17 @@ class MockNormandyMixin(object):
         mock_response.raise_for_status = mock.Mock()
         mock_response.raise_for_status.side_effect = None
         mock_response.status_code = 404
+        mock_response.headers = {}
+        return mock_response
+
+    def buildMockNotModifiedResponse(self):
+        mock_response = mock.Mock()
+        mock_response.json = mock.Mock()
+        mock_response.json.side_effect = ValueError()
+        mock_response.raise_for_status = mock.Mock()
+        mock_response.raise_for_status.side_effect = None
+        mock_response.status_code = 304
+        mock_response.headers = {}
         return mock_response
 
     def buildMockSuccessDisabledResponse(self):
@@ -59,6 +71,7 @@ class MockNormandyMixin(object):
         mock_response.raise_for_status = mock.Mock()
         mock_response.raise_for_status.side_effect = None
         mock_response.status_code = 200
+        mock_response.headers = {}
         return mock_response
 
     def buildMockSucessWithNoPauseEnrollment(self):
@@ -75,11 +88,12 @@ class MockNormandyMixin(object):
         mock_response.raise_for_status = mock.Mock()
         mock_response.raise_for_status.side_effect = None
         mock_response.status_code = 200
+        mock_response.headers = {}
         return mock_response
 
     def setUpMockNormandyFailWithSpecifiedID(self, normandy_id):
 
-        def determine_response(url):
+        def determine_response(url, **kwargs):
             if normandy_id in url:
                 return self.buildMockFailedResponse()
             else:
@@ -94,7 +108,7 @@ class MockBugzillaMixin(object):
         super().setUp()
 
         mock_bugzilla_requests_post_patcher = mock.patch(
-            "experimenter.experiments.bugzilla.requests.post"
+            "experimenter.experiments.bugzilla.client.post"
         )
         self.mock_bugzilla_requests_post = (
             mock_bugzilla_requests_post_patcher.start()
@@ -105,7 +119,7 @@ class MockBugzillaMixin(object):
             self.buildMockSuccessResponse()
         )
         mock_bugzilla_requests_put_patcher = mock.patch(
-            "experimenter.experiments.bugzilla.requests.put"
+            "experimenter.experiments.bugzilla.client.put"
         )
 
         self.mock_bugzilla_requests_put = (
@@ -117,7 +131,7 @@ class MockBugzillaMixin(object):
         )
 
         mock_bugzilla_requests_get_patcher = mock.patch(
-            "experimenter.experiments.bugzilla.requests.get"
+            "experimenter.experiments.bugzilla.client.get"
         )
 
         self.mock_bugzilla_requests_get = (
@@ -1,16 +1,27 @@
+import datetime
 import json
+from urllib.parse import urlencode
+
+import mock
 
 from django.conf import settings
-from django.core import mail
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
 
+from experimenter.experiments.api_views import ExperimentListView
 from experimenter.experiments.models import Experiment
 from experimenter.experiments.serializers import (
     ExperimentSerializer,
     ExperimentRecipeSerializer,
 )
-from experimenter.experiments.tests.factories import ExperimentFactory
+from experimenter.experiments.tests.factories import (
+    ExperimentChangeLogFactory,
+    ExperimentFactory,
+    LocaleFactory,
+    UserFactory,
+)
 
 
 class TestExperimentListView(TestCase):
@@ -33,6 +44,200 @@ class TestExperimentListView(TestCase):
 
         self.assertEqual(serialized_experiments, json_data)
 
+    def test_list_view_query_count_is_constant(self):
+        ExperimentFactory.create_with_variants()
+
+        with self.assertNumQueries(5):
+            self.client.get(reverse("experiments-api-list"))
+
+        for i in range(5):
+            ExperimentFactory.create_with_variants()
+
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse("experiments-api-list"))
+
+        self.assertEqual(len(json.loads(response.content)), 6)
+
+    def test_list_view_serializes_requested_fields(self):
+        experiment = ExperimentFactory.create_with_variants()
+
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse("experiments-api-list"),
+                {"fields": "slug,name,variants"},
+            )
+
+        json_data = json.loads(response.content)
+        self.assertEqual(len(json_data), 1)
+        self.assertEqual(set(json_data[0]), set(["slug", "name", "variants"]))
+        self.assertEqual(json_data[0]["slug"], experiment.slug)
+        self.assertEqual(
+            len(json_data[0]["variants"]), experiment.variants.count()
+        )
+
+    def test_list_view_paginates_with_cursor(self):
+        experiments = [
+            ExperimentFactory.create_with_variants() for i in range(3)
+        ]
+
+        response = self.client.get(
+            reverse("experiments-api-list"), {"page_size": 2}
+        )
+        json_data = json.loads(response.content)
+
+        self.assertEqual(
+            [experiment["slug"] for experiment in json_data["results"]],
+            [experiment.slug for experiment in experiments[:2]],
+        )
+        self.assertIsNone(json_data["previous"])
+
+        response = self.client.get(json_data["next"])
+        json_data = json.loads(response.content)
+
+        self.assertEqual(
+            [experiment["slug"] for experiment in json_data["results"]],
+            [experiments[2].slug],
+        )
+        self.assertIsNone(json_data["next"])
+
+    def test_list_view_streams_json_array(self):
+        for i in range(3):
+            ExperimentFactory.create_with_variants()
+
+        response = self.client.get(
+            reverse("experiments-api-list"), {"stream": "json"}
+        )
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(
+            json.loads(b"".join(response.streaming_content)),
+            ExperimentSerializer(
+                Experiment.objects.order_by("id"), many=True
+            ).data,
+        )
+
+    def test_list_view_streams_ndjson(self):
+        experiments = [
+            ExperimentFactory.create_with_variants() for i in range(3)
+        ]
+
+        response = self.client.get(
+            reverse("experiments-api-list"),
+            {"stream": "ndjson", "fields": "slug"},
+        )
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).splitlines()
+        self.assertEqual(
+            [json.loads(line) for line in lines],
+            [{"slug": experiment.slug} for experiment in experiments],
+        )
+
+    def test_list_view_stream_queries_per_batch(self):
+        for i in range(5):
+            ExperimentFactory.create_with_variants()
+
+        with mock.patch.object(ExperimentListView, "stream_batch_size", 2):
+            response = self.client.get(
+                reverse("experiments-api-list"),
+                {"stream": "ndjson", "status": Experiment.STATUS_DRAFT},
+            )
+
+            # One cursor over the ids, then the experiments and their
+            # four prefetched relations for each of the three batches
+            with self.assertNumQueries(1 + 3 * 5):
+                lines = b"".join(response.streaming_content).splitlines()
+
+        self.assertEqual(len(lines), 5)
+
+    def test_list_view_returns_experiments_changed_since(self):
+        now = timezone.now()
+        old_experiment = ExperimentFactory.create_with_variants()
+        ExperimentChangeLogFactory.create(
+            experiment=old_experiment,
+            changed_on=now - datetime.timedelta(days=2),
+        )
+        new_experiment = ExperimentFactory.create_with_variants()
+        ExperimentChangeLogFactory.create(
+            experiment=new_experiment,
+            changed_on=now - datetime.timedelta(days=2),
+        )
+        change = ExperimentChangeLogFactory.create(
+            experiment=new_experiment, changed_on=now
+        )
+
+        response = self.client.get(
+            reverse("experiments-api-list"),
+            {"changed_since": (now - datetime.timedelta(days=1)).isoformat()},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        json_data = json.loads(response.content)
+        self.assertEqual(
+            [experiment["slug"] for experiment in json_data["results"]],
+            [new_experiment.slug],
+        )
+
+        self.assertEqual(
+            json_data["watermark"],
+            change.changed_on.isoformat().replace("+00:00", "Z"),
+        )
+
+    @override_settings(EXPERIMENTS_CHANGED_SINCE_OVERLAP=60)
+    def test_changed_since_polls_overlap(self):
+        now = timezone.now()
+        experiment = ExperimentFactory.create_with_variants()
+        ExperimentChangeLogFactory.create(
+            experiment=experiment, changed_on=now
+        )
+
+        response = self.client.get(
+            reverse("experiments-api-list"),
+            {"changed_since": (now - datetime.timedelta(hours=1)).isoformat()},
+        )
+        watermark = json.loads(response.content)["watermark"]
+
+        # Stamped before the watermark but committed after the poll
+        late_experiment = ExperimentFactory.create_with_variants()
+        ExperimentChangeLogFactory.create(
+            experiment=late_experiment,
+            changed_on=now - datetime.timedelta(seconds=30),
+        )
+        old_experiment = ExperimentFactory.create_with_variants()
+        ExperimentChangeLogFactory.create(
+            experiment=old_experiment,
+            changed_on=now - datetime.timedelta(seconds=90),
+        )
+
+        response = self.client.get(
+            reverse("experiments-api-list"), {"changed_since": watermark}
+        )
+
+        json_data = json.loads(response.content)
+        self.assertEqual(
+            set(result["slug"] for result in json_data["results"]),
+            set([experiment.slug, late_experiment.slug]),
+        )
+        self.assertEqual(json_data["watermark"], watermark)
+
+    def test_list_view_rejects_invalid_changed_since(self):
+        response = self.client.get(
+            reverse("experiments-api-list"), {"changed_since": "yesterday"}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("changed_since", json.loads(response.content))
+
+    def test_list_view_rejects_impossible_changed_since(self):
+        response = self.client.get(
+            reverse("experiments-api-list"),
+            {"changed_since": "2019-02-30T00:00:00"},
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("changed_since", json.loads(response.content))
+
     def test_list_view_filters_by_status(self):
         pending_experiments = []
 
@@ -84,6 +289,17 @@ class TestExperimentDetailView(TestCase):
 
 class TestExperimentRecipeView(TestCase):
 
+    def setUp(self):
+        cache.clear()
+
+    def get_recipe(self, experiment, **headers):
+        return self.client.get(
+            reverse(
+                "experiments-api-recipe", kwargs={"slug": experiment.slug}
+            ),
+            **headers,
+        )
+
     def test_get_experiment_recipe_returns_recipe_info(self):
         user_email = "user@example.com"
         experiment = ExperimentFactory.create_with_variants()
@@ -100,16 +316,139 @@ class TestExperimentRecipeView(TestCase):
         serialized_experiment = ExperimentRecipeSerializer(experiment).data
         self.assertEqual(serialized_experiment, json_data)
 
+    def test_get_experiment_recipe_is_served_from_cache(self):
+        experiment = ExperimentFactory.create_with_variants()
+        first_response = self.get_recipe(experiment)
+
+        # Only the recipe_version lookup
+        with self.assertNumQueries(1):
+            second_response = self.get_recipe(experiment)
+
+        self.assertEqual(second_response.status_code, 200)
+        self.assertEqual(second_response.content, first_response.content)
+        self.assertEqual(second_response["ETag"], first_response["ETag"])
+
+    def test_get_experiment_recipe_returns_304_for_matching_etag(self):
+        experiment = ExperimentFactory.create_with_variants()
+        etag = self.get_recipe(experiment)["ETag"]
+
+        response = self.get_recipe(experiment, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_get_experiment_recipe_returns_200_for_stale_etag(self):
+        experiment = ExperimentFactory.create_with_variants()
+
+        response = self.get_recipe(experiment, HTTP_IF_NONE_MATCH='"stale"')
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_get_experiment_recipe_returns_404_for_unknown_slug(self):
+        experiment = ExperimentFactory.build(slug="unknown")
+        response = self.get_recipe(experiment)
+        self.assertEqual(response.status_code, 404)
+
+    def test_recipe_cache_invalidated_when_experiment_saved(self):
+        experiment = ExperimentFactory.create_with_variants()
+        etag = self.get_recipe(experiment)["ETag"]
+
+        experiment.name = "A New Name"
+        experiment.save()
+
+        response = self.get_recipe(experiment, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)["name"], "A New Name")
+
+    def test_recipe_cache_invalidated_when_variant_saved(self):
+        experiment = ExperimentFactory.create_with_variants()
+        etag = self.get_recipe(experiment)["ETag"]
+
+        variant = experiment.variants.first()
+        variant.ratio += 1
+        variant.save()
+
+        response = self.get_recipe(experiment, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_recipe_cache_invalidated_when_locales_change(self):
+        experiment = ExperimentFactory.create_with_variants()
+        etag = self.get_recipe(experiment)["ETag"]
+
+        experiment.locales.add(LocaleFactory.create())
+
+        response = self.get_recipe(experiment, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_recipe_cache_invalidated_when_locale_gains_experiments(self):
+        experiment = ExperimentFactory.create_with_variants()
+        etag = self.get_recipe(experiment)["ETag"]
+
+        LocaleFactory.create().experiment_set.add(experiment)
+
+        response = self.get_recipe(experiment, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_recipe_cache_invalidated_when_locale_experiments_cleared(self):
+        experiment = ExperimentFactory.create_with_variants()
+        locale = LocaleFactory.create()
+        experiment.locales.add(locale)
+        etag = self.get_recipe(experiment)["ETag"]
+
+        locale.experiment_set.clear()
+
+        response = self.get_recipe(experiment, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_recipe_cache_invalidated_by_another_process(self):
+        experiment = ExperimentFactory.create_with_variants()
+        etag = self.get_recipe(experiment)["ETag"]
+
+        # Another process changes the experiment and bumps the version,
+        # this process still holds the old entry in its cache
+        Experiment.objects.filter(pk=experiment.pk).update(name="A New Name")
+        Experiment.objects.invalidate_recipes(pk=experiment.pk)
+
+        response = self.get_recipe(experiment, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)["name"], "A New Name")
+
+    def test_recipe_cache_not_served_after_rename(self):
+        experiment = ExperimentFactory.create_with_variants()
+        old_slug = experiment.slug
+        self.get_recipe(experiment)
+
+        experiment.slug = "a-new-slug"
+        experiment.save()
+
+        self.assertEqual(self.get_recipe(experiment).status_code, 200)
+        experiment.slug = old_slug
+        self.assertEqual(self.get_recipe(experiment).status_code, 404)
+
+    def test_recipe_cache_not_served_after_delete(self):
+        experiment = ExperimentFactory.create_with_variants()
+        self.get_recipe(experiment)
+
+        experiment.delete()
+
+        self.assertEqual(self.get_recipe(experiment).status_code, 404)
+
 
 class TestExperimentSendIntentToShipEmailView(TestCase):
 
-    def test_put_to_view_sends_email(self):
+    def setUp(self):
+        mock_send_task_patcher = mock.patch(
+            "experimenter.experiments.tasks.send_intent_to_ship_email_task"
+        )
+        self.mock_send_task = mock_send_task_patcher.start()
+        self.addCleanup(mock_send_task_patcher.stop)
+
+    def test_put_to_view_queues_email(self):
         user_email = "user@example.com"
 
         experiment = ExperimentFactory.create_with_variants(
             review_intent_to_ship=False, status=Experiment.STATUS_REVIEW
         )
-        old_outbox_len = len(mail.outbox)
 
         response = self.client.put(
             reverse(
@@ -119,11 +458,13 @@ class TestExperimentSendIntentToShipEmailView(TestCase):
             **{settings.OPENIDC_EMAIL_HEADER: user_email},
         )
 
-        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json(), {"status": "email-queued"})
 
+        # Marked by the task when it sends the email
         experiment = Experiment.objects.get(pk=experiment.pk)
-        self.assertEqual(experiment.review_intent_to_ship, True)
-        self.assertEqual(len(mail.outbox), old_outbox_len + 1)
+        self.assertFalse(experiment.review_intent_to_ship)
+        self.mock_send_task.delay.assert_called_once_with(experiment.id)
 
     def test_put_raises_409_if_email_already_sent(self):
         experiment = ExperimentFactory.create_with_variants(
@@ -139,6 +480,7 @@ class TestExperimentSendIntentToShipEmailView(TestCase):
         )
 
         self.assertEqual(response.status_code, 409)
+        self.mock_send_task.delay.assert_not_called()
 
 
 class TestExperimentCloneView(TestCase):
@@ -163,3 +505,118 @@ class TestExperimentCloneView(TestCase):
         self.assertEqual(
             response.json()["clone_url"], "/experiments/best-experiment/"
         )
+
+
+class TestExperimentBulkCloneView(TestCase):
+
+    def test_post_to_view_clones_experiments(self):
+        experiment_1 = ExperimentFactory.create_with_variants(
+            name="great experiment", slug="great-experiment"
+        )
+        experiment_2 = ExperimentFactory.create_with_variants(
+            name="good experiment", slug="good-experiment"
+        )
+        user_email = "user@example.com"
+
+        data = json.dumps(
+            {
+                "experiments": [
+                    {"slug": experiment_1.slug, "name": "great relaunch"},
+                    {"slug": experiment_2.slug, "name": "good relaunch"},
+                ]
+            }
+        )
+
+        response = self.client.post(
+            reverse("experiments-api-bulk-clone"),
+            data,
+            content_type="application/json",
+            **{settings.OPENIDC_EMAIL_HEADER: user_email},
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            response.json(),
+            [
+                {
+                    "name": "great relaunch",
+                    "clone_url": "/experiments/great-relaunch/",
+                },
+                {
+                    "name": "good relaunch",
+                    "clone_url": "/experiments/good-relaunch/",
+                },
+            ],
+        )
+        self.assertEqual(
+            Experiment.objects.get(slug="great-relaunch").parent, experiment_1
+        )
+        self.assertEqual(
+            Experiment.objects.get(slug="good-relaunch").parent, experiment_2
+        )
+
+    def test_post_to_view_rejects_unknown_experiment(self):
+        user_email = "user@example.com"
+
+        data = json.dumps(
+            {"experiments": [{"slug": "unknown", "name": "relaunch"}]}
+        )
+
+        response = self.client.post(
+            reverse("experiments-api-bulk-clone"),
+            data,
+            content_type="application/json",
+            **{settings.OPENIDC_EMAIL_HEADER: user_email},
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Experiment.objects.filter(name="relaunch").exists())
+
+
+class TestExperimentOwnerListView(TestCase):
+
+    def setUp(self):
+        self.user_email = "user@example.com"
+        self.owner_1 = UserFactory.create(email="alice@example.com")
+        self.owner_2 = UserFactory.create(email="bob@example.com")
+        self.non_owner = UserFactory.create(email="alex@example.com")
+
+        ExperimentFactory.create(owner=self.owner_1)
+        ExperimentFactory.create(owner=self.owner_2)
+
+    def get_owners(self, params):
+        response = self.client.get(
+            "{url}?{params}".format(
+                url=reverse("experiments-api-owners"), params=urlencode(params)
+            ),
+            **{settings.OPENIDC_EMAIL_HEADER: self.user_email},
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_returns_owners_matching_prefix(self):
+        self.assertEqual(
+            self.get_owners({"search": "AL"}),
+            [{"id": self.owner_1.id, "email": "alice@example.com"}],
+        )
+
+    def test_returns_all_owners_without_search(self):
+        self.assertEqual(
+            [owner["email"] for owner in self.get_owners({})],
+            ["alice@example.com", "bob@example.com"],
+        )
+
+    def test_returns_non_owners_when_not_owned(self):
+        self.assertEqual(
+            [
+                owner["email"]
+                for owner in self.get_owners(
+                    {"search": "al", "owned": "false"}
+                )
+            ],
+            ["alex@example.com", "alice@example.com"],
+        )
+
+    @override_settings(EXPERIMENTS_OWNER_AUTOCOMPLETE_LIMIT=1)
+    def test_limits_results(self):
+        self.assertEqual(len(self.get_owners({})), 1)
@@ -1,11 +1,11 @@
 import mock
-import requests
 from django.test import TestCase
 from django.conf import settings
 
 from experimenter.experiments.models import Experiment
 from experimenter.experiments.bugzilla import (
     BugzillaError,
+    client,
     create_experiment_bug,
     format_bug_body,
     make_bugzilla_call,
@@ -352,14 +352,14 @@ class TestMakeBugzillaCall(MockBugzillaMixin, TestCase):
         mock_response.status_code = 400
         self.mock_bugzilla_requests_post.return_value = mock_response
 
-        response_data = make_bugzilla_call("/url/", requests.post, data={})
+        response_data = make_bugzilla_call("/url/", client.post, data={})
         self.assertEqual(response_data, mock_response_data)
 
     def test_json_parse_error_raises_bugzilla_error(self):
         self.mock_bugzilla_requests_post.side_effect = ValueError()
 
         with self.assertRaises(BugzillaError):
-            make_bugzilla_call("/url/", requests.post, data={})
+            make_bugzilla_call("/url/", client.post, data={})
 
 
 class TestMakePutBugzillaCall(MockBugzillaMixin, TestCase):
@@ -372,10 +372,10 @@ class TestMakePutBugzillaCall(MockBugzillaMixin, TestCase):
         mock_response.status_code = 400
         self.mock_bugzilla_requests_put.return_value = mock_response
 
-        response_data = make_bugzilla_call("/url/", requests.put, data={})
+        response_data = make_bugzilla_call("/url/", client.put, data={})
         self.assertEqual(response_data, mock_response_data)
 
     def test_json_parse_error_raises_bugzilla_error(self):
         self.mock_bugzilla_requests_put.side_effect = ValueError()
         with self.assertRaises(BugzillaError):
-            make_bugzilla_call("/url/", requests.put, data={})
+            make_bugzilla_call("/url/", client.put, data={})
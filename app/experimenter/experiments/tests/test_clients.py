@@ -0,0 +1,92 @@
+import markus
+import mock
+
+from django.conf import settings
+from django.test import TestCase
+from markus.testing import MetricsMock
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import RequestHistory, Retry
+
+from experimenter.experiments.clients import PooledHTTPClient
+
+
+class TestPooledHTTPClient(TestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        self.client = PooledHTTPClient("test")
+        self.url = "https://example.com/api/"
+
+        mock_send_patcher = mock.patch.object(HTTPAdapter, "send")
+        self.mock_send = mock_send_patcher.start()
+        self.addCleanup(mock_send_patcher.stop)
+
+        self.mock_response = mock.Mock()
+        self.mock_response.history = []
+        self.mock_response.is_redirect = False
+        self.mock_response.raw.retries = None
+        self.mock_send.return_value = self.mock_response
+
+    def test_session_is_reused_between_calls(self):
+        session = self.client.session
+
+        self.client.get(self.url)
+        self.client.get(self.url)
+
+        self.assertIs(self.client.session, session)
+        self.assertEqual(self.mock_send.call_count, 2)
+
+    def test_session_mounts_pooled_adapter_with_retries(self):
+        adapter = self.client.session.get_adapter(self.url)
+
+        self.assertEqual(adapter._pool_maxsize, settings.HTTP_POOL_SIZE)
+        self.assertEqual(adapter.max_retries.total, settings.HTTP_MAX_RETRIES)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertFalse(adapter.max_retries.raise_on_status)
+
+    def test_request_applies_default_timeouts(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response, self.mock_response)
+        self.assertEqual(
+            self.mock_send.call_args[1]["timeout"],
+            (settings.HTTP_CONNECT_TIMEOUT, settings.HTTP_READ_TIMEOUT),
+        )
+
+    def test_request_allows_timeout_override(self):
+        self.client.post(self.url, {"key": "value"}, timeout=1)
+
+        self.assertEqual(self.mock_send.call_args[1]["timeout"], 1)
+        request = self.mock_send.call_args[0][0]
+        self.assertEqual(request.method, "POST")
+        self.assertEqual(request.body, "key=value")
+
+    def test_request_records_latency(self):
+        with MetricsMock() as mm:
+            self.client.put(self.url, {"key": "value"})
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.HISTOGRAM, "experiments.clients.test.latency"
+                )
+            )
+            self.assertFalse(
+                mm.has_record(markus.INCR, "experiments.clients.test.retries")
+            )
+
+    def test_request_records_retries(self):
+        history = (
+            RequestHistory("GET", self.url, None, 503, None),
+            RequestHistory("GET", self.url, None, 503, None),
+        )
+        self.mock_response.raw.retries = Retry(total=3, history=history)
+
+        with MetricsMock() as mm:
+            self.client.get(self.url)
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR, "experiments.clients.test.retries", value=2
+                )
+            )
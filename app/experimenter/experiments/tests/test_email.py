@@ -1,3 +1,6 @@
+from smtplib import SMTPException
+
+import mock
 from django.test import TestCase
 from django.conf import settings
 from django.core import mail
@@ -8,6 +11,8 @@ from experimenter.experiments.email import (
     send_experiment_launch_email,
     send_experiment_ending_email,
     send_enrollment_pause_email,
+    build_experiment_ending_email,
+    send_emails,
 )
 from experimenter.experiments.tests.factories import (
     ExperimentFactory,
@@ -233,3 +238,42 @@ class TestStatusUpdateEmail(TestCase):
             [self.experiment.owner.email, self.subscribing_user.email],
         )
         self.assertIn("May 6, 2019", sent_email.body)
+
+
+class TestSendEmails(TestCase):
+
+    def test_emails_sent_before_a_failure_are_recorded(self):
+        experiments = ExperimentFactory.create_batch(
+            3,
+            proposed_start_date=date(2019, 5, 1),
+            proposed_enrollment=5,
+            proposed_duration=10,
+        )
+        emails = [
+            build_experiment_ending_email(experiment)
+            for experiment in experiments
+        ]
+
+        sent = []
+
+        def send_messages(messages):
+            if len(sent) == 2:
+                raise SMTPException()
+            sent.extend(messages)
+            return len(messages)
+
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=send_messages,
+        ):
+            with self.assertRaises(SMTPException):
+                send_emails(emails)
+
+        self.assertEqual(len(sent), 2)
+        for experiment in experiments[:2]:
+            self.assertTrue(
+                experiment.emails.filter(
+                    type=ExperimentConstants.EXPERIMENT_ENDS
+                ).exists()
+            )
+        self.assertFalse(experiments[2].emails.exists())
@@ -1,11 +1,14 @@
 import datetime
 import decimal
 import json
+import mock
 
 from django import forms
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from django.utils.text import slugify
 from faker import Factory as FakerFactory
@@ -219,6 +222,65 @@ class TestChangeLogMixin(MockRequestMixin, TestCase):
         self.assertEqual(change.old_status, old_status)
         self.assertEqual(change.new_status, new_status)
 
+    def test_mixin_only_serializes_form_fields(self):
+        experiment = ExperimentFactory.create_with_variants()
+
+        class TestForm(ChangeLogMixin, forms.ModelForm):
+
+            class Meta:
+                model = Experiment
+                fields = ("name", "status")
+
+        form = TestForm(
+            request=self.request,
+            data={"name": "New Name", "status": experiment.status},
+            instance=experiment,
+        )
+
+        self.assertEqual(set(form.old_serialized_vals), {"name"})
+        self.assertTrue(form.is_valid())
+
+        form.save()
+
+        change = experiment.changes.latest()
+        self.assertEqual(change.old_values, {"name": experiment.name})
+        self.assertEqual(change.new_values, {"name": "New Name"})
+
+    def test_mixin_reuses_prefetched_changes(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT
+        )
+        experiment = Experiment.objects.get_prefetched().get(id=experiment.id)
+
+        class TestForm(ChangeLogMixin, forms.ModelForm):
+
+            class Meta:
+                model = Experiment
+                fields = ("status",)
+
+        form = TestForm(
+            request=self.request,
+            data={"status": Experiment.STATUS_REVIEW},
+            instance=experiment,
+        )
+        self.assertTrue(form.is_valid())
+
+        with CaptureQueriesContext(connection) as queries:
+            form.save()
+
+        self.assertFalse(
+            [
+                query
+                for query in queries
+                if query["sql"].startswith("SELECT")
+                and "experimentchangelog" in query["sql"]
+            ]
+        )
+
+        change = experiment.changes.latest()
+        self.assertEqual(change.old_status, Experiment.STATUS_DRAFT)
+        self.assertEqual(change.new_status, Experiment.STATUS_REVIEW)
+
     def test_changelog_values(self):
         experiment = Experiment()
         experiment.save()
@@ -641,6 +703,19 @@ class TestExperimentOverviewForm(MockRequestMixin, TestCase):
         form = ExperimentOverviewForm(request=self.request, data=self.data)
         self.assertFalse(form.is_valid())
 
+    def test_owner_widget_renders_only_selected_owner(self):
+        other_user = UserFactory.create()
+
+        form = ExperimentOverviewForm(request=self.request, data=self.data)
+        html = str(form["owner"])
+
+        self.assertIn('value="{id}" selected'.format(id=self.user.id), html)
+        self.assertNotIn('value="{id}"'.format(id=other_user.id), html)
+        self.assertIn(
+            'data-autocomplete-url="/api/v1/experiments/owners/?owned=false"',
+            html,
+        )
+
 
 def get_variants_form_data():
     return {
@@ -796,6 +871,22 @@ class TestExperimentVariantsBaseForm(MockRequestMixin, TestCase):
             branch2.description, self.data["variants-2-description"]
         )
 
+    def test_formset_refreshes_readiness_once(self):
+        form = self.form_class(
+            request=self.request, data=self.data, instance=self.experiment
+        )
+
+        self.assertTrue(form.is_valid())
+        self.assertFalse(self.experiment.completed_variants)
+
+        with mock.patch.object(Experiment, "refresh_variants") as refresh:
+            experiment = form.save()
+
+        refresh.assert_not_called()
+        self.assertTrue(
+            Experiment.objects.get(pk=experiment.pk).completed_variants
+        )
+
     def test_formset_edits_existing_variants(self):
         form = self.form_class(
             request=self.request, data=self.data, instance=self.experiment
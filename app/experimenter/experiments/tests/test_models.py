@@ -2,9 +2,12 @@ import datetime
 import json
 
 from django.conf import settings
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
+from experimenter.base.tests.factories import CountryFactory, LocaleFactory
 from experimenter.openidc.tests.factories import UserFactory
 from experimenter.experiments.models import (
     Experiment,
@@ -16,6 +19,7 @@ from experimenter.experiments.tests.factories import (
     ExperimentFactory,
     ExperimentChangeLogFactory,
     ExperimentCommentFactory,
+    ExperimentVariantFactory,
 )
 
 
@@ -41,7 +45,11 @@ class TestExperimentManager(TestCase):
         )
 
         self.assertEqual(
-            list(Experiment.objects.order_by("-latest_change")),
+            list(
+                Experiment.objects.annotate(
+                    latest_change=Experiment.latest_change_expression()
+                ).order_by("-latest_change")
+            ),
             [experiment2, experiment1],
         )
 
@@ -52,10 +60,277 @@ class TestExperimentManager(TestCase):
         )
 
         self.assertEqual(
-            list(Experiment.objects.order_by("-latest_change")),
+            list(
+                Experiment.objects.annotate(
+                    latest_change=Experiment.latest_change_expression()
+                ).order_by("-latest_change")
+            ),
             [experiment1, experiment2],
         )
 
+    def test_default_queryset_does_not_aggregate_change_log(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_LIVE
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            fetched = Experiment.objects.get(id=experiment.id)
+
+        self.assertNotIn("experimentchangelog", queries[0]["sql"])
+        self.assertNotIn("GROUP BY", queries[0]["sql"])
+        self.assertFalse(hasattr(fetched, "latest_change"))
+
+    def test_invalidate_recipes_bumps_recipe_version(self):
+        experiment1 = ExperimentFactory.create()
+        experiment2 = ExperimentFactory.create()
+        experiment1.refresh_from_db()
+        experiment2.refresh_from_db()
+        version1 = experiment1.recipe_version
+        version2 = experiment2.recipe_version
+
+        Experiment.objects.invalidate_recipes(pk=experiment1.pk)
+
+        experiment1.refresh_from_db()
+        experiment2.refresh_from_db()
+        self.assertEqual(experiment1.recipe_version, version1 + 1)
+        self.assertEqual(experiment2.recipe_version, version2)
+
+    def test_save_from_stale_instance_keeps_recipe_version(self):
+        experiment = ExperimentFactory.create()
+        stale = Experiment.objects.get(pk=experiment.pk)
+        version = stale.recipe_version
+
+        experiment.save()
+        stale.save()
+
+        stale.refresh_from_db()
+        self.assertEqual(stale.recipe_version, version + 2)
+
+
+class TestExperimentManagerBenchmark(TestCase):
+
+    def plan_cost(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+            plan = cursor.fetchone()[0]
+        return plan[0]["Plan"]["Total Cost"]
+
+    def test_default_queryset_costs_less_than_latest_change(self):
+        for status, _ in Experiment.STATUS_CHOICES:
+            for i in range(5):
+                ExperimentFactory.create_with_status(status)
+
+        experiment = Experiment.objects.last()
+
+        plain_cost = self.plan_cost(
+            Experiment.objects.filter(id=experiment.id)
+        )
+        annotated_cost = self.plan_cost(
+            Experiment.objects.annotate(
+                latest_change=Experiment.latest_change_expression()
+            ).filter(id=experiment.id)
+        )
+
+        self.assertLess(plain_cost, annotated_cost)
+
+
+class TestExperimentActualDates(TestCase):
+
+    def test_update_actual_dates_backfills_from_change_log(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_COMPLETE
+        )
+        start_change = experiment.changes.get(
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+        )
+        end_change = experiment.changes.get(
+            old_status=Experiment.STATUS_LIVE,
+            new_status=Experiment.STATUS_COMPLETE,
+        )
+        Experiment.objects.filter(id=experiment.id).update(
+            actual_start_date=None, actual_end_date=None
+        )
+
+        Experiment.objects.update_actual_dates()
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(
+            experiment.actual_start_date, start_change.changed_on.date()
+        )
+        self.assertEqual(
+            experiment.actual_end_date, end_change.changed_on.date()
+        )
+
+    def test_earliest_transition_is_used(self):
+        experiment = ExperimentFactory.create()
+        now = timezone.now()
+        ExperimentChangeLogFactory.create(
+            experiment=experiment,
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+            changed_on=now,
+        )
+        ExperimentChangeLogFactory.create(
+            experiment=experiment,
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+            changed_on=now - datetime.timedelta(days=3),
+        )
+
+        self.assertEqual(
+            experiment.actual_start_date,
+            (now - datetime.timedelta(days=3)).date(),
+        )
+
+    def test_editing_a_change_updates_dates(self):
+        change = ExperimentChangeLogFactory.create(
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+        )
+        change.old_status = Experiment.STATUS_DRAFT
+        change.new_status = Experiment.STATUS_REVIEW
+        change.save()
+
+        experiment = Experiment.objects.get(id=change.experiment.id)
+        self.assertIsNone(experiment.actual_start_date)
+
+    def test_deleting_a_change_updates_dates(self):
+        change = ExperimentChangeLogFactory.create(
+            old_status=Experiment.STATUS_LIVE,
+            new_status=Experiment.STATUS_COMPLETE,
+        )
+        experiment = change.experiment
+        self.assertIsNotNone(experiment.actual_end_date)
+
+        change.delete()
+
+        self.assertIsNone(experiment.actual_end_date)
+        self.assertIsNone(
+            Experiment.objects.get(id=experiment.id).actual_end_date
+        )
+
+    def test_saving_stale_experiment_keeps_dates(self):
+        experiment = ExperimentFactory.create()
+        stale_experiment = Experiment.objects.get(id=experiment.id)
+        change = ExperimentChangeLogFactory.create(
+            experiment=experiment,
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+        )
+
+        stale_experiment.name = "A new name"
+        stale_experiment.save()
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(experiment.name, "A new name")
+        self.assertEqual(
+            experiment.actual_start_date, change.changed_on.date()
+        )
+
+    def test_saving_new_experiment_with_explicit_pk_inserts_it(self):
+        experiment = ExperimentFactory.build(
+            pk=12345, owner=UserFactory.create()
+        )
+
+        experiment.save()
+
+        self.assertTrue(Experiment.objects.filter(pk=12345).exists())
+
+
+class TestExperimentDateExpressions(TestCase):
+
+    def test_expressions_match_python_properties(self):
+        for status, _ in Experiment.STATUS_CHOICES:
+            ExperimentFactory.create_with_status(status)
+        ExperimentFactory.create(proposed_start_date=None)
+        ExperimentFactory.create(proposed_enrollment=None)
+        ExperimentFactory.create(proposed_duration=0, proposed_enrollment=0)
+
+        experiments = Experiment.objects.annotate(
+            annotated_start_date=Experiment.start_date_expression(),
+            annotated_enrollment_end_date=(
+                Experiment.enrollment_end_date_expression()
+            ),
+            annotated_end_date=Experiment.end_date_expression(),
+        )
+
+        for experiment in experiments:
+            self.assertEqual(
+                experiment.annotated_start_date, experiment.start_date
+            )
+            self.assertEqual(
+                experiment.annotated_enrollment_end_date,
+                experiment.enrollment_end_date,
+            )
+            self.assertEqual(
+                experiment.annotated_end_date, experiment.end_date
+            )
+
+
+class TestExperimentSearchVector(TestCase):
+
+    def search(self, value):
+        return Experiment.objects.filter(search_vector=value)
+
+    def test_search_vector_set_on_create(self):
+        experiment = ExperimentFactory.create(name="Unusual Giraffe")
+        self.assertEqual(list(self.search("giraffe")), [experiment])
+
+    def test_search_vector_updated_on_save(self):
+        experiment = ExperimentFactory.create(objectives="Unusual Giraffe")
+
+        experiment.objectives = "Unusual Penguin"
+        experiment.save()
+
+        self.assertFalse(self.search("giraffe").exists())
+        self.assertEqual(list(self.search("penguin")), [experiment])
+
+    def test_search_vector_not_updated_for_unsearched_fields(self):
+        experiment = ExperimentFactory.create(name="Unusual Giraffe")
+        Experiment.objects.filter(pk=experiment.pk).update(search_vector=None)
+
+        experiment.status = Experiment.STATUS_REVIEW
+        experiment.save(update_fields=["status"])
+
+        experiment.refresh_from_db()
+        self.assertIsNone(experiment.search_vector)
+
+    def test_search_vector_not_updated_when_searched_fields_unchanged(self):
+        experiment = ExperimentFactory.create(name="Unusual Giraffe")
+        Experiment.objects.filter(pk=experiment.pk).update(search_vector=None)
+        experiment = Experiment.objects.get(pk=experiment.pk)
+
+        experiment.status = Experiment.STATUS_REVIEW
+        experiment.save()
+
+        experiment.refresh_from_db()
+        self.assertIsNone(experiment.search_vector)
+
+        experiment.name = "Unusual Penguin"
+        experiment.save()
+
+        self.assertEqual(list(self.search("penguin")), [experiment])
+
+    def test_search_vector_includes_owner_email(self):
+        owner = UserFactory.create(email="zebra@example.com")
+        experiment = ExperimentFactory.create(owner=owner)
+        self.assertEqual(list(self.search("zebra@example.com")), [experiment])
+
+    def test_update_search_vectors_filters_experiments(self):
+        experiment1 = ExperimentFactory.create()
+        experiment2 = ExperimentFactory.create()
+        Experiment.objects.update(search_vector=None)
+
+        updated = Experiment.objects.update_search_vectors(pk=experiment1.pk)
+
+        self.assertEqual(updated, 1)
+        experiment1.refresh_from_db()
+        experiment2.refresh_from_db()
+        self.assertIsNotNone(experiment1.search_vector)
+        self.assertIsNone(experiment2.search_vector)
+
 
 class TestExperimentModel(TestCase):
 
@@ -1080,6 +1355,57 @@ class TestExperimentModel(TestCase):
 
         self.assertFalse(experiment.is_ready_to_launch)
 
+    def test_readiness_stored_on_save(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW
+        )
+
+        stored = Experiment.objects.values_list("readiness", flat=True).get(
+            pk=experiment.pk
+        )
+        self.assertEqual(stored, experiment.compute_readiness())
+        self.assertTrue(stored["completed_all_sections"])
+
+    def test_readiness_refreshed_when_variants_change(self):
+        experiment = ExperimentFactory.create()
+        self.assertFalse(experiment.completed_variants)
+
+        variant = ExperimentVariantFactory.create(experiment=experiment)
+        self.assertTrue(
+            Experiment.objects.get(pk=experiment.pk).completed_variants
+        )
+
+        variant.delete()
+        self.assertFalse(
+            Experiment.objects.get(pk=experiment.pk).completed_variants
+        )
+
+    def test_readiness_computed_when_not_stored(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW
+        )
+        Experiment.objects.filter(pk=experiment.pk).update(readiness=None)
+
+        experiment = Experiment.objects.get(pk=experiment.pk)
+
+        self.assertTrue(experiment.completed_all_sections)
+        self.assertEqual(
+            experiment.get_all_required_reviews(),
+            experiment.compute_readiness()["required_reviews"],
+        )
+
+    def test_readiness_properties_do_not_query(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW
+        )
+        experiment = Experiment.objects.get(pk=experiment.pk)
+
+        with self.assertNumQueries(0):
+            experiment.completed_variants
+            experiment.completed_all_sections
+            experiment.is_ready_to_launch
+            experiment.get_all_required_reviews()
+
     def test_completed_results_returns_true_if_any_results(self):
         experiment = ExperimentFactory.create(
             results_initial="The results here were great."
@@ -1150,6 +1476,37 @@ class TestExperimentModel(TestCase):
 
         self.assertEqual(experiment.firefox_min_version_integer, 57)
 
+    def test_version_integers_updated_on_save(self):
+        experiment = ExperimentFactory(
+            firefox_min_version="57.0", firefox_max_version=""
+        )
+        self.assertIsNone(experiment.firefox_max_version_integer)
+
+        experiment.firefox_min_version = "58.0"
+        experiment.firefox_max_version = "60.0"
+        experiment.save()
+
+        experiment.refresh_from_db()
+        self.assertEqual(experiment.firefox_min_version_integer, 58)
+        self.assertEqual(experiment.firefox_max_version_integer, 60)
+
+    def test_version_integers_updated_with_update_fields(self):
+        experiment = ExperimentFactory(
+            firefox_min_version="57.0", firefox_max_version="59.0"
+        )
+
+        experiment.firefox_max_version = "61.0"
+        experiment.save(update_fields=["firefox_max_version"])
+
+        experiment.refresh_from_db()
+        self.assertEqual(experiment.firefox_max_version_integer, 61)
+
+    def test_version_integer_parses_major_version(self):
+        self.assertEqual(Experiment.version_integer("67.0b"), 67)
+        self.assertEqual(Experiment.version_integer("100.0"), 100)
+        self.assertIsNone(Experiment.version_integer(""))
+        self.assertIsNone(Experiment.version_integer(None))
+
     def test_experiment_population_returns_correct_string(self):
         experiment = ExperimentFactory(
             population_percent="0.5",
@@ -1181,6 +1538,26 @@ class TestExperimentModel(TestCase):
             ],
         )
 
+    def test_get_locales_and_countries_return_linked_rows(self):
+        locale = LocaleFactory.create(code="de", name="German")
+        country = CountryFactory.create(code="DE", name="Germany")
+        LocaleFactory.create(code="fr", name="French")
+        experiment = ExperimentFactory.create(
+            locales=[locale], countries=[country]
+        )
+
+        self.assertEqual(experiment.get_locales(), [locale])
+        self.assertEqual(experiment.get_countries(), [country])
+
+    def test_get_locales_uses_prefetched_locales(self):
+        experiment = ExperimentFactory.create()
+        experiment = Experiment.objects.get_prefetched().get(id=experiment.id)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                experiment.get_locales(), list(experiment.locales.all())
+            )
+
     def test_clone(self):
         user_1 = UserFactory.create()
         user_2 = UserFactory.create()
@@ -1237,6 +1614,8 @@ class TestExperimentModel(TestCase):
         self.assertFalse(cloned_experiment.review_ux)
         self.assertFalse(cloned_experiment.addon_experiment_id)
         self.assertFalse(cloned_experiment.addon_release_url)
+        self.assertIsNone(cloned_experiment.actual_start_date)
+        self.assertIsNone(cloned_experiment.actual_end_date)
 
         self.assertEqual(cloned_experiment.changes.count(), 1)
 
@@ -1244,6 +1623,67 @@ class TestExperimentModel(TestCase):
 
         self.assertEqual(change.old_status, None)
         self.assertEqual(change.new_status, experiment.STATUS_DRAFT)
+        self.assertEqual(change.changed_by, user_2)
+
+        self.assertEqual(
+            set(
+                cloned_experiment.variants.values_list(
+                    "slug", "is_control", "ratio", "value"
+                )
+            ),
+            set(
+                experiment.variants.values_list(
+                    "slug", "is_control", "ratio", "value"
+                )
+            ),
+        )
+        self.assertEqual(
+            set(cloned_experiment.locales.all()), set(experiment.locales.all())
+        )
+        self.assertEqual(
+            set(cloned_experiment.countries.all()),
+            set(experiment.countries.all()),
+        )
+        self.assertEqual(
+            cloned_experiment.readiness, cloned_experiment.compute_readiness()
+        )
+
+    def test_bulk_clone_clones_the_same_experiment_twice(self):
+        user = UserFactory.create()
+        experiment = ExperimentFactory.create_with_variants()
+
+        first, second = Experiment.objects.bulk_clone(
+            [(experiment, "first clone"), (experiment, "second clone")], user
+        )
+
+        self.assertEqual(first.parent, experiment)
+        self.assertEqual(second.parent, experiment)
+        self.assertEqual(first.variants.count(), experiment.variants.count())
+        self.assertEqual(second.variants.count(), experiment.variants.count())
+        self.assertEqual(experiment.variants.count(), 3)
+
+    def test_bulk_clone_query_count_is_fixed(self):
+        user = UserFactory.create()
+        experiments = [
+            ExperimentFactory.create_with_variants() for i in range(4)
+        ]
+
+        with CaptureQueriesContext(connection) as one_clone:
+            Experiment.objects.bulk_clone([(experiments[0], "clone 0")], user)
+
+        with CaptureQueriesContext(connection) as many_clones:
+            Experiment.objects.bulk_clone(
+                [
+                    (experiment, "clone {i}".format(i=i))
+                    for i, experiment in enumerate(experiments[1:], 1)
+                ],
+                user,
+            )
+
+        self.assertEqual(len(one_clone), len(many_clones))
+        self.assertEqual(
+            Experiment.objects.filter(name__startswith="clone ").count(), 4
+        )
 
 
 class TestExperimentChangeLog(TestCase):
@@ -1,12 +1,17 @@
 import mock
 from requests.exceptions import RequestException, HTTPError
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from experimenter.experiments.normandy import (
     APINormandyError,
     NonsuccessfulNormandyCall,
     NormandyDecodeError,
+    fetch_recipe,
     make_normandy_call,
     get_recipe,
+    get_recipes,
+)
+from experimenter.experiments.tests.fake_normandy import (
+    FakeNormandyServerMixin
 )
 from experimenter.experiments.tests.mixins import MockNormandyMixin
 
@@ -50,3 +55,96 @@ class TestMakeNormandyCall(MockNormandyMixin, TestCase):
     def test_successful_get_recipe_returns_recipe_data(self):
         response_data = get_recipe(1234)
         self.assertTrue(response_data["enabled"])
+
+
+class TestFetchRecipe(MockNormandyMixin, TestCase):
+
+    def test_unconditional_fetch_sends_no_validators(self):
+        response = self.buildMockSuccessEnabledResponse()
+        response.headers = {
+            "ETag": '"abc"',
+            "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+        }
+        self.mock_normandy_requests_get.return_value = response
+
+        recipe_response = fetch_recipe(1234)
+
+        self.assertEqual(
+            self.mock_normandy_requests_get.call_args[1]["headers"], {}
+        )
+        self.assertTrue(recipe_response.modified)
+        self.assertTrue(recipe_response.recipe_data["enabled"])
+        self.assertEqual(recipe_response.etag, '"abc"')
+        self.assertEqual(
+            recipe_response.last_modified, "Wed, 21 Oct 2015 07:28:00 GMT"
+        )
+
+    def test_conditional_fetch_sends_validators(self):
+        fetch_recipe(
+            1234, etag='"abc"', last_modified="Wed, 21 Oct 2015 07:28:00 GMT"
+        )
+
+        self.assertEqual(
+            self.mock_normandy_requests_get.call_args[1]["headers"],
+            {
+                "If-None-Match": '"abc"',
+                "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+            },
+        )
+
+    def test_not_modified_response_returns_unmodified(self):
+        self.mock_normandy_requests_get.return_value = (
+            self.buildMockNotModifiedResponse()
+        )
+
+        recipe_response = fetch_recipe(1234, etag='"abc"')
+
+        self.assertFalse(recipe_response.modified)
+        self.assertIsNone(recipe_response.recipe_data)
+        self.assertEqual(recipe_response.etag, '"abc"')
+
+
+@override_settings(NORMANDY_API_RECIPE_LIST_PAGE_SIZE=2)
+class TestGetRecipes(FakeNormandyServerMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        for recipe_id in range(1, 8):
+            self.fake_normandy_recipes[recipe_id] = {
+                "enabled": True,
+                "revision": recipe_id,
+            }
+
+    def test_returns_requested_recipes(self):
+        recipes = get_recipes([2, 5])
+
+        self.assertEqual(
+            recipes,
+            {
+                2: {"enabled": True, "revision": 2},
+                5: {"enabled": True, "revision": 5},
+            },
+        )
+
+    def test_stops_paging_once_all_recipes_found(self):
+        get_recipes([1, 3])
+
+        self.assertEqual(self.fake_normandy.request_count, 2)
+
+    def test_missing_recipes_are_omitted(self):
+        recipes = get_recipes([1, 99])
+
+        self.assertEqual(list(recipes.keys()), [1])
+        self.assertEqual(self.fake_normandy.request_count, 4)
+
+    def test_no_recipe_ids_makes_no_requests(self):
+        self.assertEqual(get_recipes([]), {})
+        self.assertEqual(self.fake_normandy.request_count, 0)
+
+    def test_fetch_recipe_from_fake_server(self):
+        recipe_response = fetch_recipe(3)
+
+        self.assertEqual(
+            recipe_response.recipe_data, {"enabled": True, "revision": 3}
+        )
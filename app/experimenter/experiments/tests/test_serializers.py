@@ -30,6 +30,7 @@ from experimenter.experiments.serializers import (
     LocaleSerializer,
     ExperimentChangeLogSerializer,
     ExperimentCloneSerializer,
+    ExperimentBulkCloneSerializer,
 )
 
 from experimenter.experiments.tests.mixins import MockRequestMixin
@@ -603,3 +604,61 @@ class TestCloneSerializer(MockRequestMixin, TestCase):
         self.assertEqual(
             serializer.data["clone_url"], "/experiments/best-experiment/"
         )
+
+
+class TestBulkCloneSerializer(MockRequestMixin, TestCase):
+
+    def test_bulk_clone_serializer_rejects_duplicate_names(self):
+        experiment = ExperimentFactory.create()
+        serializer = ExperimentBulkCloneSerializer(
+            data={
+                "experiments": [
+                    {"slug": experiment.slug, "name": "relaunch"},
+                    {"slug": experiment.slug, "name": "Relaunch"},
+                ]
+            }
+        )
+
+        self.assertFalse(serializer.is_valid())
+
+    def test_bulk_clone_serializer_rejects_existing_name(self):
+        experiment = ExperimentFactory.create(name="wonderful experiment")
+        serializer = ExperimentBulkCloneSerializer(
+            data={
+                "experiments": [
+                    {"slug": experiment.slug, "name": "wonderful experiment"}
+                ]
+            }
+        )
+
+        self.assertFalse(serializer.is_valid())
+
+    def test_bulk_clone_serializer_rejects_invalid_name(self):
+        experiment = ExperimentFactory.create()
+        serializer = ExperimentBulkCloneSerializer(
+            data={"experiments": [{"slug": experiment.slug, "name": "@@@@"}]}
+        )
+
+        self.assertFalse(serializer.is_valid())
+
+    def test_bulk_clone_serializer_clones_experiments(self):
+        experiment_1 = ExperimentFactory.create_with_variants()
+        experiment_2 = ExperimentFactory.create_with_variants()
+        serializer = ExperimentBulkCloneSerializer(
+            data={
+                "experiments": [
+                    {"slug": experiment_1.slug, "name": "first relaunch"},
+                    {"slug": experiment_2.slug, "name": "second relaunch"},
+                ]
+            },
+            context={"request": self.request},
+        )
+        self.assertTrue(serializer.is_valid())
+
+        first, second = serializer.save()
+
+        self.assertEqual(first.name, "first relaunch")
+        self.assertEqual(first.parent, experiment_1)
+        self.assertEqual(first.owner, self.user)
+        self.assertEqual(second.name, "second relaunch")
+        self.assertEqual(second.parent, experiment_2)
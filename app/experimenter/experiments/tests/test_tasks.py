@@ -1,8 +1,10 @@
+from smtplib import SMTPException
+
 import markus
 import mock
 
 from django.conf import settings
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 from datetime import date
 
@@ -10,8 +12,15 @@ from markus.testing import MetricsMock
 from requests.exceptions import RequestException
 from django.core import mail
 from experimenter.experiments import bugzilla, tasks
-from experimenter.experiments.models import Experiment, ExperimentEmail
+from experimenter.experiments.models import (
+    Experiment,
+    ExperimentEmail,
+    NormandyRecipeCache,
+)
 from experimenter.experiments.constants import ExperimentConstants
+from experimenter.experiments.tests.fake_normandy import (
+    FakeNormandyServerMixin
+)
 from experimenter.experiments.tests.factories import (
     ExperimentFactory,
     UserFactory,
@@ -288,6 +297,7 @@ class TestUpdateExperimentStatus(
         mock_response.raise_for_status = mock.Mock()
         mock_response.raise_for_status.side_effect = None
         mock_response.status_code = 200
+        mock_response.headers = {}
 
         self.mock_normandy_requests_get.return_value = mock_response
         tasks.update_experiment_info()
@@ -319,6 +329,7 @@ class TestUpdateExperimentStatus(
         mock_response.raise_for_status = mock.Mock()
         mock_response.raise_for_status.side_effect = None
         mock_response.status_code = 200
+        mock_response.headers = {}
 
         self.mock_normandy_requests_get.return_value = mock_response
         tasks.update_experiment_info()
@@ -516,6 +527,114 @@ class TestUpdateExperimentStatus(
             ).exists()
         )
 
+    def test_update_experiment_info_records_phase_timings(self):
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_LIVE, normandy_id=1234
+        )
+
+        with MetricsMock() as mm:
+            tasks.update_experiment_info()
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.TIMING,
+                    "experiments.tasks.update_experiment_info.fetch.timing",
+                )
+            )
+            self.assertTrue(
+                mm.has_record(
+                    markus.TIMING,
+                    "experiments.tasks.update_experiment_info.apply.timing",
+                )
+            )
+
+    def test_fetch_recipes_requests_each_recipe_once(self):
+        recipes = tasks.fetch_recipes([1234, 1235, 1234])
+
+        self.assertEqual(set(recipes.keys()), set([1234, 1235]))
+        self.assertEqual(self.mock_normandy_requests_get.call_count, 2)
+        self.assertTrue(recipes[1234].result().recipe_data["enabled"])
+
+    def test_fetch_recipes_defers_errors_until_result(self):
+        self.setUpMockNormandyFailWithSpecifiedID("1234")
+
+        recipes = tasks.fetch_recipes([1234, 1235])
+
+        with self.assertRaises(KeyError):
+            recipes[1234].result()
+        self.assertTrue(recipes[1235].result().recipe_data["enabled"])
+
+    def test_fetch_recipes_with_no_ids(self):
+        self.assertEqual(tasks.fetch_recipes([]), {})
+        self.mock_normandy_requests_get.assert_not_called()
+
+    def test_unchanged_recipe_is_not_reprocessed(self):
+        NormandyRecipeCache.objects.create(normandy_id=1234, etag='"abc"')
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1234
+        )
+        self.mock_normandy_requests_get.return_value = (
+            self.buildMockNotModifiedResponse()
+        )
+
+        with MetricsMock() as mm:
+            tasks.update_experiment_info()
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.GAUGE,
+                    "experiments.tasks.update_experiment_info."
+                    "recipe_cache.hit_ratio",
+                    value=1.0,
+                )
+            )
+
+        self.assertEqual(
+            self.mock_normandy_requests_get.call_args[1]["headers"],
+            {"If-None-Match": '"abc"'},
+        )
+        experiment = Experiment.objects.get(normandy_id=1234)
+        self.assertEqual(experiment.status, Experiment.STATUS_ACCEPTED)
+
+    def test_changed_recipe_is_processed_and_cached(self):
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1234
+        )
+        response = self.buildMockSuccessEnabledResponse()
+        response.headers = {"ETag": '"def"'}
+        self.mock_normandy_requests_get.return_value = response
+
+        with MetricsMock() as mm:
+            tasks.update_experiment_info()
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.GAUGE,
+                    "experiments.tasks.update_experiment_info."
+                    "recipe_cache.hit_ratio",
+                    value=0.0,
+                )
+            )
+
+        experiment = Experiment.objects.get(normandy_id=1234)
+        self.assertEqual(experiment.status, Experiment.STATUS_LIVE)
+
+        cached = NormandyRecipeCache.objects.get(normandy_id=1234)
+        self.assertEqual(cached.etag, '"def"')
+        self.assertTrue(cached.approved_revision["enabled"])
+
+    def test_failed_recipe_is_not_cached(self):
+        self.setUpMockNormandyFailWithSpecifiedID("1234")
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1234
+        )
+
+        tasks.update_experiment_info()
+
+        self.assertFalse(
+            NormandyRecipeCache.objects.filter(normandy_id=1234).exists()
+        )
+
     def test_experiment_status_updates_by_existing_user(self):
         User = get_user_model()
         user = UserFactory(email="dev@example.com")
@@ -633,6 +752,188 @@ class TestUpdateExperimentStatus(
 
         self.assertEqual(len(mail.outbox), 1)
 
+    def test_doesnt_send_period_ending_emails_without_normandy_id(self):
+        ExperimentFactory.create(
+            status=Experiment.STATUS_LIVE,
+            normandy_id=None,
+            proposed_start_date=date.today(),
+            proposed_enrollment=4,
+            proposed_duration=4,
+        )
+
+        tasks.update_experiment_info()
+
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_doesnt_send_period_ending_emails_if_recipe_fetch_failed(self):
+        experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_LIVE,
+            normandy_id=1234,
+            proposed_start_date=date.today(),
+            proposed_enrollment=4,
+            proposed_duration=4,
+        )
+        self.mock_normandy_requests_get.side_effect = RequestException()
+
+        tasks.update_experiment_info()
+
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertFalse(experiment.emails.exists())
+
+    def test_period_ending_emails_query_count_independent_of_live(self):
+        for i in range(10):
+            ExperimentFactory.create(
+                status=Experiment.STATUS_LIVE,
+                normandy_id=1234,
+                proposed_start_date=date.today(),
+                proposed_enrollment=20,
+                proposed_duration=30,
+            )
+        ExperimentFactory.create(
+            status=Experiment.STATUS_LIVE,
+            proposed_start_date=None,
+            proposed_enrollment=None,
+            proposed_duration=None,
+        )
+
+        # One query per email type
+        with self.assertNumQueries(2):
+            self.assertEqual(tasks.build_period_ending_emails(), [])
+
+    def test_period_ending_emails_sent_over_one_connection(self):
+        for normandy_id in (1234, 1111):
+            ExperimentFactory.create(
+                status=Experiment.STATUS_LIVE,
+                normandy_id=normandy_id,
+                proposed_start_date=date.today(),
+                proposed_enrollment=4,
+                proposed_duration=4,
+            )
+
+        with mock.patch(
+            "experimenter.experiments.email.get_connection",
+            wraps=tasks.email.get_connection,
+        ) as mock_get_connection:
+            tasks.update_experiment_info()
+
+        mock_get_connection.assert_called_once()
+        self.assertEqual(len(mail.outbox), 4)
+        self.assertEqual(
+            ExperimentEmail.objects.filter(
+                type__in=(
+                    ExperimentConstants.EXPERIMENT_ENDS,
+                    ExperimentConstants.EXPERIMENT_PAUSES,
+                )
+            ).count(),
+            4,
+        )
+
+
+@override_settings(
+    NORMANDY_BULK_FETCH=True, NORMANDY_API_RECIPE_LIST_PAGE_SIZE=2
+)
+class TestUpdateExperimentStatusBulkFetch(
+    MockRequestMixin, FakeNormandyServerMixin, MockBugzillaMixin, TestCase
+):
+
+    def setUp(self):
+        super().setUp()
+
+        self.fake_normandy_recipes.update(
+            {
+                1: {"enabled": False, "enabled_states": []},
+                2: {"enabled": False, "enabled_states": []},
+                1234: {
+                    "enabled": True,
+                    "enabled_states": [
+                        {"creator": {"email": "dev@example.com"}}
+                    ],
+                    "arguments": {"isEnrollmentPaused": False},
+                },
+            }
+        )
+
+    def test_accepted_experiment_becomes_live(self):
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1234
+        )
+
+        tasks.update_experiment_info()
+
+        experiment = Experiment.objects.get(normandy_id=1234)
+        self.assertEqual(experiment.status, Experiment.STATUS_LIVE)
+        self.assertEqual(self.fake_normandy.request_count, 2)
+        cached = NormandyRecipeCache.objects.get(normandy_id=1234)
+        self.assertEqual(
+            cached.approved_revision, self.fake_normandy_recipes[1234]
+        )
+
+    def test_recipe_matching_cache_is_not_reprocessed(self):
+        NormandyRecipeCache.objects.create(
+            normandy_id=1234,
+            approved_revision=self.fake_normandy_recipes[1234],
+        )
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1234
+        )
+
+        tasks.update_experiment_info()
+
+        experiment = Experiment.objects.get(normandy_id=1234)
+        self.assertEqual(experiment.status, Experiment.STATUS_ACCEPTED)
+
+    def test_missing_recipe_does_not_affect_other_experiments(self):
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1234
+        )
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=999
+        )
+
+        tasks.update_experiment_info()
+
+        self.assertEqual(
+            Experiment.objects.get(normandy_id=1234).status,
+            Experiment.STATUS_LIVE,
+        )
+        self.assertEqual(
+            Experiment.objects.get(normandy_id=999).status,
+            Experiment.STATUS_ACCEPTED,
+        )
+
+
+@override_settings(NORMANDY_API_RECIPE_LIST_PAGE_SIZE=20)
+class TestFetchRecipesBenchmark(FakeNormandyServerMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        self.recipe_ids = list(range(1, 41))
+        for recipe_id in self.recipe_ids:
+            self.fake_normandy_recipes[recipe_id] = {"enabled": True}
+
+    def fetch(self):
+        recipes = tasks.fetch_recipes(self.recipe_ids)
+        return {
+            recipe_id: future.result().recipe_data
+            for recipe_id, future in recipes.items()
+        }
+
+    def test_bulk_fetch_makes_one_request_per_page(self):
+        with override_settings(NORMANDY_BULK_FETCH=False):
+            per_id_recipes = self.fetch()
+        per_id_requests = self.fake_normandy.request_count
+
+        self.fake_normandy.request_count = 0
+
+        with override_settings(NORMANDY_BULK_FETCH=True):
+            bulk_recipes = self.fetch()
+        bulk_requests = self.fake_normandy.request_count
+
+        self.assertEqual(per_id_recipes, bulk_recipes)
+        self.assertEqual(per_id_requests, 40)
+        self.assertEqual(bulk_requests, 2)
+
 
 class TestUpdateResolutionTask(MockRequestMixin, MockBugzillaMixin, TestCase):
 
@@ -692,3 +993,67 @@ class TestUpdateResolutionTask(MockRequestMixin, MockBugzillaMixin, TestCase):
             self.assertEqual(
                 Notification.objects.filters(message=message).exists()
             )
+
+
+class TestSendIntentToShipEmailTask(TestCase):
+
+    def test_task_sends_and_records_email(self):
+        experiment = ExperimentFactory.create_with_variants(
+            review_intent_to_ship=False, status=Experiment.STATUS_REVIEW
+        )
+
+        tasks.send_intent_to_ship_email_task(experiment.id)
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertTrue(
+            experiment.emails.filter(
+                type=ExperimentConstants.INTENT_TO_SHIP_EMAIL_LABEL
+            ).exists()
+        )
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertTrue(experiment.review_intent_to_ship)
+        self.assertEqual(experiment.readiness, experiment.compute_readiness())
+
+    def test_task_skips_email_already_sent(self):
+        experiment = ExperimentFactory.create_with_variants(
+            review_intent_to_ship=True, status=Experiment.STATUS_REVIEW
+        )
+
+        tasks.send_intent_to_ship_email_task(experiment.id)
+
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_failed_send_leaves_review_unmarked(self):
+        experiment = ExperimentFactory.create_with_variants(
+            review_intent_to_ship=False, status=Experiment.STATUS_REVIEW
+        )
+
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=SMTPException(),
+        ):
+            with self.assertRaises(SMTPException):
+                tasks.send_intent_to_ship_email_task(experiment.id)
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertFalse(experiment.review_intent_to_ship)
+        self.assertFalse(experiment.readiness["completed_required_reviews"])
+        self.assertFalse(experiment.emails.exists())
+
+    def test_task_skips_email_claimed_by_another_task(self):
+        experiment = ExperimentFactory.create_with_variants(
+            review_intent_to_ship=False, status=Experiment.STATUS_REVIEW
+        )
+
+        # Another task claims it after this one has loaded the experiment
+        Experiment.objects.get(id=experiment.id).set_review_intent_to_ship(
+            True
+        )
+
+        with mock.patch(
+            "experimenter.experiments.tasks.Experiment.objects.get",
+            return_value=experiment,
+        ):
+            tasks.send_intent_to_ship_email_task(experiment.id)
+
+        self.assertEqual(len(mail.outbox), 0)
@@ -47,3 +47,28 @@ class TestPaginationUrl(SimpleTestCase):
         )
         rendered_template = template_to_render.render(context)
         self.assertEqual("?foo=bar", rendered_template)
+
+
+class TestCursorUrl(SimpleTestCase):
+
+    def test_it_works(self):
+        context = Context({"request": RequestFactory().get("/")})
+        template_to_render = Template(
+            "{% load experiment_extras %}" '{% cursor_url "after" "abc" %}'
+        )
+        rendered_template = template_to_render.render(context)
+        self.assertEqual("?after=abc", rendered_template)
+
+    def test_replaces_page_and_cursors(self):
+        context = Context(
+            {
+                "request": RequestFactory().get(
+                    "/", {"foo": "bar", "page": 2, "after": "abc"}
+                )
+            }
+        )
+        template_to_render = Template(
+            "{% load experiment_extras %}" '{% cursor_url "before" "xyz" %}'
+        )
+        rendered_template = template_to_render.render(context)
+        self.assertEqual("?foo=bar&amp;before=xyz", rendered_template)
@@ -6,7 +6,10 @@ from urllib.parse import urlencode
 
 import mock
 from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -17,7 +20,11 @@ from experimenter.experiments.forms import (
 )
 from experimenter.experiments.forms import NormandyIdForm
 from experimenter.experiments.models import Experiment
-from experimenter.experiments.tests.factories import ExperimentFactory
+from experimenter.experiments.tests.factories import (
+    ExperimentChangeLogFactory,
+    ExperimentCommentFactory,
+    ExperimentFactory,
+)
 from experimenter.experiments.tests.mixins import (
     MockTasksMixin,
     MockRequestMixin,
@@ -27,6 +34,7 @@ from experimenter.experiments.views import (
     ExperimentFilterset,
     ExperimentFiltersetForm,
     ExperimentFormMixin,
+    ExperimentListView,
     ExperimentOrderingForm,
 )
 
@@ -38,6 +46,16 @@ class TestExperimentFiltersetForm(TestCase):
         form = ExperimentFiltersetForm({"owner": user.id})
         self.assertEqual(form.get_owner_display_value(), str(user))
 
+    def test_get_owner_display_value_reuses_validated_owner(self):
+        user = UserFactory.create()
+        form = ExperimentFilterset(
+            data={"owner": user.id}, queryset=Experiment.objects.all()
+        ).form
+        self.assertTrue(form.is_valid())
+
+        with self.assertNumQueries(0):
+            self.assertEqual(form.get_owner_display_value(), str(user))
+
     def test_get_type_display_value_returns_type_str(self):
         form = ExperimentFiltersetForm({"type": Experiment.TYPE_ADDON})
         self.assertEqual(
@@ -149,6 +167,19 @@ class TestExperimentFilterset(MockRequestMixin, TestCase):
         )
         self.assertEqual(set(filter.qs), set([exp_1, exp_2, exp_3]))
 
+    def test_filters_by_firefox_version_compares_numerically(self):
+        exp_1 = ExperimentFactory.create_with_variants(
+            firefox_min_version="79.0", firefox_max_version="100.0"
+        )
+        ExperimentFactory.create_with_variants(
+            firefox_min_version="58.0", firefox_max_version="62.0"
+        )
+
+        filter = ExperimentFilterset(
+            {"firefox_version": "80.0"}, queryset=Experiment.objects.all()
+        )
+        self.assertEqual(set(filter.qs), set([exp_1]))
+
     def test_filters_by_firefox_channel(self):
         include_channel = Experiment.CHANNEL_CHOICES[1][0]
         exclude_channel = Experiment.CHANNEL_CHOICES[2][0]
@@ -248,6 +279,27 @@ class TestExperimentFilterset(MockRequestMixin, TestCase):
             set(second_response_context["experiments"]), set([exp_3])
         )
 
+    def test_list_search_orders_by_rank(self):
+        user_email = "user@example.com"
+
+        exp_1 = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT,
+            name="Experiment One",
+            objectives="Measure the impact of the otter",
+        )
+        exp_2 = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT, name="Experiment Otter"
+        )
+
+        response_context = self.client.get(
+            "{url}?{params}".format(
+                url=reverse("home"), params=urlencode({"search": "otter"})
+            ),
+            **{settings.OPENIDC_EMAIL_HEADER: user_email},
+        ).context[0]
+
+        self.assertEqual(list(response_context["experiments"]), [exp_2, exp_1])
+
     def test_filters_by_review_in_qa(self):
         exp_1 = ExperimentFactory.create_with_variants(
             review_qa_requested=True, review_qa=False
@@ -564,6 +616,108 @@ class TestExperimentListView(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(set(context["experiments"]), set(experiments))
 
+    def test_list_view_reuses_cached_rows_until_experiment_changes(self):
+        user_email = "user@example.com"
+        cache.clear()
+
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT, name="original name"
+        )
+
+        def get_list_row():
+            response = self.client.get(
+                reverse("home"), **{settings.OPENIDC_EMAIL_HEADER: user_email}
+            )
+            self.assertEqual(response.status_code, 200)
+            return response.context[0]["experiments"][0].list_row
+
+        self.assertEqual(get_list_row(), experiment.get_list_row())
+
+        # An update that skips save() is not seen until the next change
+        Experiment.objects.filter(pk=experiment.pk).update(name="updated name")
+        self.assertEqual(
+            get_list_row()["full_name"], "Pref-Flip: original name"
+        )
+
+        ExperimentChangeLogFactory.create(
+            experiment=experiment,
+            old_status=Experiment.STATUS_DRAFT,
+            new_status=Experiment.STATUS_DRAFT,
+        )
+        self.assertEqual(
+            get_list_row()["full_name"], "Pref-Flip: updated name"
+        )
+
+    def test_list_view_rebuilds_row_after_experiment_save(self):
+        user_email = "user@example.com"
+        cache.clear()
+
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT, population_percent="10.0"
+        )
+
+        self.client.get(
+            reverse("home"), **{settings.OPENIDC_EMAIL_HEADER: user_email}
+        )
+
+        experiment.population_percent = decimal.Decimal("20.0")
+        experiment.save()
+
+        response = self.client.get(
+            reverse("home"), **{settings.OPENIDC_EMAIL_HEADER: user_email}
+        )
+
+        list_row = response.context[0]["experiments"][0].list_row
+        self.assertTrue(list_row["population"].startswith("20% of "))
+
+    def test_list_view_rebuilds_row_after_actual_dates_update(self):
+        user_email = "user@example.com"
+        cache.clear()
+
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_COMPLETE,
+            proposed_start_date=datetime.date(2019, 1, 1),
+        )
+        Experiment.objects.filter(pk=experiment.pk).update(
+            actual_start_date=None, actual_end_date=None
+        )
+
+        def get_list_row():
+            response = self.client.get(
+                reverse("home"), **{settings.OPENIDC_EMAIL_HEADER: user_email}
+            )
+            return response.context[0]["experiments"][0].list_row
+
+        stale_row = get_list_row()
+
+        Experiment.objects.update_actual_dates(pk=experiment.pk)
+
+        experiment = Experiment.objects.get(pk=experiment.pk)
+        self.assertNotEqual(stale_row["dates"], experiment.dates)
+        self.assertEqual(get_list_row()["dates"], experiment.dates)
+
+    def test_list_view_rebuilds_row_after_owner_save(self):
+        user_email = "user@example.com"
+        cache.clear()
+
+        owner = UserFactory.create(username="old@example.com")
+        ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT, owner=owner
+        )
+
+        def get_list_row():
+            response = self.client.get(
+                reverse("home"), **{settings.OPENIDC_EMAIL_HEADER: user_email}
+            )
+            return response.context[0]["experiments"][0].list_row
+
+        self.assertEqual(get_list_row()["owner"], "old@example.com")
+
+        owner.username = "new@example.com"
+        owner.save()
+
+        self.assertEqual(get_list_row()["owner"], "new@example.com")
+
     def test_list_view_filters_and_orders_experiments(self):
         user_email = "user@example.com"
 
@@ -586,12 +740,18 @@ class TestExperimentListView(TestCase):
                 random.choice(Experiment.STATUS_CHOICES)[0]
             )
 
-        filtered_ordered_experiments = Experiment.objects.filter(
-            firefox_channel=filtered_channel,
-            firefox_min_version=filtered_version,
-            owner=filtered_owner,
-            status=filtered_status,
-        ).order_by(ordering)
+        filtered_ordered_experiments = (
+            Experiment.objects.annotate(
+                latest_change=Experiment.latest_change_expression()
+            )
+            .filter(
+                firefox_channel=filtered_channel,
+                firefox_min_version=filtered_version,
+                owner=filtered_owner,
+                status=filtered_status,
+            )
+            .order_by(ordering)
+        )
 
         response = self.client.get(
             "{url}?{params}".format(
@@ -676,6 +836,128 @@ class TestExperimentListView(TestCase):
         self.assertTrue(total_count_regex.search(html))
         self.assertTrue("Page 2" in html)
 
+    def get_all_pages(self, params):
+        user_email = "user@example.com"
+        experiments = []
+        query_counts = []
+
+        while True:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(
+                    "{url}?{params}".format(
+                        url=reverse("home"), params=urlencode(params)
+                    ),
+                    **{settings.OPENIDC_EMAIL_HEADER: user_email},
+                )
+            self.assertEqual(response.status_code, 200)
+            query_counts.append(len(queries))
+
+            context = response.context[0]
+            experiments.extend(context["experiments"])
+
+            page = context["page_obj"]
+            if not page.has_next():
+                return experiments, query_counts, context
+
+            params = dict(params, after=page.next_cursor)
+
+    @mock.patch.object(ExperimentListView, "paginate_by", 3)
+    def test_list_view_pages_through_every_ordering_by_cursor(self):
+        UserFactory.create(email="user@example.com")
+
+        for i in range(8):
+            ExperimentFactory.create_with_status(
+                random.choice(Experiment.STATUS_CHOICES)[0],
+                firefox_channel=random.choice(Experiment.CHANNEL_CHOICES)[0],
+            )
+
+        # Experiments without changes sort with null latest_change
+        for i in range(2):
+            ExperimentFactory.create()
+
+        for ordering, _ in ExperimentOrderingForm.ORDERING_CHOICES:
+            direction = "-" if ordering.startswith("-") else ""
+            expected = list(
+                Experiment.objects.annotate(
+                    latest_change=Experiment.latest_change_expression(),
+                    firefox_channel_sort=Experiment.firefox_channel_sort(),
+                )
+                .filter(archived=False)
+                .order_by(ordering, direction + "pk")
+            )
+
+            experiments, query_counts, context = self.get_all_pages(
+                {"ordering": ordering}
+            )
+
+            self.assertTrue(context["paginator"].is_keyset)
+            self.assertEqual(experiments, expected)
+            self.assertEqual(len(set(query_counts)), 1)
+
+    @mock.patch.object(ExperimentListView, "paginate_by", 3)
+    def test_list_view_previous_cursor_returns_previous_page(self):
+        user_email = "user@example.com"
+
+        for i in range(7):
+            ExperimentFactory.create_with_status(Experiment.STATUS_DRAFT)
+
+        response = self.client.get(
+            reverse("home"), **{settings.OPENIDC_EMAIL_HEADER: user_email}
+        )
+        first_page = list(response.context[0]["experiments"])
+
+        response = self.client.get(
+            "{url}?{params}".format(
+                url=reverse("home"),
+                params=urlencode(
+                    {"after": response.context[0]["page_obj"].next_cursor}
+                ),
+            ),
+            **{settings.OPENIDC_EMAIL_HEADER: user_email},
+        )
+        second_page = response.context[0]["page_obj"]
+        self.assertTrue(second_page.has_previous())
+
+        response = self.client.get(
+            "{url}?{params}".format(
+                url=reverse("home"),
+                params=urlencode({"before": second_page.previous_cursor}),
+            ),
+            **{settings.OPENIDC_EMAIL_HEADER: user_email},
+        )
+        self.assertEqual(list(response.context[0]["experiments"]), first_page)
+        self.assertFalse(response.context[0]["page_obj"].has_previous())
+
+    def test_list_view_invalid_cursor_returns_404(self):
+        user_email = "user@example.com"
+
+        response = self.client.get(
+            "{url}?{params}".format(
+                url=reverse("home"), params=urlencode({"after": "invalid"})
+            ),
+            **{settings.OPENIDC_EMAIL_HEADER: user_email},
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(EXPERIMENTS_APPROXIMATE_COUNT_THRESHOLD=10000)
+    def test_list_view_shows_estimate_above_threshold(self):
+        user_email = "user@example.com"
+
+        ExperimentFactory.create_with_status(Experiment.STATUS_DRAFT)
+
+        with mock.patch(
+            "experimenter.experiments.paginators.estimate_count",
+            return_value=20000,
+        ):
+            response = self.client.get(
+                reverse("home"), **{settings.OPENIDC_EMAIL_HEADER: user_email}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        html = response.content.decode("utf-8")
+        self.assertTrue(re.search(r"About\s+20000\s+Experiments", html))
+
 
 class TestExperimentFormMixin(TestCase):
 
@@ -1190,6 +1472,43 @@ class TestExperimentDetailView(TestCase):
         self.assertFalse(normandy_form.is_valid())
 
 
+class TestExperimentDetailViewQueries(TestCase):
+
+    def setUp(self):
+        self.user_email = "user@example.com"
+        self.user = UserFactory.create(email=self.user_email)
+
+    def get_detail(self, experiment):
+        return self.client.get(
+            reverse("experiments-detail", kwargs={"slug": experiment.slug}),
+            **{settings.OPENIDC_EMAIL_HEADER: self.user_email},
+        )
+
+    def test_query_count_does_not_grow_with_related_objects(self):
+        for status, _ in Experiment.STATUS_CHOICES:
+            small = ExperimentFactory.create_with_status(
+                status, num_variants=1, locales=[], countries=[]
+            )
+            large = ExperimentFactory.create_with_status(
+                status,
+                num_variants=5,
+                subscribers=[self.user, UserFactory.create()],
+            )
+            large.related_to.add(*ExperimentFactory.create_batch(3))
+            for section, _ in Experiment.SECTION_CHOICES:
+                ExperimentCommentFactory.create_batch(
+                    2, experiment=large, section=section
+                )
+
+            with CaptureQueriesContext(connection) as small_queries:
+                response = self.get_detail(small)
+            self.assertEqual(response.status_code, 200)
+
+            with self.assertNumQueries(len(small_queries)):
+                response = self.get_detail(large)
+            self.assertEqual(response.status_code, 200)
+
+
 class TestExperimentStatusUpdateView(MockTasksMixin, TestCase):
 
     def test_view_updates_status_and_redirects(self):
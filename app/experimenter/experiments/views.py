@@ -2,22 +2,17 @@ import django_filters as filters
 from django import forms
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import Q, F, IntegerField
-from django.db.models.functions import Cast
-from django.db.models.expressions import Func, Value
+from django.core.cache import cache
+from django.db.models import Q, F
+from django.http import Http404
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.views.generic import CreateView, DetailView, UpdateView
 from django.views.generic.edit import ModelFormMixin
 from django_filters.views import FilterView
-from django.contrib.postgres.search import (
-    SearchQuery,
-    SearchRank,
-    SearchVector,
-)
+from django.contrib.postgres.search import SearchQuery, SearchRank
 import django_filters.widgets as widgets
 
-from experimenter.experiments.constants import ExperimentConstants
 from experimenter.experiments.forms import (
     ExperimentArchiveForm,
     ExperimentCommentForm,
@@ -31,8 +26,14 @@ from experimenter.experiments.forms import (
     ExperimentVariantsPrefForm,
     NormandyIdForm,
     ExperimentResultsForm,
+    OwnerAutocompleteWidget,
 )
 from experimenter.experiments.models import Experiment
+from experimenter.experiments.paginators import (
+    CountQuerysetPaginator,
+    InvalidCursor,
+    KeysetPaginator,
+)
 
 
 class ExperimentFiltersetForm(forms.ModelForm):
@@ -76,6 +77,13 @@ class ExperimentFiltersetForm(forms.ModelForm):
         return dict(Experiment.TYPE_CHOICES).get(self.data.get("type"))
 
     def get_owner_display_value(self):
+        # Validating the form already looked up the owner
+        if "owner" in getattr(self, "cleaned_data", {}):
+            owner = self.cleaned_data["owner"]
+            if owner is not None:
+                return str(owner)
+            return None
+
         user_id = self.data.get("owner", None)
 
         if user_id is not None:
@@ -144,7 +152,7 @@ class ExperimentFilterset(filters.FilterSet):
     owner = filters.ModelChoiceFilter(
         empty_label="All Owners",
         queryset=get_user_model().objects.all().order_by("email"),
-        widget=forms.Select(attrs={"class": "form-control"}),
+        widget=OwnerAutocompleteWidget(attrs={"class": "form-control"}),
     )
 
     archived = filters.BooleanFilter(
@@ -203,31 +211,11 @@ class ExperimentFilterset(filters.FilterSet):
         fields = ExperimentFiltersetForm.Meta.fields
 
     def filter_search(self, queryset, name, value):
-        vector = SearchVector(
-            "name",
-            "short_description",
-            "owner__email",
-            "slug",
-            "related_work",
-            "addon_experiment_id",
-            "pref_key",
-            "public_name",
-            "public_description",
-            "objectives",
-            "analysis",
-            "analysis_owner",
-            "engineering_owner",
-            "bugzilla_id",
-            "normandy_slug",
-            "data_science_bugzilla_url",
-            "feature_bugzilla_url",
-        )
-
         query = SearchQuery(value)
 
         return (
-            queryset.annotate(rank=SearchRank(vector, query), search=vector)
-            .filter(search=value)
+            queryset.annotate(rank=SearchRank(F("search_vector"), query))
+            .filter(search_vector=query)
             .order_by("-rank")
         )
 
@@ -239,36 +227,39 @@ class ExperimentFilterset(filters.FilterSet):
 
     def version_filter(self, queryset, name, value):
 
+        version = Experiment.version_integer(value)
+
         return queryset.filter(
-            Q(firefox_min_version__lte=value, firefox_max_version__gte=value)
-            | Q(firefox_min_version=value)
+            Q(
+                firefox_min_version_integer__lte=version,
+                firefox_max_version_integer__gte=version,
+            )
+            | Q(firefox_min_version_integer=version)
         )
 
     def date_range_filter(self, queryset, name, value):
 
         date_type = self.form.cleaned_data["experiment_date_field"]
 
-        experiment_date_field = {
-            Experiment.EXPERIMENT_STARTS: "start_date",
-            Experiment.EXPERIMENT_PAUSES: "enrollment_end_date",
-            Experiment.EXPERIMENT_ENDS: "end_date",
-        }[date_type]
-
-        results = []
+        experiment_date = {
+            Experiment.EXPERIMENT_STARTS: Experiment.start_date_expression,
+            Experiment.EXPERIMENT_PAUSES: (
+                Experiment.enrollment_end_date_expression
+            ),
+            Experiment.EXPERIMENT_ENDS: Experiment.end_date_expression,
+        }[date_type]()
 
-        for experiment in queryset.all():
-            date = getattr(experiment, experiment_date_field)
+        # enrollment end dates are optional, so there won't always
+        # be a pause date for an experiment, those are excluded by
+        # the comparisons below
+        queryset = queryset.annotate(experiment_date=experiment_date)
 
-            # enrollment end dates are optional, so there won't always
-            # be a pause date for an experiment
-            if date:
-                if value.start and date < value.start.date():
-                    continue
-                if value.stop and date > value.stop.date():
-                    continue
-                results.append(experiment.id)
+        if value.start:
+            queryset = queryset.filter(experiment_date__gte=value.start.date())
+        if value.stop:
+            queryset = queryset.filter(experiment_date__lte=value.stop.date())
 
-        return queryset.filter(pk__in=results)
+        return queryset
 
     def in_qa_filter(self, queryset, name, value):
         if value:
@@ -290,28 +281,10 @@ class ExperimentFilterset(filters.FilterSet):
 
     def longrunning_filter(self, queryset, name, value):
         if value:
-            return (
-                queryset.exclude(firefox_max_version__exact="")
-                .annotate(
-                    firefox_min_int=Cast(
-                        Func(
-                            F("firefox_min_version"),
-                            Value(ExperimentConstants.VERSION_REGEX.pattern),
-                            function="substring",
-                        ),
-                        IntegerField(),
-                    ),
-                    firefox_max_int=Cast(
-                        Func(
-                            F("firefox_max_version"),
-                            Value(ExperimentConstants.VERSION_REGEX.pattern),
-                            function="substring",
-                        ),
-                        IntegerField(),
-                    ),
-                    version_count=F("firefox_max_int") - F("firefox_min_int"),
+            return queryset.filter(
+                firefox_max_version_integer__gte=(
+                    F("firefox_min_version_integer") + 3
                 )
-                .filter(version_count__gte=3)
             )
 
         return queryset
@@ -347,11 +320,50 @@ class ExperimentListView(FilterView):
     model = Experiment
     template_name = "experiments/list.html"
     paginate_by = settings.EXPERIMENTS_PAGINATE_BY
-    queryset = Experiment.objects.get_prefetched()
+    # Rows are rendered from the list row cache, so only what is shown
+    # outside of it is loaded with the page
+    queryset = Experiment.objects.select_related("owner").prefetch_related(
+        "subscribers"
+    )
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.ordering_form = None
+        self.count_queryset = None
+
+    @staticmethod
+    def set_list_rows(experiments):
+        """
+        Attach each experiment's cached list row, rebuilding the rows of
+        experiments that changed since they were cached.
+        """
+        cache_keys = {
+            experiment.id: Experiment.list_row_cache_key(experiment.id)
+            for experiment in experiments
+        }
+        cached_rows = cache.get_many(cache_keys.values())
+
+        updated_rows = {}
+        for experiment in experiments:
+            cache_key = cache_keys[experiment.id]
+            cached_row = cached_rows.get(cache_key)
+
+            if (
+                cached_row is None
+                or cached_row["latest_change"] != experiment.latest_change
+            ):
+                cached_row = {
+                    "latest_change": experiment.latest_change,
+                    "row": experiment.get_list_row(),
+                }
+                updated_rows[cache_key] = cached_row
+
+            experiment.list_row = cached_row["row"]
+
+        if updated_rows:
+            cache.set_many(
+                updated_rows, settings.EXPERIMENTS_LIST_ROW_CACHE_TIMEOUT
+            )
 
     def get_filterset_kwargs(self, *args, **kwargs):
         kwargs = super().get_filterset_kwargs(*args, **kwargs)
@@ -369,6 +381,50 @@ class ExperimentListView(FilterView):
         )
         return qs
 
+    def paginate_queryset(self, queryset, page_size):
+        # The change log aggregate is only added for the page, so counting
+        # the filtered experiments doesn't have to run it
+        self.count_queryset = queryset
+        queryset = queryset.annotate(
+            latest_change=Experiment.latest_change_expression()
+        )
+
+        # Numbered pages are still served for existing links and for
+        # search results, which are ordered by rank
+        ordering = queryset.query.order_by
+        keyset_orderings = [
+            choice for choice, _ in ExperimentOrderingForm.ORDERING_CHOICES
+        ]
+        if (
+            self.page_kwarg in self.request.GET
+            or len(ordering) != 1
+            or ordering[0] not in keyset_orderings
+        ):
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = KeysetPaginator(
+            queryset,
+            page_size,
+            count_queryset=self.count_queryset,
+            approximate_count_threshold=(
+                settings.EXPERIMENTS_APPROXIMATE_COUNT_THRESHOLD
+            ),
+        )
+        try:
+            page = paginator.page(
+                after=self.request.GET.get("after"),
+                before=self.request.GET.get("before"),
+            )
+        except InvalidCursor:
+            raise Http404("Invalid cursor")
+
+        return (paginator, page, page.object_list, page.has_other_pages())
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        return CountQuerysetPaginator(
+            queryset, per_page, count_queryset=self.count_queryset, **kwargs
+        )
+
     def get_ordering(self):
         self.ordering_form = ExperimentOrderingForm(self.request.GET)
 
@@ -378,9 +434,11 @@ class ExperimentListView(FilterView):
         return self.ordering_form.ORDERING_CHOICES[0][0]
 
     def get_context_data(self, *args, **kwargs):
-        return super().get_context_data(
+        context = super().get_context_data(
             ordering_form=self.ordering_form, *args, **kwargs
         )
+        self.set_list_rows(context["experiments"])
+        return context
 
 
 class ExperimentFormMixin(object):
@@ -452,7 +510,7 @@ class ExperimentResultsUpdateView(ExperimentFormMixin, UpdateView):
 class ExperimentDetailView(ExperimentFormMixin, ModelFormMixin, DetailView):
     model = Experiment
     form_class = ExperimentReviewForm
-    queryset = Experiment.objects.get_prefetched()
+    queryset = Experiment.objects.get_detail_prefetched()
 
     def get_template_names(self):
         return [
@@ -0,0 +1,8 @@
+from django.conf.urls import url
+
+from experimenter.notifications.api_views import NotificationListView
+
+
+urlpatterns = [
+    url(r"^$", NotificationListView.as_view(), name="notifications-api-list")
+]
@@ -0,0 +1,26 @@
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from experimenter.notifications.serializers import NotificationSerializer
+
+
+class NotificationListView(APIView):
+    """
+    GET returns the request user's unread count for the notification
+    badge, POST returns their unread notifications and marks them read.
+    """
+
+    def get(self, request, *args, **kwargs):
+        return Response(
+            {"unread_count": request.user.notifications.get_unread_count()}
+        )
+
+    def post(self, request, *args, **kwargs):
+        notifications = request.user.notifications.get_unread()
+        return Response(
+            {
+                "notifications": NotificationSerializer(
+                    notifications, many=True
+                ).data
+            }
+        )
@@ -4,14 +4,18 @@ from django.db import models
 
 class NotificationManager(models.Manager):
 
+    def get_unread_count(self):
+        return self.filter(read=False).count()
+
     @property
     def has_unread(self):
-        return self.filter(read=False).count() > 0
+        return self.filter(read=False).exists()
 
     def get_unread(self):
         unread = list(self.filter(read=False))
 
-        self.update(read=True)
+        if unread:
+            self.filter(pk__in=[n.pk for n in unread]).update(read=True)
 
         return unread
 
@@ -0,0 +1,10 @@
+from rest_framework import serializers
+
+from experimenter.notifications.models import Notification
+
+
+class NotificationSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = Notification
+        fields = ("id", "created_on", "message")
@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.test import TestCase
+from django.urls import reverse
+
+from experimenter.notifications.tests.factories import NotificationFactory
+from experimenter.openidc.tests.factories import UserFactory
+
+
+class TestNotificationListView(TestCase):
+
+    def setUp(self):
+        self.user = UserFactory.create()
+
+    def test_get_returns_unread_count(self):
+        NotificationFactory.create(user=self.user, read=False)
+        NotificationFactory.create(user=self.user, read=False)
+        NotificationFactory.create(user=self.user, read=True)
+        NotificationFactory.create(read=False)
+
+        response = self.client.get(
+            reverse("notifications-api-list"),
+            **{settings.OPENIDC_EMAIL_HEADER: self.user.email},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"unread_count": 2})
+
+    def test_post_returns_unread_and_marks_them_read(self):
+        unread = NotificationFactory.create(user=self.user, read=False)
+        NotificationFactory.create(user=self.user, read=True)
+
+        response = self.client.post(
+            reverse("notifications-api-list"),
+            **{settings.OPENIDC_EMAIL_HEADER: self.user.email},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [n["message"] for n in response.json()["notifications"]],
+            [unread.message],
+        )
+        self.assertFalse(self.user.notifications.has_unread)
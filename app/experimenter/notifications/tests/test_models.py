@@ -1,6 +1,7 @@
 from django.test import TestCase
 
 from experimenter.openidc.tests.factories import UserFactory
+from experimenter.notifications.models import Notification
 from experimenter.notifications.tests.factories import NotificationFactory
 
 
@@ -63,3 +64,43 @@ class TestNotificationModel(TestCase):
             set(user2.notifications.get_unread()), set(user2_notifications)
         )
         self.assertEqual(set(user2.notifications.get_unread()), set([]))
+
+
+class TestNotificationUnreadCount(TestCase):
+
+    def test_unread_count_counts_unread_notifications(self):
+        user = UserFactory.create()
+        NotificationFactory.create(user=user, read=False)
+        NotificationFactory.create(user=user, read=True)
+        NotificationFactory.create(read=False)
+
+        self.assertEqual(user.notifications.get_unread_count(), 1)
+
+    def test_unread_count_sees_notifications_created_elsewhere(self):
+        user = UserFactory.create()
+        self.assertEqual(user.notifications.get_unread_count(), 0)
+
+        # Most notifications are created by Celery workers
+        Notification.objects.create(user=user, message="Hello")
+
+        self.assertEqual(user.notifications.get_unread_count(), 1)
+        self.assertTrue(user.notifications.has_unread)
+
+    def test_get_unread_resets_count(self):
+        user = UserFactory.create()
+        NotificationFactory.create(user=user, read=False)
+        self.assertEqual(user.notifications.get_unread_count(), 1)
+
+        user.notifications.get_unread()
+
+        self.assertEqual(user.notifications.get_unread_count(), 0)
+        self.assertFalse(user.notifications.has_unread)
+
+    def test_has_unread_uses_exists(self):
+        user = UserFactory.create()
+        NotificationFactory.create(user=user, read=False)
+
+        with self.assertNumQueries(1) as queries:
+            self.assertTrue(user.notifications.has_unread)
+
+        self.assertNotIn("COUNT", queries.captured_queries[0]["sql"])
@@ -0,0 +1,81 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+class UserCache(object):
+    """
+    Maps the OpenIDC email header, which is the username, to its user so
+    authenticated requests can skip the user lookup.
+
+    Users are kept in a small in-process LRU in front of the shared Django
+    cache. Entries are dropped from both when the user changes, and expire
+    after OPENIDC_USER_CACHE_TIMEOUT seconds so other processes' LRUs do
+    not serve a changed user for long.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users = OrderedDict()
+
+    @staticmethod
+    def cache_key(username):
+        return "openidc.user.{username}".format(username=username)
+
+    def get(self, username):
+        now = time.monotonic()
+
+        with self.lock:
+            entry = self.users.get(username)
+            if entry is not None:
+                user, expires = entry
+                if expires > now:
+                    self.users.move_to_end(username)
+                    return copy.deepcopy(user)
+                del self.users[username]
+
+        user = cache.get(self.cache_key(username))
+        if user is not None:
+            self._remember(username, user, now)
+            return copy.deepcopy(user)
+
+    def set(self, user):
+        # Only cache users once they are committed, a user created in a
+        # transaction that is rolled back must not be served later.
+        transaction.on_commit(lambda: self._set(user))
+
+    def _set(self, user):
+        cache.set(
+            self.cache_key(user.username),
+            user,
+            settings.OPENIDC_USER_CACHE_TIMEOUT,
+        )
+        self._remember(user.username, copy.deepcopy(user), time.monotonic())
+
+    def _remember(self, username, user, now):
+        with self.lock:
+            self.users[username] = (
+                user,
+                now + settings.OPENIDC_USER_CACHE_TIMEOUT,
+            )
+            self.users.move_to_end(username)
+            while len(self.users) > settings.OPENIDC_USER_CACHE_SIZE:
+                self.users.popitem(last=False)
+
+    def invalidate(self, username):
+        with self.lock:
+            self.users.pop(username, None)
+
+        cache.delete(self.cache_key(username))
+
+    def clear(self):
+        with self.lock:
+            self.users.clear()
+
+
+user_cache = UserCache()
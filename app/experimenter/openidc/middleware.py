@@ -1,9 +1,13 @@
+from functools import lru_cache
+
 from django.urls import resolve, Resolver404
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.http import HttpResponse
 from rest_framework.authentication import SessionAuthentication
 
+from experimenter.openidc.cache import user_cache
+
 
 class OpenIDCAuthMiddleware(object):
     """
@@ -18,25 +22,21 @@ class OpenIDCAuthMiddleware(object):
     def __init__(self, get_response):
         self.get_response = get_response
         self.User = get_user_model()
+        self.resolve_url_name = lru_cache(
+            maxsize=settings.OPENIDC_RESOLVE_CACHE_SIZE
+        )(self._resolve_url_name)
 
-    def __call__(self, request):
+    @staticmethod
+    def _resolve_url_name(path):
         try:
-            resolved = resolve(request.path)
-            if resolved.url_name in settings.OPENIDC_AUTH_WHITELIST:
-                # If the requested path is in our auth whitelist,
-                # skip authentication entirely
-                return self.get_response(request)
+            return resolve(path).url_name
         except Resolver404:
-            pass
+            return None
 
-        openidc_email = request.META.get(settings.OPENIDC_EMAIL_HEADER, None)
-
-        if openidc_email is None:
-            # If a user has bypassed the OpenIDC flow entirely and no header
-            # is set then we reject the request entirely
-            return HttpResponse(
-                "Please login using OpenID Connect", status=401
-            )
+    def get_user(self, openidc_email):
+        user = user_cache.get(openidc_email)
+        if user is not None:
+            return user
 
         try:
             user = self.User.objects.get(username=openidc_email)
@@ -47,6 +47,28 @@ class OpenIDCAuthMiddleware(object):
                 user.is_staff = True
             user.save()
 
+        user_cache.set(user)
+        return user
+
+    def __call__(self, request):
+        # Paths resolve to the same view on every request, so only the
+        # first request to a path pays for resolve()
+        url_name = self.resolve_url_name(request.path)
+        if url_name in settings.OPENIDC_AUTH_WHITELIST:
+            # If the requested path is in our auth whitelist,
+            # skip authentication entirely
+            return self.get_response(request)
+
+        openidc_email = request.META.get(settings.OPENIDC_EMAIL_HEADER, None)
+
+        if openidc_email is None:
+            # If a user has bypassed the OpenIDC flow entirely and no header
+            # is set then we reject the request entirely
+            return HttpResponse(
+                "Please login using OpenID Connect", status=401
+            )
+
+        user = self.get_user(openidc_email)
         request.user = user
 
         return self.get_response(request)
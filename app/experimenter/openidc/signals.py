@@ -0,0 +1,30 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from experimenter.openidc.cache import user_cache
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    user_cache.invalidate(instance.username)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def invalidate_cached_user_permissions(sender, instance, action, **kwargs):
+    if not action.startswith("post_"):
+        return
+
+    if isinstance(instance, User):
+        users = [instance]
+    else:
+        # Changed from the group or permission side, pk_set holds the
+        # affected users
+        users = User.objects.filter(pk__in=kwargs.get("pk_set") or ())
+
+    for user in users:
+        user_cache.invalidate(user.username)
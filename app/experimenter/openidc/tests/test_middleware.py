@@ -1,11 +1,14 @@
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.urls import Resolver404
 from django.test import TestCase
 
 import mock
 
+from experimenter.openidc.cache import user_cache
 from experimenter.openidc.middleware import OpenIDCAuthMiddleware
+from experimenter.openidc.tests.factories import UserFactory
 
 
 class OpenIDCAuthMiddlewareTests(TestCase):
@@ -117,3 +120,91 @@ class OpenIDCAuthMiddlewareTests(TestCase):
         self.assertEqual(request.user.email, dev_email)
         self.assertFalse(request.user.is_staff)
         self.assertFalse(request.user.is_superuser)
+
+
+class OpenIDCAuthMiddlewareCacheTests(TestCase):
+
+    def setUp(self):
+        self.response = "Response"
+        self.middleware = OpenIDCAuthMiddleware(lambda request: self.response)
+
+        mock_resolve_patcher = mock.patch(
+            "experimenter.openidc.middleware.resolve"
+        )
+        self.mock_resolve = mock_resolve_patcher.start()
+        self.addCleanup(mock_resolve_patcher.stop)
+
+        # Run on commit callbacks immediately, the test transaction is
+        # never committed
+        mock_on_commit_patcher = mock.patch(
+            "experimenter.openidc.cache.transaction.on_commit",
+            side_effect=lambda func: func(),
+        )
+        mock_on_commit_patcher.start()
+        self.addCleanup(mock_on_commit_patcher.stop)
+
+        cache.clear()
+        user_cache.clear()
+        self.addCleanup(user_cache.clear)
+
+    def make_request(self, email):
+        request = mock.Mock()
+        request.path = "/experiments/"
+        request.META = {settings.OPENIDC_EMAIL_HEADER: email}
+        return request
+
+    def test_cached_user_skips_user_query(self):
+        user = UserFactory.create()
+
+        self.middleware(self.make_request(user.email))
+
+        request = self.make_request(user.email)
+        with self.assertNumQueries(0):
+            self.middleware(request)
+
+        self.assertEqual(request.user, user)
+
+    def test_shared_cache_used_when_process_cache_is_empty(self):
+        user = UserFactory.create()
+
+        self.middleware(self.make_request(user.email))
+        user_cache.clear()
+
+        request = self.make_request(user.email)
+        with self.assertNumQueries(0):
+            self.middleware(request)
+
+        self.assertEqual(request.user, user)
+
+    def test_saving_user_invalidates_cache(self):
+        user = UserFactory.create()
+
+        self.middleware(self.make_request(user.email))
+
+        user.is_staff = True
+        user.save()
+
+        request = self.make_request(user.email)
+        self.middleware(request)
+
+        self.assertTrue(request.user.is_staff)
+
+    def test_expired_user_is_looked_up_again(self):
+        user = UserFactory.create()
+
+        with self.settings(OPENIDC_USER_CACHE_TIMEOUT=0):
+            self.middleware(self.make_request(user.email))
+
+            request = self.make_request(user.email)
+            with self.assertNumQueries(1):
+                self.middleware(request)
+
+        self.assertEqual(request.user, user)
+
+    def test_path_resolved_once(self):
+        user = UserFactory.create()
+
+        self.middleware(self.make_request(user.email))
+        self.middleware(self.make_request(user.email))
+
+        self.mock_resolve.assert_called_once_with("/experiments/")
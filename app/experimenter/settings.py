@@ -132,6 +132,17 @@ AUTH_PASSWORD_VALIDATORS = [
 
 OPENIDC_EMAIL_HEADER = config("OPENIDC_HEADER")
 OPENIDC_AUTH_WHITELIST = ("experiments-api-list", "experiments-api-recipe")
+# Users looked up from the OpenIDC header are cached for this many seconds
+OPENIDC_USER_CACHE_TIMEOUT = config(
+    "OPENIDC_USER_CACHE_TIMEOUT", default=300, cast=int
+)
+# Number of users and resolved paths each process keeps in memory
+OPENIDC_USER_CACHE_SIZE = config(
+    "OPENIDC_USER_CACHE_SIZE", default=1000, cast=int
+)
+OPENIDC_RESOLVE_CACHE_SIZE = config(
+    "OPENIDC_RESOLVE_CACHE_SIZE", default=1000, cast=int
+)
 
 
 # Internationalization
@@ -234,6 +245,24 @@ EXPERIMENTS_PAGINATE_BY = config(
     "EXPERIMENTS_PAGINATE_BY", default=10, cast=int
 )
 
+# Most owners returned per owner autocomplete search
+EXPERIMENTS_OWNER_AUTOCOMPLETE_LIMIT = config(
+    "EXPERIMENTS_OWNER_AUTOCOMPLETE_LIMIT", default=20, cast=int
+)
+
+# Seconds before changed_since that the experiment list API also returns,
+# so changes committed after a poll with an earlier changed_on are not
+# missed by the next one
+EXPERIMENTS_CHANGED_SINCE_OVERLAP = config(
+    "EXPERIMENTS_CHANGED_SINCE_OVERLAP", default=300, cast=int
+)
+
+# Above this many estimated experiments the list page shows the
+# planner's estimate instead of counting them
+EXPERIMENTS_APPROXIMATE_COUNT_THRESHOLD = config(
+    "EXPERIMENTS_APPROXIMATE_COUNT_THRESHOLD", default=10000, cast=int
+)
+
 USE_GOOGLE_ANALYTICS = config("USE_GOOGLE_ANALYTICS", default=True, cast=bool)
 
 # Automated email destinations
@@ -285,6 +314,13 @@ BUGZILLA_COMMENT_URL = "{path}?api_key={api_key}".format(
     api_key=BUGZILLA_API_KEY,
 )
 
+# Outbound HTTP clients (Normandy and Bugzilla)
+HTTP_POOL_SIZE = config("HTTP_POOL_SIZE", default=10, cast=int)
+HTTP_CONNECT_TIMEOUT = config("HTTP_CONNECT_TIMEOUT", default=3.05, cast=float)
+HTTP_READ_TIMEOUT = config("HTTP_READ_TIMEOUT", default=30, cast=float)
+HTTP_MAX_RETRIES = config("HTTP_MAX_RETRIES", default=3, cast=int)
+HTTP_RETRY_BACKOFF = config("HTTP_RETRY_BACKOFF", default=0.5, cast=float)
+
 REDIS_HOST = config("REDIS_HOST")
 REDIS_PORT = config("REDIS_PORT")
 REDIS_DB = config("REDIS_DB")
@@ -303,6 +339,34 @@ CELERY_BEAT_SCHEDULE = {
 # Normandy Configuration
 NORMANDY_SLUG_MAX_LEN = 80
 
+# Number of Normandy recipes fetched in parallel by update_experiment_info
+NORMANDY_FETCH_CONCURRENCY = config(
+    "NORMANDY_FETCH_CONCURRENCY", default=8, cast=int
+)
+
+# Caching
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND",
+            default="django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": config("CACHE_LOCATION", default="experimenter"),
+    }
+}
+
+# Seconds a rendered recipe is served from the cache before being rebuilt
+RECIPE_CACHE_TIMEOUT = config("RECIPE_CACHE_TIMEOUT", default=300, cast=int)
+
+# Seconds a process serves its copy of the locales and countries before
+# checking whether another process has changed them
+SNAPSHOT_VERSION_TTL = config("SNAPSHOT_VERSION_TTL", default=10, cast=int)
+
+# Seconds an experiment's list page row is cached between changes
+EXPERIMENTS_LIST_ROW_CACHE_TIMEOUT = config(
+    "EXPERIMENTS_LIST_ROW_CACHE_TIMEOUT", default=3600, cast=int
+)
+
 # Monitoring
 MONITORING_URL = (
     "https://grafana.telemetry.mozilla.org/d/3QA87kliz/"
@@ -340,6 +404,12 @@ DELIVERY_CONSOLE_EXPERIMENT_IMPORT_URL = urljoin(
 )
 NORMANDY_API_HOST = config("NORMANDY_API_HOST")
 NORMANDY_API_RECIPE_URL = urljoin(NORMANDY_API_HOST, "/api/v3/recipe/{id}/")
+NORMANDY_API_RECIPE_LIST_URL = urljoin(NORMANDY_API_HOST, "/api/v3/recipe/")
+NORMANDY_API_RECIPE_LIST_PAGE_SIZE = config(
+    "NORMANDY_API_RECIPE_LIST_PAGE_SIZE", default=100, cast=int
+)
+# Fetch recipes by paging through the recipe list instead of one per id
+NORMANDY_BULK_FETCH = config("NORMANDY_BULK_FETCH", default=False, cast=bool)
 
 # Jira URL
 JIRA_URL = config(
@@ -14,10 +14,12 @@ jQuery(function($) {
     const resp = await fetch(sendUrl, {
       method: "PUT",
     });
-    if (resp.status == 200) {
-      // Rather than trying to update the DOM to match the new state,
-      // just refresh the page.
-      location.reload();
+    if (resp.status == 202) {
+      // The email is sent by a worker, which checks the sign-off once it
+      // has gone out, so a reload now would still show it unchecked.
+      this.innerHTML = "Queued";
+      modal.find(".sending-queued").removeClass("d-none");
+      $("button.send-intent-to-ship").prop("disabled", true);
     } else {
       modal.find(".sending-failed").toggleClass("d-none");
     }
@@ -0,0 +1,47 @@
+// Load unread notifications after the page renders, rather than
+// looking them up while rendering every page
+jQuery(function($) {
+  const container = $("#notifications");
+  const url = container.data("url");
+
+  if (!url) {
+    return;
+  }
+
+  const loadNotifications = async function() {
+    const countResp = await fetch(url, { credentials: "same-origin" });
+    if (countResp.status != 200) {
+      return;
+    }
+
+    const { unread_count } = await countResp.json();
+    if (!unread_count) {
+      return;
+    }
+
+    // Reading the notifications marks them as read
+    const resp = await fetch(url, {
+      method: "POST",
+      credentials: "same-origin",
+    });
+    if (resp.status != 200) {
+      return;
+    }
+
+    const { notifications } = await resp.json();
+    const messages = container.find(".notification-messages");
+    for (const notification of notifications) {
+      // Messages are trusted HTML created by experimenter itself
+      $("<p>")
+        .append('<span class="fas fa-info-circle"></span> ')
+        .append(notification.message)
+        .appendTo(messages);
+    }
+
+    if (notifications.length) {
+      container.removeClass("d-none");
+    }
+  };
+
+  loadNotifications();
+});
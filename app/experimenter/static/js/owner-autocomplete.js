@@ -0,0 +1,48 @@
+// Owners are searched for as the user types, rather than every user
+// being rendered into the page as an option
+jQuery(function($) {
+  $("select[data-autocomplete-url]").each(function() {
+    const select = $(this);
+    const url = select.data("autocomplete-url");
+    const separator = url.includes("?") ? "&" : "?";
+    let latestSearch = null;
+    let searchTimeout = null;
+
+    const search = async function(value) {
+      latestSearch = value;
+      const resp = await fetch(
+        `${url}${separator}search=${encodeURIComponent(value)}`,
+        { credentials: "same-origin" },
+      );
+      if (resp.status != 200 || value !== latestSearch) {
+        return;
+      }
+
+      const owners = await resp.json();
+
+      // Keep the empty and selected options, replace the rest
+      select
+        .find("option")
+        .not(":selected")
+        .not('[value=""]')
+        .remove();
+      for (const owner of owners) {
+        if (!select.find(`option[value="${owner.id}"]`).length) {
+          $("<option>")
+            .val(owner.id)
+            .text(owner.email)
+            .appendTo(select);
+        }
+      }
+
+      select.selectpicker("refresh");
+    };
+
+    select.selectpicker({ liveSearch: true });
+    select.parent().on("input", ".bs-searchbox input", function() {
+      const value = $(this).val();
+      clearTimeout(searchTimeout);
+      searchTimeout = setTimeout(() => search(value), 250);
+    });
+  });
+});
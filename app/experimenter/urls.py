@@ -10,6 +10,10 @@ urlpatterns = [
     re_path(
         r"^api/v1/experiments/", include("experimenter.experiments.api_urls")
     ),
+    re_path(
+        r"^api/v1/notifications/",
+        include("experimenter.notifications.api_urls"),
+    ),
     re_path(r"^admin/", admin.site.urls),
     re_path(r"^experiments/", include("experimenter.experiments.web_urls")),
     re_path(r"^$", ExperimentListView.as_view(), name="home"),